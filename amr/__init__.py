@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 """Mesh refinement tools.
 """
-from .amr_ import getunit, AMRUnit
+from .amr_ import getunit, getadapter, AMRUnit
 from .trifronts import TriFront
 from .meshgluer import join_meshes
\ No newline at end of file
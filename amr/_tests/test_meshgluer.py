@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""Tests the meshes joiner.
+"""
+import unittest
+import numpy as np
+from triellipt import mesher, amr
+from triellipt.amr import meshgluer
+
+
+def get_tile(i, j, refine=False):
+
+    mesh = mesher.trigrid(5, 5, 'west-slope') / 4 + complex(i, j)
+
+    if refine:
+        return amr.getunit(mesh).refine().mesh.twin()
+    return mesh
+
+
+class TestGluer(unittest.TestCase):
+
+    def test_two(self):
+
+        mesh = meshgluer.join_meshes(get_tile(0, 0), get_tile(1, 0))
+
+        assert mesh.ntriangs == 64
+        assert mesh.npoints == 45
+
+    def test_tiles(self):
+        """Joins the tiles with hanging nodes on the shared edges.
+        """
+
+        tiles = [
+            get_tile(i, j, refine=(i + j) % 2 == 0)
+            for i in range(3) for j in range(3)
+        ]
+
+        mesh = meshgluer.join_meshes(*tiles)
+
+        assert not mesh.hasghosts()
+        assert mesh.ntriangs == 5 * 128 + 4 * 32 + 12 * 4
+        assert mesh.getvoids().size == 12 * 4
+
+        east, west, pivot = mesh.triangs[mesh.getvoids()].T
+
+        assert np.allclose(
+            mesh.points[pivot], 0.5 * (mesh.points[east] + mesh.points[west])
+        )
+
+    def test_failed(self):
+        assert meshgluer.join_meshes(get_tile(0, 0), get_tile(2, 2)) is None
+
+
+if __name__ == '__main__':
+    unittest.main()
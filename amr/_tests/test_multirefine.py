@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""Tests the multi-level refinement.
+"""
+import unittest
+import numpy as np
+from triellipt import mesher, amr
+from triellipt.fem import femoprs, skeleton
+from triellipt.amr import multirefine, trirefine
+
+
+def triangs_keys(mesh):
+    return {
+        tuple(verts) for verts in np.sort(mesh.points[mesh.triangs]).tolist()
+    }
+
+
+class TestWholeMesh(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.MESH = mesher.trigrid(5, 5, 'west-slope')
+        cls.NEW_MESH = multirefine.refine_mesh(
+            cls.MESH, np.arange(cls.MESH.ntriangs), 2
+        )
+
+    def test_sizes(self):
+        assert self.NEW_MESH.ntriangs == 16 * self.MESH.ntriangs
+        assert self.NEW_MESH.npoints == 17**2
+
+    def test_voids(self):
+        assert not self.NEW_MESH.hasvoids()
+
+    def test_areas(self):
+        assert np.isclose(
+            np.sum(femoprs.mesh_geom(self.NEW_MESH).areas),
+            np.sum(femoprs.mesh_geom(self.MESH).areas)
+        )
+
+
+class TestRegion(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.MESH = mesher.trigrid(11, 11, 'west-slope') / 10
+
+        cls.TRINUMS = np.flatnonzero(
+            abs(cls.MESH.centrs_complex - (0.5 + 0.5j)) < 0.3
+        )
+
+    def test_depth_one(self):
+
+        mesh1 = trirefine.refine_mesh(self.MESH, self.TRINUMS)
+        mesh2 = multirefine.refine_mesh(self.MESH, self.TRINUMS, 1)
+
+        assert mesh1.ntriangs == mesh2.ntriangs
+        assert triangs_keys(mesh1) == triangs_keys(mesh2)
+
+    def test_skeleton(self):
+        for depth in [2, 3]:
+
+            mesh = self.refine(depth)
+
+            assert not mesh.hasghosts()
+            assert np.unique(mesh.points).size == mesh.npoints
+
+            skel = skeleton.getskeleton(mesh)
+            assert skel.voidsmap.trinums.size == 4 * mesh.getvoids().size
+
+    def test_data(self):
+
+        mesh = self.refine(3)
+
+        xnew, ynew = mesh.points2d
+        xold, yold = self.MESH.points2d
+
+        assert np.allclose(
+            mesh.meta['data-refiner'](2 * xold - yold), 2 * xnew - ynew
+        )
+
+    def test_midpoints(self):
+        """Points are the same as for the repeated refinement.
+        """
+
+        unit = amr.getunit(self.MESH).refine().refine()
+
+        assert set(self.refine(2).points).issubset(unit.mesh.points)
+
+    def refine(self, depth):
+        return multirefine.refine_mesh(self.MESH, self.TRINUMS, depth)
+
+
+class TestDepth(unittest.TestCase):
+    """Targets get the full depth, the buffer around them is graded.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.MESH = mesher.trigrid(11, 11, 'west-slope') / 10
+
+    def test_single(self):
+        self.check_depths([100])
+
+    def test_group(self):
+        self.check_depths([100, 101, 120])
+
+    def check_depths(self, trinums):
+
+        for depth in [2, 3]:
+
+            mesh = multirefine.refine_mesh(self.MESH, trinums, depth)
+            levels = mesh.meta['amr-tree'].levels
+
+            inner = np.ones(mesh.ntriangs, dtype=bool)
+            inner[mesh.getvoids()] = False
+
+            for trinum in trinums:
+
+                mask = inner & is_inside(
+                    self.MESH.points[self.MESH.triangs[trinum]],
+                    mesh.centrs_complex
+                )
+
+                assert np.count_nonzero(mask) == 4**depth
+                assert np.all(levels[mask] == depth)
+
+            skel = skeleton.getskeleton(mesh)
+            assert skel.voidsmap.trinums.size == 4 * mesh.getvoids().size
+
+
+def is_inside(verts, points):
+
+    sides = np.roll(verts, -1) - verts
+
+    return np.all(
+        np.imag(np.conj(sides[:, None]) * (points - verts[:, None])) > 0,
+        axis=0
+    )
+
+
+class TestUnit(unittest.TestCase):
+
+    def test_refine(self):
+
+        unit = amr.getunit(mesher.trigrid(5, 5, 'west-slope'))
+        unit = unit.with_data({'x': unit.mesh.points.real})
+
+        new_unit = unit.refine(depth=3)
+
+        assert new_unit.mesh.ntriangs == 64 * unit.mesh.ntriangs
+        assert np.allclose(new_unit.data['x'], new_unit.mesh.points.real)
+
+
+if __name__ == '__main__':
+    unittest.main()
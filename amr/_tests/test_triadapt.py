@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""Tests the adaptation driver.
+"""
+import unittest
+import numpy as np
+from triellipt import mesher, amr, trimesh
+from triellipt.amr import triadapt
+
+
+class TestMarking(unittest.TestCase):
+
+    ERRORS = np.array([1., 4., 2., 0., 3.])
+
+    def test_dorfler(self):
+        assert triadapt.mark_refine(self.ERRORS, 0.6).tolist() == [1, 4]
+        assert triadapt.mark_refine(self.ERRORS, 1.0).tolist() == [
+            0, 1, 2, 4
+        ]
+
+    def test_maximum(self):
+        assert triadapt.mark_refine(
+            self.ERRORS, 0.6, 'maximum'
+        ).tolist() == [1, 4]
+
+    def test_zeros(self):
+        assert triadapt.mark_refine(np.zeros(3), 0.5).size == 0
+
+    def test_unknown(self):
+        with self.assertRaises(triadapt.TriAdaptError):
+            triadapt.mark_refine(self.ERRORS, 0.5, 'random')
+
+    def test_overlaps(self):
+
+        supbodies = np.array(
+            [[0, 1, 2, 3], [3, 4, 5, 6], [6, 7, 8, 9]]
+        )
+
+        inds = triadapt._drop_overlaps(
+            supbodies, np.array([2., 1., 3.]), np.arange(3)
+        )
+
+        assert inds.tolist() == [1]
+
+    def test_triangs_keys(self):
+        """Tells apart triangles with the same centroid.
+        """
+
+        mesh = trimesh.TriMesh(
+            np.array([0., 3., 3j, 1., 2.]), np.array([[0, 1, 2], [3, 4, 2]])
+        )
+
+        keys = triadapt._triangs_keys(mesh)[[0]]
+
+        assert triadapt._find_triangs(mesh, keys).tolist() == [0]
+
+        mesh = mesh.update_triangs(mesh.triangs[[1, 0], ::-1])
+        assert triadapt._find_triangs(mesh, keys).tolist() == [1]
+
+
+class TestAdapter(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.SHIFT = [0.]
+
+        cls.ADAPTER = amr.getadapter(
+            'u', cls.solver
+        ).with_refining(0.5).with_coarsening(0.05)
+
+        cls.UNIT = cls.ADAPTER.run(
+            amr.getunit(mesher.trigrid(21, 21, 'west-slope') / 20), 4
+        )
+
+    @classmethod
+    def solver(cls, unit):
+
+        cls.SHIFT[0] += 0.1
+
+        return {
+            'u': unit.from_func(
+                lambda x, y: np.tanh(20 * (x + y - 0.8 - cls.SHIFT[0]))
+            )
+        }
+
+    def test_history(self):
+
+        history = self.ADAPTER.history
+
+        assert len(history) == 4
+        assert history[0]['ntriangs'] == 800
+        assert history[0]['nrefined'] > 0
+
+        assert set(history[0]['times']) == {
+            'solve', 'estimate', 'mark', 'coarsen', 'refine'
+        }
+
+    def test_coarsened(self):
+        assert sum(r['ncoarsened'] for r in self.ADAPTER.history) > 0
+
+    def test_data(self):
+        assert self.UNIT.data['u'].size == self.UNIT.mesh.npoints
+
+    def test_tolerance(self):
+
+        adapter = amr.getadapter('u').with_limits(tol=np.inf)
+        unit = amr.getunit(self.UNIT.mesh).with_data(self.UNIT.data)
+
+        assert adapter.run(unit, 3) is unit
+        assert len(adapter.history) == 1
+
+    def test_no_data(self):
+        with self.assertRaises(triadapt.TriAdaptError):
+            amr.getadapter('v').run(amr.getunit(self.UNIT.mesh), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""Tests the error estimators.
+"""
+import unittest
+import numpy as np
+from triellipt import mesher, amr
+from triellipt.amr import triestim
+
+
+class TestEstimators(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+
+        mesh = mesher.trigrid(9, 9, 'west-slope') / 8
+        unit = amr.getunit(mesh)
+
+        cls.MESH = unit.refine(
+            unit.find_masked(lambda x, y: x < 0.5)
+        ).mesh
+
+    def test_linear(self):
+        for kind in triestim.ESTIMATORS:
+            assert self.estimate(kind, lambda x, y: 2 * x - y).max() < 1e-12
+
+    def test_quadratic(self):
+        for kind in triestim.ESTIMATORS:
+            assert self.estimate(kind, lambda x, y: x**2).max() > 1e-3
+
+    def test_voids(self):
+
+        voids = self.MESH.getvoids()
+        assert voids.size > 0
+
+        for kind in triestim.ESTIMATORS:
+            assert np.all(self.estimate(kind, lambda x, y: x**2)[voids] == 0)
+
+    def test_unknown(self):
+        with self.assertRaises(triestim.TriEstimError):
+            triestim.getestim(self.MESH, 'hessian')
+
+    def estimate(self, kind, func):
+        return triestim.getestim(self.MESH, kind)(
+            func(*self.MESH.points2d)
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
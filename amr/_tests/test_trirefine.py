@@ -24,7 +24,7 @@ TEST-MESH-WITH-VOIDS:
 """
 import unittest
 import numpy as np
-from triellipt import trimesh
+from triellipt import trimesh, mesher, amr
 from triellipt.amr import trirefine
 
 
@@ -119,5 +119,92 @@ class TestWithVoids(unittest.TestCase):
         return self.REF.with_trinums(range(-10, 10))
 
 
+class TestDataRefiner(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+
+        mesh = mesher.trigrid(5, 5, 'west-slope')
+
+        cls.NEW_MESH = trirefine.refine_mesh(mesh, [0, 1, 2, 5, 6, 7])
+        cls.REF = cls.NEW_MESH.meta['data-refiner']
+
+    def test_matrix(self):
+
+        data = self.REF.mesh.points.real**2
+
+        assert np.allclose(
+            self.REF.matrix @ data,
+            np.mean(data[self.REF.nodes_images], axis=1)
+        )
+
+        assert np.allclose(self.REF.matrix.sum(axis=1), 1.)
+
+    def test_batched(self):
+
+        data = self.REF.mesh.points
+        batch = self.REF(np.vstack([data, 2. * data]).T)
+
+        assert np.allclose(batch[:, 0], self.NEW_MESH.points)
+        assert np.allclose(batch[:, 1], 2. * self.NEW_MESH.points)
+
+    def test_restrict(self):
+
+        coarse = np.cos(self.REF.mesh.points.real)
+        fine = np.sin(self.NEW_MESH.points.imag)
+
+        assert np.isclose(
+            np.dot(self.REF(coarse), fine),
+            np.dot(coarse, self.REF.restrict(fine))
+        )
+
+    def test_restrict_masses(self):
+
+        masses = np.linspace(1., 2., self.NEW_MESH.npoints)
+        fine = np.sin(self.NEW_MESH.points.imag)
+
+        assert np.allclose(
+            self.REF.restrict(np.ones_like(fine), masses), 1.
+        )
+
+        assert np.isclose(
+            np.dot(self.REF.restrict(masses), self.REF.restrict(fine, masses)),
+            np.dot(masses, fine)
+        )
+
+
+class TestConstrain(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.UNIT = amr.getunit(mesher.trigrid(5, 5, 'west-slope')).refine(
+            [0, 1, 2, 5, 6, 7]
+        )
+
+    def check(self, data):
+
+        mesh = self.UNIT.mesh
+        west, east, pivot = mesh.triangs[mesh.getvoids()].T
+
+        return np.allclose(
+            data[pivot], 0.5 * (data[west] + data[east])
+        )
+
+    def test_copy(self):
+
+        data = np.random.rand(self.UNIT.mesh.npoints)
+        copy = data.copy()
+
+        assert self.check(self.UNIT.constrain(data))
+        assert np.array_equal(data, copy)
+
+    def test_inplace(self):
+
+        data = np.random.rand(self.UNIT.mesh.npoints)
+
+        assert self.UNIT.constrain(data, out=data) is data
+        assert self.check(data)
+
+
 if __name__ == '__main__':
     unittest.main()
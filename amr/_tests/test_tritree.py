@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""Tests the refinement tree.
+"""
+import unittest
+import numpy as np
+from triellipt import mesher, amr
+from triellipt.amr import tritree, multirefine, utils_
+
+
+def levels_from_areas(mesh, tree):
+    """Levels of triangles recovered from their areas.
+    """
+
+    areas = utils_.mesh_areas(mesh)
+    solids = tree.levels >= 0
+
+    return np.rint(
+        np.log2(np.amax(areas[solids]) / areas[solids]) / 2
+    ).astype(int)
+
+
+class TestTree(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.UNIT = amr.getunit(mesher.trigrid(11, 11, 'west-slope') / 10)
+
+        cls.TRINUMS = cls.UNIT.find_masked(
+            lambda x, y: (x - 0.5)**2 + (y - 0.5)**2 < 0.1
+        )
+
+    def test_root(self):
+
+        tree = tritree.gettree(self.UNIT.mesh)
+
+        assert np.all(tree.levels == 0)
+        assert tree.nfamilies == 0
+        assert tree.candidates(self.UNIT.mesh).size == 0
+
+    def check_tree(self, unit):
+
+        tree = unit.mesh.meta['amr-tree']
+
+        assert tree.size == unit.mesh.ntriangs
+        assert tree.voids().tolist() == unit.mesh.getvoids().tolist()
+
+        assert np.array_equal(
+            np.flatnonzero(tree.hanging),
+            np.unique(unit.mesh.triangs[tree.voids(), 2])
+        )
+
+        assert np.array_equal(
+            tree.levels[tree.levels >= 0], levels_from_areas(unit.mesh, tree)
+        )
+
+    def test_refine(self):
+
+        unit = self.UNIT.refine(self.TRINUMS)
+        self.check_tree(unit)
+
+        famnums, table = unit.mesh.meta['amr-tree'].siblings()
+
+        assert famnums.size == self.TRINUMS.size
+        assert table.shape == (self.TRINUMS.size, 4)
+
+    def test_depth(self):
+
+        unit = self.UNIT.refine(self.TRINUMS, depth=3)
+        tree = unit.mesh.meta['amr-tree']
+
+        self.check_tree(unit)
+
+        assert np.amax(tree.levels) == 3
+        assert np.all(tree.famlevels < 3)
+
+    def test_sorting(self):
+
+        unit = self.UNIT.with_sorting().refine(self.TRINUMS)
+        unit = unit.refine(unit.find_masked(lambda x, y: x < 0.5))
+
+        self.check_tree(unit)
+
+    def test_unwind(self):
+        """Coarsens all candidates back to the root mesh.
+        """
+
+        unit = self.UNIT.refine(self.TRINUMS, depth=2)
+
+        for _ in range(2):
+            tree = unit.mesh.meta['amr-tree']
+            unit = unit.coarsen(tree.candidates(unit.mesh))
+            self.check_tree(unit)
+
+        tree = unit.mesh.meta['amr-tree']
+
+        assert unit.mesh.ntriangs == self.UNIT.mesh.ntriangs
+        assert np.all(tree.levels == 0)
+        assert np.all(tree.famnums == -1)
+
+
+class TestLattice(unittest.TestCase):
+
+    def test_lineage(self):
+        """Fine triangles lie inside the parents of their families.
+        """
+
+        lattice = multirefine.Lattice.from_depth(3)
+
+        verts = np.array([[0., 1., 1j]])
+        coords = lattice.coords(verts)[0][lattice.triangs]
+        centrs = np.mean(coords, axis=1)
+
+        assert lattice.nfamilies == 1 + 4 + 16
+        assert np.bincount(lattice.trifams).tolist() == 5 * [0] + 16 * [4]
+
+        parents = lattice.trifams - 5
+
+        coarse = multirefine.Lattice.from_depth(2)
+        coarse = coarse.coords(verts)[0][coarse.triangs]
+
+        for centr, verts2 in zip(centrs, coarse[parents]):
+            bary = np.linalg.solve(
+                [[1., 1., 1.], verts2.real, verts2.imag],
+                [1., centr.real, centr.imag]
+            )
+            assert np.all(bary > 0.)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""Tests the windowed coarsening.
+"""
+import unittest
+import numpy as np
+from triellipt import mesher, amr
+from triellipt.amr import tricoarsen, trirefine, multirefine, triwindow
+
+
+def triangs_keys(mesh):
+    coords = np.sort(mesh.points[mesh.triangs], axis=1)
+    return sorted(
+        np.round(coords.view(float), 9).tolist()
+    )
+
+
+class TestWindow(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+
+        unit = amr.getunit(mesher.trigrid(21, 21, 'west-slope') / 20)
+
+        cls.UNIT = unit.refine(
+            unit.find_masked(lambda x, y: (x - 0.5)**2 + (y - 0.5)**2 < 0.1),
+            depth=2
+        )
+
+        tree = cls.UNIT.mesh.meta['amr-tree']
+        cls.CORES = tree.candidates(cls.UNIT.mesh)[:10]
+
+    def test_find_window(self):
+
+        mesh = self.UNIT.mesh
+        trinums = np.array([5, 100])
+
+        nodes = np.unique(mesh.triangs[trinums])
+        ring = np.flatnonzero(np.any(np.isin(mesh.triangs, nodes), axis=1))
+
+        window = triwindow.find_window(mesh, trinums)
+
+        assert np.all(np.isin(ring, window))
+
+    def test_coarsen(self):
+
+        mesh_global = tricoarsen.coarsen_mesh(self.UNIT.mesh, self.CORES)
+        mesh_local = triwindow.coarsen_mesh(self.UNIT.mesh, self.CORES)
+
+        assert triangs_keys(mesh_local) == triangs_keys(mesh_global)
+
+    def test_collect(self):
+        """Keeps the data outside the window and the constraints.
+        """
+
+        mesh = self.UNIT.mesh
+        data = np.sin(3 * mesh.points.real) * np.cos(2 * mesh.points.imag)
+        data = self.UNIT.constrain(data)
+
+        new_mesh = triwindow.coarsen_mesh(mesh, self.CORES)
+        collector = new_mesh.meta['data-collect']
+
+        new_data = collector(data)
+
+        outer = np.ones(new_mesh.npoints, dtype=bool)
+        outer[collector.window2data] = False
+
+        assert np.array_equal(
+            new_data[outer], data[collector.root2data[outer]]
+        )
+
+        east, west, pivot = new_mesh.triangs[new_mesh.getvoids()].T
+
+        assert np.allclose(
+            new_data[pivot], 0.5 * (new_data[east] + new_data[west])
+        )
+
+    def test_tree(self):
+
+        new_mesh = triwindow.coarsen_mesh(self.UNIT.mesh, self.CORES)
+        tree = new_mesh.meta['amr-tree']
+
+        assert tree.size == new_mesh.ntriangs
+        assert tree.voids().tolist() == new_mesh.getvoids().tolist()
+
+    def test_nothing(self):
+        new_mesh = triwindow.coarsen_mesh(self.UNIT.mesh, [])
+        assert 'data-collect' not in new_mesh.meta
+
+
+class TestPool(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.UNIT = amr.getunit(mesher.trigrid(21, 21, 'west-slope') / 20)
+
+        cls.TRINUMS = cls.UNIT.find_masked(
+            lambda x, y: ((x - 0.2)**2 + (y - 0.2)**2 < 0.01) | (
+                (x - 0.8)**2 + (y - 0.7)**2 < 0.01
+            )
+        )
+
+    def test_find_groups(self):
+
+        mesh = self.UNIT.mesh
+        groups = triwindow.find_groups(mesh, self.TRINUMS[:, None], 4)
+
+        assert len(groups) == 2
+
+        nodes1, nodes2 = [
+            np.unique(mesh.triangs[window]) for window, _ in groups
+        ]
+
+        assert np.intersect1d(nodes1, nodes2).size == 0
+
+        assert np.array_equal(
+            np.sort(np.hstack([inds for _, inds in groups])),
+            np.arange(self.TRINUMS.size)
+        )
+
+    def test_refine(self):
+
+        mesh = self.UNIT.mesh
+
+        serial = trirefine.refine_mesh(mesh, self.TRINUMS)
+        pooled = triwindow.refine_mesh(mesh, self.TRINUMS, workers=2)
+
+        assert triangs_keys(pooled) == triangs_keys(serial)
+
+        data = mesh.points.real**2
+        data = pooled.meta['data-refiner'](data)
+
+        east, west, pivot = pooled.triangs[pooled.getvoids()].T
+
+        assert np.allclose(
+            data[pivot], 0.5 * (data[east] + data[west])
+        )
+
+        tree = pooled.meta['amr-tree']
+
+        assert tree.nfamilies == self.TRINUMS.size
+        assert tree.candidates(pooled).size == self.TRINUMS.size
+
+    def test_refine_depth(self):
+
+        mesh = self.UNIT.mesh
+
+        serial = multirefine.refine_mesh(mesh, self.TRINUMS, 3)
+        pooled = triwindow.refine_mesh(mesh, self.TRINUMS, 3, workers=2)
+
+        assert triangs_keys(pooled) == triangs_keys(serial)
+
+    def test_coarsen(self):
+
+        unit = self.UNIT.refine(self.TRINUMS, workers=2)
+        cores = unit.mesh.meta['amr-tree'].candidates(unit.mesh)
+
+        serial = triwindow.coarsen_mesh(unit.mesh, cores)
+        pooled = triwindow.coarsen_mesh(unit.mesh, cores, workers=2)
+
+        assert triangs_keys(pooled) == triangs_keys(self.UNIT.mesh)
+        assert triangs_keys(pooled) == triangs_keys(serial)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,9 +2,10 @@
 """AMR public tools.
 """
 import numpy as np
-from triellipt.fem import femunit, trinterp
+from triellipt.fem import femunit, femvector, trinterp
 from triellipt.amr import (
-    trirefine, tricoarsen, trinspect, trifronts
+    trirefine, tricoarsen, trinspect, trifronts, triestim, triadapt,
+    multirefine, triwindow, utils_
 )
 
 
@@ -25,6 +26,38 @@ def getunit(mesh):
     return AMRUnit.from_mesh(mesh)
 
 
+def getadapter(key, solver=None):
+    """Creates an adaptation driver.
+
+    Parameters
+    ----------
+    key : str
+        Name of the unit data to estimate errors on.
+    solver : Callable = None
+        Function `solver(unit)` returning a dict of new unit data.
+
+    Returns
+    -------
+    AMRAdapter
+        Driver of the solve-estimate-mark-refine loop.
+
+    Notes
+    -----
+
+    Settings are chained on the driver:
+
+    - `with_estimator()` sets the error estimator
+    - `with_refining()` sets the refinement marking
+    - `with_coarsening()` enables the coarsening marking
+    - `with_limits()` sets the stopping criteria
+
+    `AMRAdapter.run(unit, maxiter)` returns the adapted unit and keeps
+    the per-iteration reports, with timings, in `AMRAdapter.history`.
+
+    """
+    return triadapt.getadapter(key, solver)
+
+
 class AMRData:
     """Root of the AMR unit.
     """
@@ -42,6 +75,35 @@ class AMRData:
         self.data = data.copy()
         return self
 
+    def with_sorting(self, curve='hilbert'):
+        """Orders the adapted meshes along a space-filling curve.
+
+        Parameters
+        ----------
+        curve : str = "hilbert"
+            Curve type, "hilbert" or "morton".
+
+        Returns
+        -------
+        AMRUnit
+            Unit that sorts the mesh after each adaptation.
+
+        """
+        self.meta['sort-curve'] = curve
+        return self
+
+    def next_unit(self, mesh):
+
+        if self.sort_curve is None:
+            return self.from_mesh(mesh)
+
+        new_mesh = utils_.sort_mesh(mesh, self.sort_curve)
+        return self.from_mesh(new_mesh).with_sorting(self.sort_curve)
+
+    @property
+    def sort_curve(self):
+        return self.meta.get('sort-curve')
+
     @property
     def mesh_twin(self):
         return self.mesh.twin()
@@ -95,13 +157,17 @@ class AMRUnit(AMRData):
 
     """
 
-    def refine(self, trinums=None):
+    def refine(self, trinums=None, depth=1, workers=1):
         """Performs a static mesh refinement.
 
         Parameters
         ----------
         trinums : Iterable = None
             Numbers of triangles to refine, if None takes all triangles.
+        depth : int = 1
+            Number of refinement levels.
+        workers : int = 1
+            Number of worker processes, if None takes the CPU count.
 
         Returns
         -------
@@ -113,20 +179,31 @@ class AMRUnit(AMRData):
 
         - The `data-refiner` is included in the mesh metadata.
         - The void ears are not refined to keep the mesh 1-irregular.
+        - The new mesh is sorted, if the unit is set `with_sorting()`.
+        - For `depth > 1` the targets get all the levels, a buffer around
+        them gets levels decreasing to one outwards, and a single
+        data-refiner is made for all levels.
+        - With several workers, the targets are split into clusters with
+        non-touching windows, refined in parallel.
 
         """
 
         if trinums is None:
-            trinums = tuple(
-                range(self.mesh.size)
-            )
+            trinums = np.arange(self.mesh.size)
 
-        if len(trinums) == 0:
+        if len(trinums) == 0 or depth < 1:
             return self
 
-        new_unit = self.from_mesh(
-            trirefine.refine_mesh(self.mesh, trinums)
-        )
+        if workers != 1:
+            new_mesh = triwindow.refine_mesh(
+                self.mesh, trinums, depth, workers
+            )
+        elif depth == 1:
+            new_mesh = trirefine.refine_mesh(self.mesh, trinums)
+        else:
+            new_mesh = multirefine.refine_mesh(self.mesh, trinums, depth)
+
+        new_unit = self.next_unit(new_mesh)
 
         if not self.data:
             return new_unit
@@ -139,13 +216,18 @@ class AMRUnit(AMRData):
 
         return new_unit
 
-    def coarsen(self, trinums_cores):
+    def coarsen(self, trinums_cores, local=True, workers=1):
         """Performs a static mesh coarsening.
 
         Parameters
         ----------
         trinums_cores : Iterable
             Numbers of the super-triangle-cores to coarsen.
+        local : bool = True
+            Coarsens within windows around the targets, if True.
+        workers : int = 1
+            Number of worker processes for the local coarsening, if None
+            takes the CPU count.
 
         Returns
         -------
@@ -156,12 +238,26 @@ class AMRUnit(AMRData):
         -----
 
         - The `data-collector` is included in the mesh metadata.
+        - The new mesh is sorted, if the unit is set `with_sorting()`.
+        - The same unit is returned, if nothing is coarsened.
+        - The local coarsening scales with the coarsened region and keeps
+        the data outside the windows as is.
+        - With several workers, the targets are split into clusters with
+        non-touching windows, coarsened in parallel.
 
         """
 
-        new_unit = self.from_mesh(
-            tricoarsen.coarsen_mesh(self.mesh, trinums_cores)
-        )
+        if local:
+            new_mesh = triwindow.coarsen_mesh(
+                self.mesh, trinums_cores, workers
+            )
+        else:
+            new_mesh = tricoarsen.coarsen_mesh(self.mesh, trinums_cores)
+
+        if 'data-collect' not in new_mesh.meta:
+            return self
+
+        new_unit = self.next_unit(new_mesh)
 
         if not self.data:
             return new_unit
@@ -174,6 +270,24 @@ class AMRUnit(AMRData):
 
         return new_unit
 
+    def estimate(self, data, kind='zz'):
+        """Estimates errors of nodes-data.
+
+        Parameters
+        ----------
+        data : flat-float-array
+            Data defined on mesh nodes.
+        kind : str = "zz"
+            Estimator type, "zz" or "jump".
+
+        Returns
+        -------
+        flat-float-array
+            Error indicators of triangles, zero on voids.
+
+        """
+        return triestim.getestim(self.mesh, kind)(data)
+
     def find_node(self, anchor):
         """Finds the neighborhood of an anchor point.
 
@@ -261,21 +375,23 @@ class AMRUnit(AMRData):
             *self.mesh.points2d
         )
 
-    def constrain(self, data):
+    def constrain(self, data, out=None):
         """Constrains data on hanging nodes.
 
         Parameters
         ----------
         data : float-flat-array
             Input data defined on mesh nodes.
+        out : float-flat-array = None
+            Output array, can be the data itself.
 
         Returns
         -------
         float-flat-array
-            Constrained data.
+            Constrained data, `out` if given.
 
         """
-        return trirefine.constr_data(self.mesh, data)
+        return femvector.constr_data(self.mesh, data, out)
 
     def getinterp(self, xnodes, ynodes):
         """Creates an interpolator on a mesh.
@@ -398,8 +398,8 @@ class MakerMeshGamma(SubSupTriAgent):
 
         mesh = self.root_mesh_copy
 
-        mesh = mesh.deltriangs(
-            *self.cache['trinums-to-del']
+        mesh = mesh.deltriangs_at(
+            self.cache['trinums-to-del']
         )
 
         mesh = mesh.add_points(
@@ -1,19 +1,19 @@
 # -*- coding: utf-8 -*
-"""Joiner of two meshes.
+"""Joiner of meshes.
 """
 import numpy as np
+from scipy import sparse as sp
+from scipy.sparse import csgraph
 from triellipt.utils import pairs
 
 
-def join_meshes(mesh1, mesh2, tol=None):
-    """Join the meshes along a shared boundary, if available.
+def join_meshes(*meshes, tol=None):
+    """Joins the meshes along shared boundaries, if available.
 
     Parameters
     ----------
-    mesh1 : TriMesh
-        1-st input mesh.
-    mesh2 : TriMesh
-        2-nd input mesh.
+    *meshes : TriMesh
+        Input meshes.
     tol : int = None
         Absolute tolerance in decimal places for detecting nearby points.
 
@@ -22,20 +22,26 @@ def join_meshes(mesh1, mesh2, tol=None):
     TriMesh | None
         New mesh or None, if failed.
 
+    Notes
+    -----
+
+    - Boundary nodes of all meshes are matched in a single pass by their
+    rounded coordinates, so the cost is linear in the total size.
+    - Fails, if the meshes do not make a connected domain.
+
     """
-    return DomainsGluer(mesh1, mesh2, tol).make_new_mesh()
+    return DomainsGluer(meshes, tol).make_new_mesh()
 
 
 class DomainsGluer:
-    """Gluer of two meshes.
+    """Gluer of several meshes.
     """
 
     TOL = 9
 
-    def __init__(self, mesh1, mesh2, tol):
+    def __init__(self, meshes, tol):
 
-        self.mesh1 = mesh1
-        self.mesh2 = mesh2
+        self.meshes = list(meshes)
         self.tol = tol or self.TOL
 
         self.meta = self.fetch_meta()
@@ -43,29 +49,42 @@ class DomainsGluer:
 
     def fetch_meta(self):
         return {
-            'edge1': self.mesh1.meshedge(),
-            'edge2': self.mesh2.meshedge()
+            'edges': [mesh.meshedge() for mesh in self.meshes]
         }
 
     @property
-    def edge1(self):
-        return self.meta['edge1']
+    def edges(self):
+        return self.meta['edges']
 
     @property
-    def edge2(self):
-        return self.meta['edge2']
+    def nodes(self):
+        return np.hstack(
+            [edge.nodes_complex for edge in self.edges]
+        )
 
     @property
-    def nodes1(self):
-        return self.meta['edge1'].nodes_complex
+    def nodnums(self):
+        return np.hstack([
+            edge.nodnums1 + shift
+            for edge, shift in zip(self.edges, self.numshifts)
+        ])
+
+    @property
+    def meshnums(self):
+        return np.repeat(
+            np.arange(len(self.meshes)),
+            [edge.nodnums1.size for edge in self.edges]
+        )
 
     @property
-    def nodes2(self):
-        return self.meta['edge2'].nodes_complex
+    def numshifts(self):
+        return np.cumsum(
+            [0] + [mesh.npoints for mesh in self.meshes[:-1]]
+        )
 
     @property
-    def numshift(self):
-        return self.mesh1.npoints
+    def npoints(self):
+        return sum(mesh.npoints for mesh in self.meshes)
 
     def make_new_mesh(self):
 
@@ -86,7 +105,7 @@ class DomainsGluer:
         return VoidsAdder(mesh).make_new_mesh(pow(10, - self.TOL))
 
     def push_mesh(self, data):
-        return self.mesh1.from_data(
+        return self.meshes[0].from_data(
             data['points'], data['triangs']
         )
 
@@ -98,7 +117,7 @@ class DomainsGluer:
 
     def make_new_points(self):
         return np.hstack(
-            [self.mesh1.points, self.mesh2.points]
+            [mesh.points for mesh in self.meshes]
         )
 
     def make_new_triangs(self):
@@ -111,45 +130,46 @@ class DomainsGluer:
         )
 
     def make_triangs_long(self):
-        return np.vstack(
-            [self.mesh1.triangs, self.mesh2.triangs + self.numshift]
-        )
+        return np.vstack([
+            mesh.triangs + shift
+            for mesh, shift in zip(self.meshes, self.numshifts)
+        ])
 
     def make_reconnector(self):
 
-        indrange = self.make_range()
-        i_1, i_2 = self.take_twins()
+        indrange = np.arange(self.npoints)
+        nodnums, twins = self.take_twins()
 
-        indrange[i_1] = i_2 + self.numshift
+        indrange[nodnums] = twins
         return indrange
 
-    def make_range(self):
-        return np.hstack([
-            np.arange(self.mesh1.npoints),
-            np.arange(self.mesh2.npoints) + self.numshift
-        ])
-
     def take_twins(self):
         return self.cache['twins']
 
     def find_twins(self):
+        """Maps the boundary nodes to their first twins.
+        """
+
+        nodnums = self.nodnums
+        meshnums = self.meshnums
+
+        _, firsts, inverse = np.unique(
+            self.nodes.round(self.tol), return_index=True, return_inverse=True
+        )
 
-        nodes1 = self.nodes1.round(self.tol)
-        nodes2 = self.nodes2.round(self.tol)
+        twins = nodnums[firsts][inverse]
 
-        out, i_1, i_2 = np.intersect1d(
-            nodes1, nodes2, return_indices=True
+        links = sp.coo_array(
+            (np.ones(nodnums.size), (meshnums, meshnums[firsts][inverse])),
+            shape=(len(self.meshes),) * 2
         )
 
-        state = out.size > 0
+        ndomains, _ = csgraph.connected_components(links, directed=False)
 
-        twins = [
-            self.edge1.nodnums1[i_1],
-            self.edge2.nodnums1[i_2]
-        ]
+        state = ndomains == 1
 
         self.cache = {
-            'twins': twins,
+            'twins': [nodnums, twins],
             'state': state
         }
 
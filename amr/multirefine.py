@@ -0,0 +1,717 @@
+# -*- coding: utf-8 -*-
+"""Multi-level mesh refinement.
+"""
+import numpy as np
+from triellipt.amr import trirefine, tritree
+
+LATTICE_LINEAGE = {
+    'up': {
+        (0, 0): ('up', 1), (1, 0): ('up', 2),
+        (0, 1): ('up', 3), (1, 1): ('down', 0)
+    },
+    'down': {
+        (0, 0): ('up', 0), (1, 0): ('down', 1),
+        (1, 1): ('down', 2), (0, 1): ('down', 3)
+    }
+}
+
+
+def refine_mesh(mesh, trinums, depth):
+    _ = get_refiner(mesh, trinums, depth)
+    return _.release_mesh()
+
+
+def get_refiner(mesh, trinums, depth):
+    return MultiRefiner.from_mesh(mesh).with_trinums(trinums, depth)
+
+
+class MultiRefiner(trirefine.MeshAgent):
+    """Refines the target triangles by several levels in one pass.
+
+    Notes
+    -----
+
+    - Targets get the full depth, a buffer of rings around them gets
+    depths decreasing to one outwards, so that the depths of the
+    neighbors differ by one at most.
+    - Buffer skips the triangles that cannot be refined, such as the
+    void ears, which may leave the targets next to them shallower.
+    - New points are the recursive edge midpoints, as for the repeated
+    refinement.
+    - The coarse sides of the depth jumps are closed with voids.
+
+    """
+
+    def with_trinums(self, trinums, depth):
+
+        _ = trirefine.FilterTrinums.from_refiner(self).get_filtered(trinums)
+
+        self.meta['trinums-targets'] = _
+        self.meta['depth'] = depth
+
+        self.meta['trinums-to-refine'] = self.make_region(_)
+        return self
+
+    def make_region(self, trinums):
+        """Pads the targets with the buffer rings.
+        """
+
+        filtr = trirefine.FilterTrinums.from_refiner(self)
+        twins = self.mesh.halfedges().twins
+
+        region = trinums
+        front = trinums
+
+        for _ in range(1, self.depth):
+
+            nextnums = twins[3 * front[:, None] + np.arange(3)].ravel()
+            nextnums = np.setdiff1d(nextnums[nextnums >= 0] // 3, region)
+
+            if nextnums.size == 0:
+                break
+
+            front = filtr.get_filtered(nextnums)
+
+            region = np.union1d(region, front)
+
+        return region
+
+    @property
+    def target_trinums(self):
+        return self.meta['trinums-to-refine']
+
+    @property
+    def core_trinums(self):
+        """Targets to refine by the full depth.
+        """
+        return self.meta['trinums-targets']
+
+    @property
+    def depth(self):
+        return self.meta['depth']
+
+    @property
+    def parent_triangs(self):
+        return self.mesh.triangs[self.target_trinums, :]
+
+    def release_mesh(self):
+
+        self.make_depths()
+        self.make_edges()
+        self.make_children()
+
+        mesh = self.mesh.deltriangs_at(
+            np.r_[self.target_trinums, self.cache['twins']]
+        )
+
+        mesh = mesh.add_triangs(
+            np.vstack([self.cache['children'], self.make_voids()])
+        )
+
+        mesh = mesh.add_points(self.cache['points'])
+
+        return mesh.add_meta({
+            'data-refiner': self.make_data_refiner(),
+            'amr-tree': self.make_tree(mesh)
+        })
+
+    def make_depths(self):
+        """Depths of the region triangles, one at the region boundary.
+        """
+
+        halfedges = self.mesh.halfedges()
+
+        twins = halfedges.twins[
+            3 * self.target_trinums[:, None] + np.arange(3)
+        ]
+
+        neighbors = np.where(twins >= 0, twins // 3, -1)
+
+        ranks = np.full(self.mesh.ntriangs, -1)
+        ranks[self.target_trinums] = np.arange(self.target_trinums.size)
+
+        nbranks = np.where(neighbors >= 0, ranks[neighbors], -1)
+
+        outer = (neighbors >= 0) & (nbranks < 0)
+        depths = np.full(self.target_trinums.size, self.depth)
+
+        front = np.any(outer, axis=1)
+        passed = front.copy()
+
+        for level in range(1, self.depth):
+
+            depths[front] = level
+
+            nextnums = nbranks[front].ravel()
+            front = np.zeros(front.size, dtype=bool)
+
+            front[nextnums[nextnums >= 0]] = True
+            front &= ~passed
+
+            passed |= front
+
+        self.cache |= {
+            'depths': depths,
+            'neighbors': neighbors,
+            'nbtwins': twins,
+            'nbranks': nbranks
+        }
+
+    def make_edges(self):
+        """Numbers the new points on the edges of targets.
+        """
+
+        triangs = self.parent_triangs
+
+        starts = triangs
+        ends = np.roll(triangs, -1, axis=1)
+
+        codes = np.sort(
+            np.stack([starts, ends], axis=2), axis=2
+        ).reshape(-1, 2)
+
+        heads, edgenums = np.unique(
+            codes, axis=0, return_inverse=True
+        )
+
+        edgenums = edgenums.reshape(-1, 3)
+
+        sizes = np.zeros(heads.shape[0], dtype=int)
+
+        np.maximum.at(
+            sizes, edgenums, 2**self.cache['depths'][:, None]
+        )
+
+        pivots = self.find_twins_pivots(edgenums, heads.shape[0])
+
+        counts = np.where(pivots >= 0, 0, sizes - 1)
+        offsets = self.mesh.npoints + np.cumsum(counts) - counts
+
+        self.cache |= {
+            'edgenums': edgenums,
+            'edgecodes': heads,
+            'edgeheads': heads[:, 0],
+            'edgesizes': sizes,
+            'edgepivots': pivots,
+            'edgeoffsets': offsets,
+            'npoints-edges': np.sum(counts)
+        }
+
+    def find_twins_pivots(self, edgenums, nedges):
+        """Pivots of the existing voids on the target edges.
+        """
+
+        pivots = np.full(nedges, -1)
+
+        neighbors = self.cache['neighbors']
+        nbtwins = self.cache['nbtwins']
+
+        isvoid = np.zeros(self.mesh.ntriangs, dtype=bool)
+        isvoid[self.voids_trinums] = True
+
+        mask = (neighbors >= 0) & (nbtwins % 3 == 0)
+        mask[mask] = isvoid[neighbors[mask]]
+
+        twins = neighbors[mask]
+
+        pivots[edgenums[mask]] = self.mesh.triangs[twins, 2]
+
+        self.cache['twins'] = twins
+        return pivots
+
+    def make_children(self):
+        """Makes children triangles and new points, depth by depth.
+        """
+
+        depths = self.cache['depths']
+
+        sizes = (2**depths - 1) * (2**depths - 2) // 2
+        offsets = self.mesh.npoints + self.cache['npoints-edges'] + (
+            np.cumsum(sizes) - sizes
+        )
+
+        npoints = self.cache['npoints-edges'] + np.sum(sizes)
+
+        points = np.zeros(npoints, dtype=complex)
+        images = np.zeros((npoints, 3), dtype=int)
+        weights = np.zeros((npoints, 3))
+
+        children = [np.zeros((0, 3), dtype=int)]
+        lattices = []
+
+        for depth in np.unique(depths):
+
+            ranks, = np.where(depths == depth)
+            lattice = Lattice.from_depth(depth)
+
+            nodnums = self.lattice_nodnums(lattice, ranks, offsets[ranks])
+            coords = lattice.coords(
+                self.mesh.points[self.parent_triangs[ranks]]
+            )
+
+            isnew = nodnums >= self.mesh.npoints
+            newnums = nodnums[isnew] - self.mesh.npoints
+
+            points[newnums] = coords[isnew]
+
+            images[newnums] = np.repeat(
+                self.parent_triangs[ranks, None, :], lattice.size, axis=1
+            )[isnew]
+
+            weights[newnums] = np.broadcast_to(
+                lattice.weights, nodnums.shape + (3,)
+            )[isnew]
+
+            children.append(
+                nodnums[:, lattice.triangs].reshape(-1, 3)
+            )
+
+            lattices.append((ranks, lattice))
+
+        self.cache |= {
+            'points': points,
+            'images': images,
+            'weights': weights,
+            'children': np.vstack(children),
+            'lattices': lattices
+        }
+
+    def lattice_nodnums(self, lattice, ranks, offsets):
+        """Global numbers of the lattice nodes of targets.
+        """
+
+        nodnums = np.zeros((ranks.size, lattice.size), dtype=int)
+
+        nodnums[:, lattice.corners] = self.parent_triangs[ranks]
+        nodnums[:, lattice.inner] = offsets[:, None] + np.arange(
+            lattice.inner.size
+        )
+
+        triangs = self.parent_triangs[ranks]
+
+        for locnum in range(3):
+
+            edgenums = self.cache['edgenums'][ranks, locnum]
+
+            forward = triangs[:, locnum] == self.cache['edgeheads'][edgenums]
+
+            steps = self.edge_steps(
+                edgenums, forward, lattice.ncells
+            )
+
+            nodnums[:, lattice.edges[locnum]] = self.edge_nodnums(
+                edgenums[:, None], steps
+            )
+
+        return nodnums
+
+    def edge_steps(self, edgenums, forward, ncells):
+        """Positions of the lattice edge-nodes on the edges.
+        """
+
+        ratios = self.cache['edgesizes'][edgenums] // ncells
+        steps = ratios[:, None] * np.arange(1, ncells)
+
+        return np.where(
+            forward[:, None], steps, ncells * ratios[:, None] - steps
+        )
+
+    def edge_nodnums(self, edgenums, steps):
+
+        pivots = self.cache['edgepivots'][edgenums]
+
+        return np.where(
+            pivots >= 0,
+            pivots,
+            self.cache['edgeoffsets'][edgenums] + steps - 1
+        )
+
+    def make_voids(self):
+        """Voids on the coarse sides of the depth jumps.
+        """
+
+        depths = self.cache['depths']
+        nbranks = self.cache['nbranks']
+        neighbors = self.cache['neighbors']
+
+        nbdepths = np.where(nbranks >= 0, depths[nbranks], 0)
+
+        mask = (neighbors >= 0) & (nbdepths < depths[:, None])
+        mask[mask] = self.cache['edgepivots'][
+            self.cache['edgenums'][mask]
+        ] < 0
+
+        ranks, locnums = np.nonzero(mask)
+
+        triangs = self.parent_triangs
+        edgenums = self.cache['edgenums'][ranks, locnums]
+
+        forward = (
+            triangs[ranks, locnums] == self.cache['edgeheads'][edgenums]
+        )
+
+        counts = self.cache['edgesizes'][edgenums] // 2
+
+        edgenums = np.repeat(edgenums, counts)
+        forward = np.repeat(forward, counts)
+
+        segnums = np.arange(edgenums.size) - np.repeat(
+            np.cumsum(counts) - counts, counts
+        )
+
+        size = self.cache['edgesizes'][edgenums]
+
+        heads = self.edge_point(edgenums, 2 * segnums, size)
+        tails = self.edge_point(edgenums, 2 * segnums + 2, size)
+        pivots = self.edge_point(edgenums, 2 * segnums + 1, size)
+
+        return np.vstack([
+            np.where(forward, heads, tails),
+            np.where(forward, tails, heads),
+            pivots
+        ]).T
+
+    def edge_point(self, edgenums, steps, sizes):
+        """Global numbers of points on edges, including the ends.
+        """
+
+        codes = self.cache['edgecodes'][edgenums]
+
+        return np.select(
+            [steps == 0, steps == sizes],
+            [codes[:, 0], codes[:, 1]],
+            self.edge_nodnums(edgenums, steps)
+        )
+
+    def make_tree(self, mesh):
+        """Updates the refinement tree, with a family per lattice level.
+        """
+
+        tree = tritree.gettree(self.mesh)
+        targets = self.target_trinums
+
+        keep = np.ones(tree.size, dtype=bool)
+        keep[np.r_[targets, self.cache['twins']]] = False
+
+        datas, famdatas = [], []
+        offset = tree.nfamilies
+
+        for ranks, lattice in self.cache['lattices']:
+
+            parents = targets[ranks, None]
+
+            famnums = offset + lattice.nfamilies * np.arange(
+                ranks.size
+            )[:, None]
+
+            isroot = lattice.famparents < 0
+
+            famdatas.append(_stack_rows(
+                np.where(
+                    isroot, tree.famnums[parents],
+                    famnums + lattice.famparents
+                ),
+                np.where(isroot, tree.slots[parents], lattice.famslots),
+                tree.levels[parents] + lattice.famlevels
+            ))
+
+            datas.append(_stack_rows(
+                tree.levels[parents] + lattice.depth,
+                famnums + lattice.trifams,
+                lattice.trislots
+            ))
+
+            offset += ranks.size * lattice.nfamilies
+
+        nvoids = mesh.ntriangs - np.count_nonzero(keep) - (
+            self.cache['children'].shape[0]
+        )
+
+        voids = np.full((3, nvoids), tritree.NONE)
+        voids[0, :] = tritree.VOID
+
+        return tree.updated(
+            keep, np.hstack([*datas, voids]), np.hstack(famdatas), mesh
+        )
+
+    def make_data_refiner(self):
+
+        old_nodes = np.repeat(
+            np.arange(self.mesh.npoints)[:, None], 3, axis=1
+        )
+
+        old_weights = np.zeros((self.mesh.npoints, 3))
+        old_weights[:, 0] = 1.
+
+        meta = {
+            'nodes-images': np.vstack(
+                [old_nodes, self.cache['images']]
+            ),
+            'nodes-weights': np.vstack(
+                [old_weights, self.cache['weights']]
+            )
+        }
+
+        return trirefine.DataRefiner(self.mesh, meta)
+
+
+class Lattice:
+    """Triangular lattice of a parent triangle.
+
+    Attributes
+    ----------
+    ncells : int
+        Number of cells along each edge.
+    meta : dict
+        Local tables of the lattice.
+
+    Notes
+    -----
+
+    Node (i, j) is at `A + i/n * (B - A) + j/n * (C - A)`.
+
+    """
+
+    def __init__(self, ncells, meta):
+        self.ncells = ncells
+        self.meta = meta
+
+    @classmethod
+    def from_depth(cls, depth):
+
+        ncells = 2**depth
+
+        inds = [
+            (i, j) for i in range(ncells + 1) for j in range(ncells + 1 - i)
+        ]
+
+        nodnums = np.full((ncells + 1, ncells + 1), -1)
+
+        for num, (i, j) in enumerate(inds):
+            nodnums[i, j] = num
+
+        inds = np.array(inds)
+
+        meta = {
+            'inds': inds,
+            'nodnums': nodnums,
+            'midpoints': _lattice_midpoints(nodnums, ncells),
+            'triangs': _lattice_triangs(nodnums, ncells),
+            'lineage': _lattice_lineage(depth)
+        }
+
+        return cls(ncells, meta)
+
+    @property
+    def size(self):
+        return self.meta['inds'].shape[0]
+
+    @property
+    def depth(self):
+        return int(self.ncells).bit_length() - 1
+
+    @property
+    def triangs(self):
+        return self.meta['triangs']
+
+    @property
+    def nfamilies(self):
+        return self.famparents.size
+
+    @property
+    def famparents(self):
+        """Parent families of the inner families, -1 for the root one.
+        """
+        return self.meta['lineage']['famparents']
+
+    @property
+    def famslots(self):
+        return self.meta['lineage']['famslots']
+
+    @property
+    def famlevels(self):
+        return self.meta['lineage']['famlevels']
+
+    @property
+    def trifams(self):
+        """Families of the lattice triangles.
+        """
+        return self.meta['lineage']['trifams']
+
+    @property
+    def trislots(self):
+        return self.meta['lineage']['trislots']
+
+    @property
+    def corners(self):
+        nodnums = self.meta['nodnums']
+        return np.array(
+            [nodnums[0, 0], nodnums[self.ncells, 0], nodnums[0, self.ncells]]
+        )
+
+    @property
+    def edges(self):
+        """Inner nodes of the edges, in the CCW order.
+        """
+
+        nodnums = self.meta['nodnums']
+        steps = np.arange(1, self.ncells)
+
+        return [
+            nodnums[steps, 0],
+            nodnums[self.ncells - steps, steps],
+            nodnums[0, self.ncells - steps]
+        ]
+
+    @property
+    def inner(self):
+
+        i, j = self.meta['inds'].T
+
+        return np.flatnonzero(
+            (i > 0) & (j > 0) & (i + j < self.ncells)
+        )
+
+    @property
+    def weights(self):
+        """Barycentric weights of the nodes.
+        """
+
+        i, j = self.meta['inds'].T / self.ncells
+
+        return np.vstack([1. - i - j, i, j]).T
+
+    def coords(self, verts):
+        """Coordinates of the nodes, by the recursive midpoints.
+        """
+
+        coords = np.zeros((verts.shape[0], self.size), dtype=complex)
+        coords[:, self.corners] = verts
+
+        for nodnums, heads, tails in self.meta['midpoints']:
+            coords[:, nodnums] = 0.5 * (coords[:, heads] + coords[:, tails])
+
+        return coords
+
+
+def _lattice_midpoints(nodnums, ncells):
+    """Midpoint rules of the lattice nodes, level by level.
+    """
+
+    rules = []
+    step = ncells // 2
+
+    while step > 0:
+
+        targets, heads, tails = [], [], []
+
+        for i in range(0, ncells + 1, step):
+            for j in range(0, ncells + 1 - i, step):
+
+                iodd = (i // step) % 2 == 1
+                jodd = (j // step) % 2 == 1
+
+                if iodd and jodd:
+                    head, tail = (i + step, j - step), (i - step, j + step)
+                elif iodd:
+                    head, tail = (i - step, j), (i + step, j)
+                elif jodd:
+                    head, tail = (i, j - step), (i, j + step)
+                else:
+                    continue
+
+                targets.append(nodnums[i, j])
+                heads.append(nodnums[head])
+                tails.append(nodnums[tail])
+
+        rules.append(
+            (np.array(targets), np.array(heads), np.array(tails))
+        )
+
+        step //= 2
+
+    return rules
+
+
+def _lattice_lineage(depth):
+    """Families of the intermediate lattices, level by level.
+    """
+
+    famparents, famslots, famlevels = [[-1]], [[-1]], [[0]]
+    famnums = np.zeros(1, dtype=int)
+
+    for level in range(1, depth):
+
+        parents, slots = _lattice_parents(2**level)
+
+        famparents.append(famnums[parents])
+        famslots.append(slots)
+        famlevels.append(np.full(slots.size, level))
+
+        famnums = sum(map(len, famslots[:-1])) + np.arange(slots.size)
+
+    parents, slots = _lattice_parents(2**depth)
+
+    return {
+        'famparents': np.hstack(famparents),
+        'famslots': np.hstack(famslots),
+        'famlevels': np.hstack(famlevels),
+        'trifams': famnums[parents],
+        'trislots': slots
+    }
+
+
+def _lattice_parents(ncells):
+    """Parents of the lattice triangles in the twice coarser lattice.
+    """
+
+    coarse = {
+        key: num for num, key in enumerate(_lattice_cells(ncells // 2))
+    }
+
+    parents, slots = [], []
+
+    for kind, i, j in _lattice_cells(ncells):
+
+        parent, slot = LATTICE_LINEAGE[kind][i % 2, j % 2]
+
+        parents.append(coarse[parent, i // 2, j // 2])
+        slots.append(slot)
+
+    return np.array(parents), np.array(slots)
+
+
+def _lattice_cells(ncells):
+    """Kinds and positions of the lattice triangles, as ordered.
+    """
+    for i in range(ncells):
+        for j in range(ncells - i):
+            yield ('up', i, j)
+            if i + j < ncells - 1:
+                yield ('down', i, j)
+
+
+def _stack_rows(*rows):
+    return np.stack(
+        np.broadcast_arrays(*rows)
+    ).reshape(len(rows), -1)
+
+
+def _lattice_triangs(nodnums, ncells):
+
+    triangs = []
+
+    for i in range(ncells):
+        for j in range(ncells - i):
+
+            triangs.append(
+                [nodnums[i, j], nodnums[i + 1, j], nodnums[i, j + 1]]
+            )
+
+            if i + j < ncells - 1:
+                triangs.append(
+                    [nodnums[i + 1, j], nodnums[i + 1, j + 1],
+                     nodnums[i, j + 1]]
+                )
+
+    return np.array(triangs)
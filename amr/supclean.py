@@ -55,7 +55,7 @@ class SuptriCleaner(SuptriAgent):
         if bad_indices.size == 0:
             return self.suptri
 
-        new_suptriu = self.suptri.deltriangs(*bad_indices)
+        new_suptriu = self.suptri.deltriangs_at(bad_indices)
         return new_suptriu
 
     @abstractmethod
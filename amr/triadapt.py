@@ -0,0 +1,454 @@
+# -*- coding: utf-8 -*-
+"""Adaptive solve-estimate-mark-refine loop.
+"""
+import copy
+import time
+import numpy as np
+from triellipt.amr import triestim, tritree
+
+STRATEGIES = ['dorfler', 'maximum']
+KEYS_DECIMALS = 9
+
+TriAdaptError = type('TriAdaptError', (Exception,), {})
+
+
+def mark_refine(errors, theta, strategy='dorfler'):
+    """Marks triangles for refinement.
+
+    Parameters
+    ----------
+    errors : flat-float-array
+        Error indicators of triangles.
+    theta : float
+        Marking parameter in (0, 1].
+    strategy : str = "dorfler"
+        Marking strategy, "dorfler" or "maximum".
+
+    Returns
+    -------
+    flat-int-array
+        Numbers of the marked triangles.
+
+    Notes
+    -----
+
+    - "dorfler" marks the fewest triangles with the squared errors
+    summing up to `theta` of the total.
+    - "maximum" marks triangles with errors above `theta` of the maximum.
+
+    """
+
+    _check_strategy(strategy)
+
+    if errors.size == 0 or np.amax(errors) == 0.:
+        return np.array([], dtype=int)
+
+    if strategy == 'maximum':
+        return np.flatnonzero(
+            errors > theta * np.amax(errors)
+        )
+
+    order = np.argsort(-errors, kind='stable')
+    cumsq = np.cumsum(errors[order]**2)
+
+    count = np.searchsorted(cumsq, theta * cumsq[-1]) + 1
+
+    return np.sort(order[:count])
+
+
+def mark_coarsen(suptri, errors, theta, strategy='maximum'):
+    """Marks super-triangles for coarsening.
+
+    Parameters
+    ----------
+    suptri : SuperTriu
+        Candidate super-triangles.
+    errors : flat-float-array
+        Error indicators of triangles.
+    theta : float
+        Marking parameter in [0, 1).
+    strategy : str = "maximum"
+        Marking strategy, "dorfler" or "maximum".
+
+    Returns
+    -------
+    flat-int-array
+        Numbers of the core triangles of the marked super-triangles.
+
+    Notes
+    -----
+
+    - Errors of super-triangles are collected from their bodies.
+    - "dorfler" marks the most super-triangles with the squared errors
+    summing up to `theta` of the total.
+    - "maximum" marks super-triangles with errors below `theta` of the
+    maximum triangle error.
+    - The marked super-triangles do not overlap.
+
+    """
+
+    _check_strategy(strategy)
+
+    if suptri.size == 0 or np.amax(errors) == 0.:
+        return np.array([], dtype=int)
+
+    superrs = np.sqrt(
+        np.sum(errors[suptri.supbodies]**2, axis=1)
+    )
+
+    if strategy == 'maximum':
+        inds = np.flatnonzero(
+            superrs < theta * np.amax(errors)
+        )
+    else:
+        order = np.argsort(superrs, kind='stable')
+        cumsq = np.cumsum(superrs[order]**2)
+        inds = order[cumsq <= theta * np.sum(errors**2)]
+
+    inds = _drop_overlaps(
+        suptri.supbodies[inds], superrs[inds], inds
+    )
+
+    return np.sort(suptri.trinums[inds])
+
+
+def getadapter(key, solver=None):
+    """Creates an adaptation driver.
+
+    Parameters
+    ----------
+    key : str
+        Name of the unit data to estimate errors on.
+    solver : Callable = None
+        Function `solver(unit)` returning a dict of new unit data.
+
+    Returns
+    -------
+    AMRAdapter
+        Driver of the adaptation loop.
+
+    Notes
+    -----
+
+    Without a solver, the data transferred by the refiner/collector is
+    estimated on each iteration.
+
+    """
+    return AMRAdapter(key, solver)
+
+
+class AMRAdapter:
+    """Adaptation driver.
+
+    Attributes
+    ----------
+    key : str
+        Name of the unit data to estimate errors on.
+    solver : Callable
+        Function `solver(unit)` returning a dict of new unit data.
+    meta : dict
+        Settings of the driver.
+    history : list
+        Reports of the last run, one dict per iteration (i).
+
+    Notes
+    -----
+
+    (i) Report items:
+
+    Name          | Description
+    --------------|------------------------------------------
+    `ntriangs`    | Number of triangles before adaptation.
+    `error`       | Global error estimate before adaptation.
+    `nrefined`    | Number of triangles marked for refinement.
+    `ncoarsened`  | Number of super-triangles to coarsen.
+    `times`       | Wall times of the stages, in seconds.
+
+    """
+
+    def __init__(self, key, solver=None):
+        self.key = key
+        self.solver = solver
+        self.meta = {
+            'estimator': 'zz',
+            'refine': ('dorfler', 0.5),
+            'coarsen': None,
+            'tol': None,
+            'maxsize': None
+        }
+        self.history = []
+
+    def with_estimator(self, kind):
+        """Sets the error estimator, "zz" or "jump".
+        """
+        self.meta['estimator'] = kind
+        return self
+
+    def with_refining(self, theta, strategy='dorfler'):
+        """Sets the refinement marking, see `mark_refine()`.
+        """
+        _check_strategy(strategy)
+        self.meta['refine'] = (strategy, theta)
+        return self
+
+    def with_coarsening(self, theta, strategy='maximum'):
+        """Sets the coarsening marking, see `mark_coarsen()`.
+        """
+        _check_strategy(strategy)
+        self.meta['coarsen'] = (strategy, theta)
+        return self
+
+    def with_limits(self, tol=None, maxsize=None):
+        """Sets the stopping criteria.
+
+        Parameters
+        ----------
+        tol : float = None
+            Stops when the global error estimate is below the tolerance.
+        maxsize : int = None
+            Stops when the mesh has more triangles.
+
+        """
+        self.meta['tol'] = tol
+        self.meta['maxsize'] = maxsize
+        return self
+
+    def run(self, unit, maxiter):
+        """Runs the adaptation loop.
+
+        Parameters
+        ----------
+        unit : AMRUnit
+            Initial AMR unit.
+        maxiter : int
+            Maximum number of adaptations.
+
+        Returns
+        -------
+        AMRUnit
+            Adapted unit with the data on the final mesh.
+
+        """
+
+        self.history = []
+
+        for _ in range(maxiter):
+
+            unit, new_unit = self.adapt(unit)
+
+            if new_unit is None:
+                return unit
+            unit = new_unit
+
+        return self.solve(unit)
+
+    def adapt(self, unit):
+        """Performs one iteration.
+
+        Returns
+        -------
+        AMRUnit
+            Input unit with the solved data.
+        AMRUnit
+            Adapted unit, None if converged.
+
+        """
+
+        timer = _Timer()
+
+        unit = timer('solve', self.solve, unit)
+        estim = timer('estimate', self.estimate, unit)
+
+        report = {
+            'ntriangs': unit.mesh.ntriangs,
+            'error': np.sqrt(np.sum(estim**2)),
+            'nrefined': 0,
+            'ncoarsened': 0,
+            'times': timer.times
+        }
+
+        self.history.append(report)
+
+        if self.is_converged(unit, report['error']):
+            return unit, None
+
+        torefine = timer('mark', self.mark_refine, estim)
+        cores = timer('mark', self.mark_coarsen, unit, estim, torefine)
+
+        report['nrefined'] = torefine.size
+        report['ncoarsened'] = cores.size
+
+        if torefine.size == 0 and cores.size == 0:
+            return unit, None
+
+        keys = _triangs_keys(unit.mesh)[torefine]
+
+        new_unit = timer('coarsen', self.coarsen, unit, cores)
+        new_unit = timer('refine', self.refine, new_unit, keys)
+
+        return unit, new_unit
+
+    def solve(self, unit):
+
+        if self.solver is None:
+            return unit
+
+        new_unit = copy.copy(unit)
+        new_unit.data = unit.data | self.solver(unit)
+
+        return new_unit
+
+    def estimate(self, unit):
+
+        if self.key not in unit.data:
+            raise TriAdaptError(f"unit has no data '{self.key}'")
+
+        estim = triestim.getestim(unit.mesh, self.meta['estimator'])
+        return estim(unit.data[self.key])
+
+    def is_converged(self, unit, error):
+
+        tol = self.meta['tol']
+        maxsize = self.meta['maxsize']
+
+        if tol is not None and error <= tol:
+            return True
+
+        if maxsize is not None and unit.mesh.ntriangs > maxsize:
+            return True
+
+        return False
+
+    def mark_refine(self, errors):
+        strategy, theta = self.meta['refine']
+        return mark_refine(errors, theta, strategy)
+
+    def mark_coarsen(self, unit, errors, torefine):
+
+        if self.meta['coarsen'] is None:
+            return np.array([], dtype=int)
+
+        strategy, theta = self.meta['coarsen']
+
+        suptri = self.coarsen_candidates(unit, torefine)
+        return mark_coarsen(suptri, errors, theta, strategy)
+
+    def coarsen_candidates(self, unit, torefine):
+        """Complete families of the tree without refined bodies.
+        """
+
+        tree = tritree.gettree(unit.mesh)
+
+        suptri = unit.mesh.supertriu(
+            tree.candidates(unit.mesh)
+        )
+
+        bad = np.zeros(unit.mesh.ntriangs, dtype=bool)
+        bad[torefine] = True
+
+        return suptri.deltriangs_at(
+            np.any(bad[suptri.supbodies], axis=1)
+        )
+
+    def coarsen(self, unit, cores):
+
+        if cores.size == 0:
+            return unit
+        return unit.coarsen(cores)
+
+    def refine(self, unit, keys):
+        """Refines triangles found by their vertices keys.
+        """
+
+        if keys.shape[0] == 0:
+            return unit
+
+        return unit.refine(
+            _find_triangs(unit.mesh, keys)
+        )
+
+
+class _Timer:
+    """Accumulates wall times of the stages.
+    """
+
+    def __init__(self):
+        self.times = {}
+
+    def __call__(self, name, func, *args):
+
+        start = time.perf_counter()
+        result = func(*args)
+
+        self.times[name] = self.times.get(name, 0.) + (
+            time.perf_counter() - start
+        )
+
+        return result
+
+
+def _check_strategy(strategy):
+    if strategy not in STRATEGIES:
+        raise TriAdaptError(
+            f"unknown strategy '{strategy}', expected one of {STRATEGIES}"
+        )
+
+
+def _triangs_keys(mesh):
+    """Keys of triangles invariant to the nodes numbering.
+
+    Rows are the sorted rounded vertices, as (x, y) pairs.
+    """
+
+    vertices = np.sort(mesh.points[mesh.triangs], axis=1)
+
+    return np.round(
+        vertices.view(float), KEYS_DECIMALS
+    ).reshape(mesh.ntriangs, 6)
+
+
+def _find_triangs(mesh, keys):
+    """Finds triangles by their keys.
+    """
+
+    table = np.vstack([_triangs_keys(mesh), keys])
+
+    _, codes = np.unique(table, axis=0, return_inverse=True)
+    codes = codes.ravel()
+
+    return np.flatnonzero(
+        np.isin(codes[:mesh.ntriangs], codes[mesh.ntriangs:])
+    )
+
+
+def _drop_overlaps(supbodies, errors, inds):
+    """Selects non-overlapping super-triangles, preferring small errors.
+    """
+
+    ranks = np.empty(inds.size, dtype=int)
+    ranks[np.argsort(errors, kind='stable')] = np.arange(inds.size)
+
+    alive = np.ones(inds.size, dtype=bool)
+    taken = np.zeros(inds.size, dtype=bool)
+
+    maxnum = np.amax(supbodies, initial=-1) + 1
+
+    while np.any(alive):
+
+        claims = np.full(maxnum, inds.size)
+
+        np.minimum.at(
+            claims, supbodies[alive], ranks[alive, None]
+        )
+
+        winners = alive & np.all(
+            claims[supbodies] == ranks[:, None], axis=1
+        )
+
+        used = np.zeros(maxnum, dtype=bool)
+        used[supbodies[winners]] = True
+
+        taken |= winners
+        alive &= ~np.any(used[supbodies], axis=1)
+
+    return inds[taken]
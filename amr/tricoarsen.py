@@ -6,6 +6,7 @@ from scipy import sparse as sp
 from triellipt.fem import femunit
 from triellipt.amr import supclean
 from triellipt.amr import massmesh
+from triellipt.amr import tritree
 from triellipt.amr import utils_
 
 
@@ -93,7 +94,8 @@ class MeshCoarsener(MeshAgent):
         mesh = mesh.twin()
 
         mesh.meta = {
-            'data-collect': self.make_data_collector()
+            'data-collect': self.make_data_collector(),
+            'amr-tree': self.make_tree(mesh)
         }
 
         return mesh
@@ -141,6 +143,9 @@ class MeshCoarsener(MeshAgent):
     def make_data_collector(self):
         return self.maker_data_collect.get_collector()
 
+    def make_tree(self, mesh):
+        return self.maker_tree.get_tree(mesh)
+
     @property
     def maker_target_suptri(self):
         return MakerTargetSuptri.from_agent(self)
@@ -161,6 +166,10 @@ class MeshCoarsener(MeshAgent):
     def maker_data_collect(self):
         return MakerDataCollect.from_agent(self)
 
+    @property
+    def maker_tree(self):
+        return MakerTree.from_agent(self)
+
 
 class MeshSubAgent:
     """Operator on a mesh agent.
@@ -184,16 +193,20 @@ class MeshSubAgent:
 
 class MakerTargetSuptri(MeshSubAgent):
     """Makes the target supertriu.
+
+    Targets that are all cores of families skip the geometric cleaning,
+    since families neither overlap nor lose alignment.
+
     """
 
     def fetch_meta(self):
         return {
-            'suptri-prime': self.agent.mesh.supertriu()
+            'tree': tritree.gettree(self.agent.mesh)
         }
 
     @property
-    def suptri_prime(self):
-        return self.meta['suptri-prime']
+    def tree(self):
+        return self.meta['tree']
 
     def get_suptri(self):
 
@@ -208,15 +221,23 @@ class MakerTargetSuptri(MeshSubAgent):
         return suptri
 
     def fetch_target_suptri(self):
-        return self.suptri_prime.atcores(*self.agent.target_trinums)
+        return self.agent.mesh.supertriu(self.agent.target_trinums)
 
     def clean_target_suptri(self, suptri):
 
+        if self.are_families(suptri):
+            return suptri
+
         suptri = self.clean_suptri_overlaps(suptri)
         suptri = self.clean_suptri_not_aligned(suptri)
 
         return suptri
 
+    def are_families(self, suptri):
+        return bool(np.all(
+            self.tree.families_at(suptri.supbodies) >= 0
+        ))
+
     def clean_suptri_overlaps(self, suptri):
         return supclean.clean_overlaps(suptri)
 
@@ -257,7 +278,7 @@ class MakerMeshAlpha(MeshSubAgent):
         trinums_to_del = self.cache['trinums-to-del']
         triangs_to_add = self.cache['triangs-to-add']
 
-        mesh = mesh.deltriangs(*trinums_to_del)
+        mesh = mesh.deltriangs_at(trinums_to_del)
         mesh = mesh.add_triangs(triangs_to_add)
 
         self.cache['mesh-alpha'] = mesh
@@ -302,19 +323,38 @@ class MakerMeshBeta(MeshSubAgent):
 
         mesh = self.agent.cache['mesh-alpha']
 
-        mesh = self.clean_twin_voids(mesh)
-        mesh = self.clean_voids_on_edge(mesh)
+        trinums = np.r_[
+            self.find_twin_voids(mesh), self.find_voids_on_edge(mesh)
+        ]
 
-        return mesh
+        self.agent.cache['voids-removed'] = trinums
+
+        if trinums.size == 0:
+            return mesh
+        return mesh.deltriangs_at(trinums)
 
-    def clean_twin_voids(self, mesh):
-        return utils_.clean_twin_voids(mesh)
+    def find_twin_voids(self, mesh):
+        return utils_.find_twin_voids(mesh)
 
-    def clean_voids_on_edge(self, mesh):
-        return utils_.clean_voids_on_edge(
-            mesh, self.agent.meta['root-mesh-edge']
+    def find_voids_on_edge(self, mesh):
+        """Finds new voids with the pivots on the root-mesh edge.
+        """
+
+        trinums = np.arange(
+            mesh.ntriangs - self.new_voids_count, mesh.ntriangs
         )
 
+        on_edge = np.isin(
+            mesh.triangs[trinums, 2],
+            self.agent.meta['root-mesh-edge'].nodnums_unique
+        )
+
+        return trinums[on_edge]
+
+    @property
+    def new_voids_count(self):
+        return 3 * self.agent.cache['target-suptri'].size
+
 
 class MakerMeshGamma(MeshSubAgent):
     """Makes the gamma-mesh from the beta-mesh.
@@ -466,6 +506,50 @@ class MakerDataCollect(MeshSubAgent):
         return self.agent.cache['target-suptri']
 
 
+class MakerTree(MeshSubAgent):
+    """Updates the refinement tree for the gamma-mesh.
+
+    - Complete families return to their parents.
+    - Other coarse triangles go one level up, with no family.
+
+    """
+
+    @property
+    def target_suptri(self):
+        return self.agent.cache['target-suptri']
+
+    def get_tree(self, mesh):
+
+        tree = tritree.gettree(self.agent.mesh)
+
+        keep = np.ones(tree.size, dtype=bool)
+        keep[self.target_suptri.supbodies.flat] = False
+
+        voids = np.full((3, 3 * self.target_suptri.size), tritree.NONE)
+        voids[0, :] = tritree.VOID
+
+        return tree.updated(
+            keep,
+            np.hstack([voids, self.make_coarse_data(tree)]),
+            np.zeros((3, 0), dtype=int),
+            mesh,
+            self.agent.cache['voids-removed']
+        )
+
+    def make_coarse_data(self, tree):
+
+        cores = self.target_suptri.trinums
+        famnums = tree.families_at(self.target_suptri.supbodies)
+
+        data = np.full((3, cores.size), tritree.NONE)
+        data[0, :] = np.maximum(tree.levels[cores] - 1, 0)
+
+        known = famnums >= 0
+        data[:, known] = tree.famdata[[2, 0, 1]][:, famnums[known]]
+
+        return data
+
+
 class DataCollector:
     """Data-collector.
     """
@@ -478,6 +562,29 @@ class DataCollector:
     def __call__(self, data):
         return self.collect(data)
 
+    def permuted(self, permuter):
+        """Adapts the collector to renumbered nodes of the coarse mesh.
+
+        Parameters
+        ----------
+        permuter : flat-int-array
+            Permutation of the coarse mesh nodes.
+
+        Returns
+        -------
+        DataCollector
+            New data-collector.
+
+        """
+
+        new_root2data = np.copy(
+            self.root2data[permuter], order='C'
+        )
+
+        return self.__class__(
+            self.mesh, self.meta | {'root2data': new_root2data}
+        )
+
     @property
     def root2mass(self):
         """Images of the source data on the mass-mesh.
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""A-posteriori error estimation.
+"""
+import numpy as np
+from triellipt.fem import femoprs
+
+ESTIMATORS = ['zz', 'jump']
+
+TriEstimError = type('TriEstimError', (Exception,), {})
+
+
+def getestim(mesh, kind='zz'):
+    """Creates an error estimator on a mesh.
+
+    Parameters
+    ----------
+    mesh : TriMesh
+        Input triangle mesh.
+    kind : str = "zz"
+        Estimator type, "zz" or "jump".
+
+    Returns
+    -------
+    TriEstim
+        Callable estimator.
+
+    Notes
+    -----
+
+    - "zz" compares gradients with the area-weighted nodal recovery.
+    - "jump" sums normal-gradient jumps across the inner edges.
+    - `TriEstim()` takes nodes-data and returns triangle indicators.
+    - Indicators on voids are zero.
+
+    """
+
+    if kind not in ESTIMATORS:
+        raise TriEstimError(
+            f"unknown estimator '{kind}', expected one of {ESTIMATORS}"
+        )
+
+    if kind == 'zz':
+        return EstimZZ.from_mesh(mesh)
+    return EstimJump.from_mesh(mesh)
+
+
+class TriEstim:
+    """Base error estimator.
+
+    Attributes
+    ----------
+    mesh : TriMesh
+        Mesh to estimate on.
+    meta : dict
+        Static estimator data.
+
+    Notes
+    -----
+
+    Subclasses compute the squared indicators by `squares()`.
+
+    """
+
+    def __init__(self, mesh=None, meta=None):
+        self.mesh = mesh
+        self.meta = meta
+
+    @classmethod
+    def from_mesh(cls, mesh):
+
+        metric = femoprs.mesh_metric(mesh)
+
+        grad = femoprs.GradMaker.from_metric(metric).get_grad()
+        geom = femoprs.MeshGeomMaker.from_metric(metric).get_mesh_geom()
+
+        areas = geom.areas
+        areas[mesh.getvoids()] = 0.
+
+        meta = {
+            'grad': grad,
+            'areas': areas
+        }
+
+        return cls(mesh, meta)
+
+    @property
+    def grad(self):
+        return self.meta['grad']
+
+    @property
+    def areas(self):
+        return self.meta['areas']
+
+    def __call__(self, data):
+        return np.sqrt(
+            self.squares(data)
+        )
+
+    def total(self, data):
+        """Computes the global error estimate.
+        """
+        return np.sqrt(
+            np.sum(self.squares(data))
+        )
+
+
+class EstimZZ(TriEstim):
+    """Zienkiewicz-Zhu gradient recovery estimator.
+    """
+
+    def squares(self, data):
+
+        grads = self.grad(data)
+        nodal = self.recover(grads)
+
+        diffs = nodal[:, self.mesh.triangs] - grads[..., None]
+
+        return self.areas * np.mean(
+            np.sum(diffs**2, axis=0), axis=1
+        )
+
+    def recover(self, grads):
+        """Averages triangle gradients at nodes with area weights.
+        """
+
+        nodes = self.mesh.triangs.ravel()
+        areas = np.repeat(self.areas, 3)
+
+        weights = np.bincount(
+            nodes, areas, self.mesh.npoints
+        )
+
+        weights[weights == 0.] = 1.
+
+        return np.vstack([
+            np.bincount(
+                nodes, np.repeat(comps, 3) * areas, self.mesh.npoints
+            ) / weights for comps in grads
+        ])
+
+
+class EstimJump(TriEstim):
+    """Gradient-jump estimator on the inner edges.
+
+    Notes
+    -----
+
+    Edges shared with voids are skipped, i.e. the jumps across the
+    hanging nodes are not included.
+
+    """
+
+    @classmethod
+    def from_mesh(cls, mesh):
+
+        estim = super().from_mesh(mesh)
+        estim.meta |= make_jump_meta(mesh, estim.areas)
+
+        return estim
+
+    @property
+    def trinums(self):
+        return self.meta['trinums']
+
+    @property
+    def normals(self):
+        return self.meta['normals']
+
+    def squares(self, data):
+
+        grads = self.grad(data)
+        grads = grads[0] + 1j * grads[1]
+
+        diffs = grads[self.trinums[0]] - grads[self.trinums[1]]
+
+        jumps = 0.5 * np.real(
+            np.conj(diffs) * self.normals
+        )**2
+
+        return np.bincount(
+            self.trinums.ravel(), np.tile(jumps, 2), self.mesh.ntriangs
+        )
+
+
+def make_jump_meta(mesh, areas):
+    """Makes inner edges with their scaled normals.
+    """
+
+    edges = mesh.edgesmap()
+
+    trinums = edges.data[:2, :]
+    locnums = edges.locnums1
+
+    valid = np.all(areas[trinums] > 0., axis=0)
+
+    trinums = trinums[:, valid]
+    locnums = locnums[valid]
+
+    points = mesh.points[mesh.triangs[trinums[0]]]
+    inds = np.arange(locnums.size)
+
+    tangents = (
+        points[inds, (locnums + 1) % 3] - points[inds, locnums]
+    )
+
+    return {
+        'trinums': trinums.copy('C'),
+        'normals': -1j * tangents
+    }
@@ -2,7 +2,7 @@
 """Triangle fronts.
 """
 import numpy as np
-from triellipt.fem import skeleton
+from triellipt.amr import tritree
 from triellipt.utils import tables
 
 
@@ -29,6 +29,9 @@ class TriFront:
         )
 
     def subfront(self, *inds):
+        return self.subfront_at(inds)
+
+    def subfront_at(self, inds):
         return self.update_data(self.data[:, inds])
 
     @property
@@ -84,7 +87,7 @@ class TriFront:
         )
 
         data = {
-            r: self.subfront(*i) for r, i in inds.items()
+            r: self.subfront_at(i) for r, i in inds.items()
         }
 
         return data
@@ -189,10 +192,8 @@ class TriFrontFine(TriFront):
         if self.size == 0:
             return None
 
-        _ = self.unit.mesh.supertriu()
-
-        return _.atcores(
-            *np.unique(self.trinums)
+        return self.unit.mesh.supertriu(
+            np.unique(self.trinums)
         )
 
 
@@ -224,19 +225,20 @@ class UnitAgent:
 
 class MakerFrontCoarse(UnitAgent):
     """Finds a front of coarse triangles.
-    """
 
-    def fetch_meta(self):
+    Coarse triangles are across the long edges of the inner voids.
 
-        suptri = self.unit.mesh.supertriu()
+    """
 
+    def fetch_meta(self):
         return {
-            'supvoids': suptri.supvoids()
+            'voids': tritree.gettree(self.unit.mesh).voids(),
+            'twins': self.unit.mesh.halfedges().twins
         }
 
     @property
-    def supvoids(self):
-        return self.meta['supvoids']
+    def voids(self):
+        return self.meta['voids']
 
     def get_front(self):
 
@@ -247,12 +249,14 @@ class MakerFrontCoarse(UnitAgent):
 
     def make_front_data(self):
 
-        if self.supvoids is None:
-            return np.array([[]]*2).astype(int)
+        twins = self.meta['twins'][
+            3 * self.voids[:, None] + np.arange(3)
+        ]
+
+        inner = np.all(twins >= 0, axis=1)
 
         data = _pack_rows(
-            self.supvoids.trinums1,
-            self.supvoids.trinums
+            twins[inner, 0] // 3, self.voids[inner]
         )
 
         return data.astype(int)
@@ -263,19 +267,28 @@ class MakerFrontCoarse(UnitAgent):
 
 class MakerFrontFine(UnitAgent):
     """Finds a front of fine triangles.
+
+    Fine triangles go around the voids pivots, ordered by the pivots.
+
     """
 
     def fetch_meta(self):
 
-        skel = skeleton.getskeleton(self.unit.mesh)
+        voids = tritree.gettree(self.unit.mesh).voids()
+        pivots = self.unit.mesh.triangs[voids, 2]
 
         return {
-            'voidsmap': skel.voidsmap
+            'voids': voids[np.argsort(pivots, kind='stable')],
+            'twins': self.unit.mesh.halfedges().twins
         }
 
     @property
-    def voidsmap(self):
-        return self.meta['voidsmap']
+    def voids(self):
+        return self.meta['voids']
+
+    @property
+    def twins(self):
+        return self.meta['twins']
 
     def get_front(self):
 
@@ -286,17 +299,16 @@ class MakerFrontFine(UnitAgent):
 
     def make_front_data(self):
 
-        if self.voidsmap is None:
-            return np.array([[]]*4).astype(int)
+        wests = self.twins[3 * self.voids + 1]
+        easts = self.twins[3 * self.voids + 2]
 
-        cores = self.voidsmap.trinums[2::4]
-        voids = self.voidsmap.trinums[0::4]
-        wests = self.voidsmap.trinums[1::4]
-        easts = self.voidsmap.trinums[3::4]
+        cores = self.twins[
+            wests - wests % 3 + (wests + 2) % 3
+        ]
 
         return _pack_rows(
-            cores, voids, wests, easts
-        )
+            cores // 3, self.voids, wests // 3, easts // 3
+        ).astype(int)
 
     def make_front_object(self, data):
         return TriFrontFine(self.unit, data)
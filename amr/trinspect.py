@@ -145,7 +145,7 @@ class SubsetFinder(MeshAgent):
         if self.cache['remove-heads'] is False:
             return subset
 
-        submesh = self.mesh.submesh(*subset)
+        submesh = self.mesh.submesh_at(subset)
 
         subedges = submesh.edgesmap()
         subheads = subedges.getspec()['heads']
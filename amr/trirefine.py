@@ -2,7 +2,9 @@
 """Mesh refinement.
 """
 import numpy as np
+from scipy import sparse as sp
 from triellipt.utils import pairs, tables
+from triellipt.amr import tritree
 
 
 def refine_mesh(mesh, trinums):
@@ -79,15 +81,19 @@ class MeshRefiner(MeshAgent):
         mesh = self.make_mesh_beta()
 
         mesh = mesh.twin()
-        mesh = mesh.add_meta(
-            {'data-refiner': self.make_data_refiner()}
-        )
+        mesh = mesh.add_meta({
+            'data-refiner': self.make_data_refiner(),
+            'amr-tree': self.make_tree(mesh)
+        })
 
         return mesh
 
     def make_data_refiner(self):
         return self.maker_data_refiner.get_refiner()
 
+    def make_tree(self, mesh):
+        return self.maker_tree.get_tree(mesh)
+
     def make_mesh_beta(self):
 
         _ = self.make_mesh_alpha()
@@ -137,6 +143,10 @@ class MeshRefiner(MeshAgent):
     def maker_data_refiner(self):
         return MakerDataRefiner.from_refiner(self)
 
+    @property
+    def maker_tree(self):
+        return MakerTree.from_refiner(self)
+
 
 class RefinerAgent:
     """Operator on a mesh refiner.
@@ -221,7 +231,7 @@ class MakerMeshCore(RefinerAgent):
 
     @property
     def target_submesh(self):
-        return self.refiner.mesh.submesh(*self.target_trinums)
+        return self.refiner.mesh.submesh_at(self.target_trinums)
 
     @property
     def target_trinums(self):
@@ -264,7 +274,7 @@ class MakerMeshAlpha(RefinerAgent):
         triangs_to_add = self.cache['triangs-to-add']
         points_to_add = self.cache['points-to-add']
 
-        mesh = mesh.deltriangs(*trinums_to_del)
+        mesh = mesh.deltriangs_at(trinums_to_del)
         mesh = mesh.add_triangs(triangs_to_add)
         mesh = mesh.add_points(points_to_add)
 
@@ -396,10 +406,10 @@ class MakerMeshBeta(RefinerAgent):
     def remove_voids(self):
 
         mesh = self.cache['mesh-beta']
+        trinums = self.get_voids_to_remove()
 
-        mesh = mesh.deltriangs(
-            *self.get_voids_to_remove()
-        )
+        mesh = mesh.deltriangs_at(trinums)
+        self.refiner.cache['voids-removed'] = trinums
 
         self.cache['mesh-beta'] = mesh
         return mesh
@@ -575,6 +585,60 @@ class MakerDataRefiner(RefinerAgent):
         )
 
 
+class MakerTree(RefinerAgent):
+    """Updates the refinement tree for a pre-release mesh.
+
+    - Targets become families of a core and three corners.
+    - Removed voids are dropped from the alpha-mesh data.
+
+    """
+
+    def get_tree(self, mesh):
+
+        tree = tritree.gettree(self.refiner.mesh)
+
+        keep = np.ones(tree.size, dtype=bool)
+        keep[self.refiner.target_trinums] = False
+
+        return tree.updated(
+            keep,
+            self.make_new_data(tree),
+            self.make_new_famdata(tree),
+            mesh,
+            self.refiner.cache['voids-removed']
+        )
+
+    def make_new_data(self, tree):
+
+        targets = self.refiner.target_trinums
+
+        famnums = tree.nfamilies + np.arange(targets.size)
+        levels = tree.levels[targets] + 1
+
+        children = np.vstack([
+            np.tile(levels, 4),
+            np.tile(famnums, 4),
+            np.repeat([0, 2, 3, 1], targets.size)
+        ])
+
+        nvoids = self.refiner.cache['mesh-alpha'].ntriangs - (
+            tree.size + 3 * targets.size
+        )
+
+        voids = np.full((3, nvoids), tritree.NONE)
+        voids[0, :] = tritree.VOID
+
+        return np.hstack([children, voids])
+
+    def make_new_famdata(self, tree):
+
+        targets = self.refiner.target_trinums
+
+        return np.vstack([
+            tree.famnums[targets], tree.slots[targets], tree.levels[targets]
+        ])
+
+
 class FilterTrinums(RefinerAgent):
     """Filters trinums to refine.
     """
@@ -632,7 +696,7 @@ class FilterTrinums(RefinerAgent):
         )
 
     def codes_target_submesh(self, trinums):
-        _ = self.refiner.mesh.submesh(*trinums)
+        _ = self.refiner.mesh.submesh_at(trinums)
         return _.edges_paired()
 
     @property
@@ -648,13 +712,31 @@ class DataRefiner:
     mesh : TriMesh
         Source triangle mesh.
     meta : dict
-        Refiner meta-data.
+        Refiner meta-data (i).
+
+    Properties
+    ----------
+
+    Name      | Description
+    ----------|-------------------------------------------------
+    `matrix`  | Sparse refinement operator, built once (ii).
+
+    Notes
+    -----
+
+    (i) Refined nodes are weighted sums of their images:
+
+    - `nodes-images` is a table of source nodes
+    - `nodes-weights` is a table of weights, if absent images are averaged
+
+    (ii) Rows go over the refined nodes, columns over the source nodes.
 
     """
 
     def __init__(self, mesh, meta):
         self.mesh = mesh
         self.meta = meta
+        self.cache = {}
 
     @property
     def nodes_images(self):
@@ -662,30 +744,136 @@ class DataRefiner:
         """
         return self.meta['nodes-images']
 
+    @property
+    def nodes_weights(self):
+        """Weights of the images, None for the plain average.
+        """
+        return self.meta.get('nodes-weights')
+
+    @property
+    def matrix(self):
+        if 'matrix' not in self.cache:
+            self.cache['matrix'] = self.make_matrix()
+        return self.cache['matrix']
+
+    @property
+    def matrix_transposed(self):
+        if 'matrix-t' not in self.cache:
+            self.cache['matrix-t'] = self.matrix.T.tocsr()
+        return self.cache['matrix-t']
+
+    def make_matrix(self):
+
+        images = self.nodes_images
+        weights = self.nodes_weights
+
+        if weights is None:
+            weights = np.full(images.shape, 1. / images.shape[1])
+
+        rows = np.repeat(
+            self.nodes_range, images.shape[1]
+        )
+
+        matrix = sp.csr_array(
+            (weights.ravel(), (rows, images.ravel())),
+            shape=(images.shape[0], self.mesh.npoints)
+        )
+
+        matrix.eliminate_zeros()
+        return matrix
+
     def __call__(self, data):
         return self.refine(data)
 
-    def refine(self, source_data):
-        return self.from_data_images(
-            source_data[self.nodes_images]
-        )
+    def permuted(self, permuter):
+        """Adapts the refiner to renumbered nodes of the refined mesh.
+
+        Parameters
+        ----------
+        permuter : flat-int-array
+            Permutation of the refined mesh nodes.
+
+        Returns
+        -------
+        DataRefiner
+            New data-refiner.
+
+        """
 
-    def from_data_images(self, data_images):
-        return 0.5 * (
-            data_images[:, 0] + data_images[:, 1]
+        new_meta = {
+            k: np.copy(v[permuter, :], order='C') for k, v in self.meta.items()
+            if k in ('nodes-images', 'nodes-weights')
+        }
+
+        return self.__class__(
+            self.mesh, self.meta | new_meta
         )
 
+    def refine(self, source_data):
+        """Transmits data to the refined mesh.
+
+        Parameters
+        ----------
+        source_data : float-or-complex-array
+            Data on the source nodes, flat or with columns of samples.
+
+        Returns
+        -------
+        float-or-complex-array
+            Data on the refined nodes, of the same layout.
+
+        """
+        return self.matrix @ source_data
+
+    def restrict(self, data, masses=None):
+        """Transmits data back to the source mesh by the transpose.
+
+        Parameters
+        ----------
+        data : float-or-complex-array
+            Data on the refined nodes, flat or with columns of samples.
+        masses : flat-float-array = None
+            Lumped masses of the refined nodes (i).
+
+        Returns
+        -------
+        float-or-complex-array
+            Data on the source nodes, of the same layout.
+
+        Notes
+        -----
+
+        (i) Without masses the plain transpose is applied, e.g. to
+        residuals. With masses the result is the mass-weighted average
+        `(P.T @ (m * u)) / (P.T @ m)`, which keeps the total mass.
+
+        """
+
+        if masses is None:
+            return self.matrix_transposed @ data
+
+        shape = (-1,) + (1,) * (np.ndim(data) - 1)
+
+        weights = self.matrix_transposed @ masses
+        weights[weights == 0.] = 1.
+
+        return self.matrix_transposed @ (
+            masses.reshape(shape) * data
+        ) / weights.reshape(shape)
+
     @property
     def master_nodes(self):
-        return self.nodes_range[
-            self.nodes_images[:, 0] == self.nodes_images[:, 1]
-        ]
+        return self.nodes_range[self.master_mask]
 
     @property
     def slaves_nodes(self):
-        return self.nodes_range[
-            self.nodes_images[:, 0] != self.nodes_images[:, 1]
-        ]
+        return self.nodes_range[~self.master_mask]
+
+    @property
+    def master_mask(self):
+        return np.all(
+            self.nodes_images == self.nodes_images[:, [0]], axis=1
+        )
 
     @property
     def nodes_range(self):
@@ -715,22 +903,3 @@ def _reconnect_nodes(mesh, nodes1, nodes2):
 
     new_triangs = newnodes[mesh.triangs]
     return mesh.update_triangs(new_triangs)
-
-
-def constr_data(mesh, data):
-    """Constrains data on a mesh.
-    """
-
-    voids_trinums = mesh.getvoids()
-
-    if voids_trinums.size == 0:
-        return data
-    voids_triangs = mesh.triangs[voids_trinums, :]
-
-    west, east, pivs = voids_triangs.T
-
-    data[pivs] = 0.5 * (
-        data[west] + data[east]
-    )
-
-    return data.copy('C')
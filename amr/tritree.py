@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""Refinement tree of a mesh.
+"""
+import numpy as np
+
+VOID = -1
+NONE = -1
+
+
+def gettree(mesh):
+    """Fetches the refinement tree of a mesh.
+
+    Parameters
+    ----------
+    mesh : TriMesh
+        Input triangle mesh.
+
+    Returns
+    -------
+    TriTree
+        Tree kept in the mesh meta-data, a root tree if there is none.
+
+    """
+
+    if 'amr-tree' not in mesh.meta:
+        mesh.meta['amr-tree'] = TriTree.from_mesh(mesh)
+    return mesh.meta['amr-tree']
+
+
+class TriTree:
+    """Refinement tree of a mesh.
+
+    Attributes
+    ----------
+    data : 3-row-int-table
+        Levels, families and slots of the mesh triangles (i).
+    hanging : flat-bool-array
+        Flags of the hanging nodes, i.e. the voids pivots.
+    famdata : 3-row-int-table
+        Parent families, parent slots and levels of the families (ii).
+
+    Notes
+    -----
+
+    (i) Triangles data:
+
+    - `levels` are the refinement levels, -1 for voids
+    - `famnums` are the families of siblings, -1 if unknown
+    - `slots` are 0 for the core child, k + 1 for the corner child at
+    the k-th vertex of the parent, -1 if unknown
+
+    (ii) A family is the set of children of a parent triangle that is
+    no longer in the mesh. Families are numbered in the order of their
+    creation and are kept after coarsening.
+
+    """
+
+    def __init__(self, data, hanging, famdata):
+        self.data = data
+        self.hanging = hanging
+        self.famdata = famdata
+
+    @classmethod
+    def from_mesh(cls, mesh):
+
+        data = np.zeros((3, mesh.ntriangs), dtype=int)
+
+        data[0, mesh.getvoids()] = VOID
+        data[1:, :] = NONE
+
+        return cls(
+            data, _hanging_nodes(mesh, data[0]), np.zeros((3, 0), dtype=int)
+        )
+
+    @property
+    def size(self):
+        return self.data.shape[1]
+
+    @property
+    def levels(self):
+        return self.data[0, :]
+
+    @property
+    def famnums(self):
+        return self.data[1, :]
+
+    @property
+    def slots(self):
+        return self.data[2, :]
+
+    @property
+    def nfamilies(self):
+        return self.famdata.shape[1]
+
+    @property
+    def famparents(self):
+        return self.famdata[0, :]
+
+    @property
+    def famslots(self):
+        return self.famdata[1, :]
+
+    @property
+    def famlevels(self):
+        return self.famdata[2, :]
+
+    def voids(self):
+        """Numbers of the void triangles.
+        """
+        return np.flatnonzero(self.levels == VOID)
+
+    def siblings(self):
+        """Finds the complete families in the mesh.
+
+        Returns
+        -------
+        flat-int-array
+            Numbers of the families.
+        4-column-int-table
+            Triangles of the families, in the order of slots.
+
+        """
+
+        trinums = np.flatnonzero(self.famnums >= 0)
+
+        counts = np.bincount(
+            self.famnums[trinums], minlength=self.nfamilies
+        )
+
+        trinums = trinums[counts[self.famnums[trinums]] == 4]
+
+        order = np.argsort(
+            4 * self.famnums[trinums] + self.slots[trinums]
+        )
+
+        table = trinums[order].reshape(-1, 4)
+
+        return self.famnums[table[:, 0]], table
+
+    def families_at(self, supbodies):
+        """Finds the families of super-triangles.
+
+        Parameters
+        ----------
+        supbodies : 4-column-int-table
+            Bodies of super-triangles, cores first.
+
+        Returns
+        -------
+        flat-int-array
+            Numbers of the families, -1 for other super-triangles.
+
+        """
+
+        famnums = self.famnums[supbodies[:, 0]]
+
+        isfamily = np.all(
+            self.famnums[supbodies] == famnums[:, None], axis=1
+        )
+
+        isfamily &= self.slots[supbodies[:, 0]] == 0
+
+        return np.where(isfamily, famnums, NONE)
+
+    def candidates(self, mesh):
+        """Finds the cores of families that can be coarsened.
+
+        Parameters
+        ----------
+        mesh : TriMesh
+            Mesh of the tree.
+
+        Returns
+        -------
+        flat-int-array
+            Numbers of the core triangles, in ascending order.
+
+        Notes
+        -----
+
+        Families with finer neighbors, i.e. with voids on the outer
+        edges of the children, are skipped to keep the mesh 1-irregular.
+
+        """
+
+        _, table = self.siblings()
+
+        if table.shape[0] == 0:
+            return np.array([], dtype=int)
+
+        corners = table[:, 1:]
+
+        halfedges = 3 * corners[..., None] + np.arange(3)
+        twins = mesh.halfedges().twins[halfedges]
+
+        outer = twins // 3 != table[:, [0], None]
+        finer = (twins >= 0) & (twins % 3 == 0) & outer
+        finer[finer] = self.levels[twins[finer] // 3] == VOID
+
+        return np.sort(
+            table[~np.any(finer, axis=(1, 2)), 0]
+        )
+
+    def updated(self, keep, new_data, new_famdata, mesh, removed=None):
+        """Creates the tree of a new mesh.
+
+        Parameters
+        ----------
+        keep : flat-bool-array
+            Mask of the old triangles kept in the new mesh.
+        new_data : 3-row-int-table
+            Data of the new triangles appended to the kept ones.
+        new_famdata : 3-row-int-table
+            Data of the new families.
+        mesh : TriMesh
+            New mesh.
+        removed : flat-int-array = None
+            Triangles removed after appending, as numbered before.
+
+        Returns
+        -------
+        TriTree
+            New tree.
+
+        """
+
+        data = np.hstack(
+            [self.data[:, keep], new_data]
+        )
+
+        if removed is not None:
+            data = np.delete(data, removed, axis=1)
+
+        return self.__class__(
+            data,
+            _hanging_nodes(mesh, data[0]),
+            np.hstack([self.famdata, new_famdata])
+        )
+
+    def subtree(self, trinums, mesh):
+        """Extracts the tree of a submesh.
+
+        Parameters
+        ----------
+        trinums : flat-int-array
+            Triangles of the submesh.
+        mesh : TriMesh
+            Submesh, with the triangles in the same order.
+
+        Returns
+        -------
+        TriTree
+            New tree sharing the families.
+
+        """
+
+        data = self.data[:, trinums]
+
+        return self.__class__(
+            data, _hanging_nodes(mesh, data[0]), self.famdata
+        )
+
+    def permuted(self, triangs_permuter, nodes_permuter):
+        """Adapts the tree to renumbered triangles and nodes.
+        """
+        return self.__class__(
+            self.data[:, triangs_permuter].copy('C'),
+            self.hanging[nodes_permuter].copy('C'),
+            self.famdata
+        )
+
+
+def _hanging_nodes(mesh, levels):
+
+    hanging = np.zeros(mesh.npoints, dtype=bool)
+    hanging[mesh.triangs[levels == VOID, 2]] = True
+
+    return hanging
@@ -0,0 +1,770 @@
+# -*- coding: utf-8 -*-
+"""Windowed mesh adaptation.
+"""
+import os
+from concurrent import futures
+import numpy as np
+from scipy import sparse as sp
+from scipy.sparse import csgraph
+from triellipt.amr import trirefine, multirefine, tricoarsen, tritree
+from triellipt.amr import meshgluer
+
+
+def coarsen_mesh(mesh, trinums, workers=1):
+    _ = get_coarsener(mesh, trinums, workers)
+    return _.release_mesh()
+
+
+def refine_mesh(mesh, trinums, depth=1, workers=1):
+    _ = get_refiner(mesh, trinums, depth, workers)
+    return _.release_mesh()
+
+
+def get_coarsener(mesh, trinums, workers=1):
+    return WindowCoarsener.from_mesh(mesh).with_workers(
+        workers
+    ).with_trinums(trinums)
+
+
+def get_refiner(mesh, trinums, depth=1, workers=1):
+    return WindowRefiner.from_mesh(mesh).with_workers(
+        workers
+    ).with_trinums(trinums, depth)
+
+
+class MeshWindow:
+    """Submesh around a group of targets.
+
+    Attributes
+    ----------
+    mesh : TriMesh
+        Window submesh, with the tree of the source mesh.
+    trinums : flat-int-array
+        Source triangles of the window, in ascending order.
+    nodnums : flat-int-array
+        Source nodes of the window nodes.
+    targets : flat-int-array
+        Window triangles to adapt.
+
+    """
+
+    def __init__(self, mesh, trinums, nodnums, targets):
+        self.mesh = mesh
+        self.trinums = trinums
+        self.nodnums = nodnums
+        self.targets = targets
+
+    @classmethod
+    def from_mesh(cls, mesh, trinums, targets):
+        """Cuts a window out of a mesh.
+
+        Parameters
+        ----------
+        mesh : TriMesh
+            Source mesh.
+        trinums : flat-int-array
+            Sorted source triangles of the window.
+        targets : flat-int-array
+            Source triangles to adapt.
+
+        Returns
+        -------
+        MeshWindow
+            New window.
+
+        """
+
+        submesh = mesh.submesh_at(trinums).delghosts()
+        nodnums = submesh.meta['old-nodes-numbers']
+
+        submesh = submesh.twin()
+        submesh.meta['amr-tree'] = tritree.gettree(mesh).subtree(
+            trinums, submesh
+        )
+
+        return cls(
+            submesh, trinums, nodnums, np.searchsorted(trinums, targets)
+        )
+
+
+class WindowAgent(tricoarsen.MeshAgent):
+    """Adapts a mesh within windows around the targets.
+
+    Notes
+    -----
+
+    - Windows pad the targets with their vertex neighbors, so the nodes
+    of the targets are inner for the windows unless on the mesh edge.
+    - Windows of several workers do not touch each other and are adapted
+    as standalone meshes in a process pool.
+    - Adapted windows are spliced back by the nodes numbers.
+
+    """
+
+    def fetch_meta(self):
+        return {
+            'workers': 1
+        }
+
+    def with_workers(self, workers):
+        """Sets the number of worker processes, None for the CPU count.
+        """
+        self.meta['workers'] = workers
+        return self
+
+    @property
+    def workers(self):
+        return self.meta['workers'] or os.cpu_count()
+
+    @property
+    def windows(self):
+        return self.cache['windows']
+
+    @property
+    def windows_trinums(self):
+        return np.hstack(
+            [window.trinums for window in self.windows]
+        )
+
+    def make_windows(self, bodies, targets):
+        """Cuts the windows around the target bodies.
+
+        Parameters
+        ----------
+        bodies : int-table
+            Triangles of the targets, one row per target.
+        targets : flat-int-array
+            Triangles to adapt, one per target.
+
+        """
+
+        groups = find_groups(
+            self.mesh, bodies, self.workers, tritree.gettree(self.mesh).hanging
+        )
+
+        _ = [
+            MeshWindow.from_mesh(self.mesh, trinums, targets[inds])
+            for trinums, inds in groups
+        ]
+
+        self.cache['windows'] = _
+        return _
+
+    def run_workers(self, func, *args):
+        """Maps a function over the windows.
+        """
+
+        meshes = [window.mesh for window in self.windows]
+        targets = [window.targets for window in self.windows]
+
+        args = [meshes, targets] + [[arg] * len(meshes) for arg in args]
+
+        if self.workers == 1 or len(meshes) == 1:
+            return list(map(func, *args))
+
+        executor = futures.ProcessPoolExecutor(self.workers)
+
+        try:
+            return list(executor.map(func, *args))
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def make_tree(self, mesh, trees, new_famdata):
+
+        tree = tritree.gettree(self.mesh)
+
+        keep = np.ones(tree.size, dtype=bool)
+        keep[self.windows_trinums] = False
+
+        return tree.updated(
+            keep, np.hstack([_.data for _ in trees]), new_famdata, mesh
+        )
+
+
+class WindowCoarsener(WindowAgent):
+    """Coarsens the target triangles within windows.
+
+    Notes
+    -----
+
+    Data outside the windows is kept as is.
+
+    """
+
+    def with_trinums(self, trinums):
+        self.meta['trinums-to-coarsen'] = np.unique(trinums).astype(int)
+        return self
+
+    @property
+    def target_trinums(self):
+        return self.meta['trinums-to-coarsen']
+
+    def release_mesh(self):
+        """Creates the coarsened mesh.
+        """
+
+        suptri = self.mesh.supertriu(self.target_trinums)
+
+        if suptri.size == 0:
+            return self.root_mesh_copy
+
+        _ = self.make_windows(suptri.supbodies, suptri.trinums)
+        coarse = self.make_windows_coarse()
+
+        if not coarse:
+            return self.root_mesh_copy
+
+        mesh = self.splice(coarse)
+
+        mesh.meta = {
+            'data-collect': self.make_data_collector(coarse),
+            'amr-tree': self.make_tree(
+                mesh,
+                [_.meta['amr-tree'] for _ in coarse],
+                np.zeros((3, 0), dtype=int)
+            )
+        }
+
+        return mesh
+
+    def make_windows_coarse(self):
+        """Coarsens the windows, skips the windows left as is.
+        """
+
+        coarse = self.run_workers(_coarsen_in_worker)
+
+        isdone = ['data-collect' in _.meta for _ in coarse]
+
+        self.cache['windows'] = [
+            _ for _, done in zip(self.windows, isdone) if done
+        ]
+
+        return [_ for _, done in zip(coarse, isdone) if done]
+
+    def splice(self, coarse):
+        """Replaces the windows by their coarsened versions.
+        """
+
+        nodnums = [
+            window.nodnums[_.meta['data-collect'].root2data]
+            for window, _ in zip(self.windows, coarse)
+        ]
+
+        mesh = self.mesh.deltriangs_at(self.windows_trinums)
+        mesh = mesh.add_triangs(
+            np.vstack([nums[_.triangs] for nums, _ in zip(nodnums, coarse)])
+        )
+
+        mesh = mesh.delghosts()
+
+        self.cache['nodes-root2data'] = mesh.meta['old-nodes-numbers']
+        self.cache['nodes-window2data'] = [
+            np.searchsorted(self.cache['nodes-root2data'], nums)
+            for nums in nodnums
+        ]
+
+        return mesh.twin()
+
+    def make_data_collector(self, coarse):
+
+        meta = {
+            'root2window': [window.nodnums for window in self.windows],
+            'root2data': self.cache['nodes-root2data'],
+            'window2data': self.cache['nodes-window2data'],
+            'window-collect': [_.meta['data-collect'] for _ in coarse]
+        }
+
+        return WindowCollector(self.mesh, meta)
+
+
+class WindowRefiner(WindowAgent):
+    """Refines the target triangles within windows.
+
+    Notes
+    -----
+
+    - New nodes of the windows are matched by their rounded coordinates,
+    the same way `meshgluer` matches the nodes of joined meshes.
+    - For several levels, windows pad the buffer rings of the targets,
+    so that each window grades the depths the same way as the whole mesh.
+
+    """
+
+    def with_trinums(self, trinums, depth=1):
+
+        trinums = np.unique(trinums).astype(int)
+
+        self.meta['trinums-to-refine'] = trinums[
+            (trinums >= 0) & (trinums < self.mesh.ntriangs)
+        ]
+
+        self.meta['depth'] = depth
+        return self
+
+    @property
+    def target_trinums(self):
+        return self.meta['trinums-to-refine']
+
+    @property
+    def depth(self):
+        return self.meta['depth']
+
+    def release_mesh(self):
+        """Creates the refined mesh.
+        """
+
+        targets = self.target_trinums
+
+        if targets.size == 0:
+            return self.root_mesh_copy
+
+        _ = self.make_windows_graded(targets)
+        fine = self.run_workers(_refine_in_worker, self.depth)
+
+        mesh = self.splice(fine)
+
+        mesh.meta = {
+            'data-refiner': self.make_data_refiner(fine),
+            'amr-tree': self.make_tree(mesh, *self.make_new_trees(fine))
+        }
+
+        return mesh
+
+    def make_windows_graded(self, targets):
+        """Cuts the windows around the targets and their graded buffers.
+        """
+
+        if self.depth == 1:
+            return self.make_windows(targets[:, None], targets)
+
+        region = multirefine.get_refiner(
+            self.mesh, targets, self.depth
+        ).target_trinums
+
+        windows = self.make_windows(region[:, None], region)
+
+        for window in windows:
+            window.targets = np.searchsorted(
+                window.trinums, np.intersect1d(window.trinums, targets)
+            )
+
+        return windows
+
+    def splice(self, fine):
+        """Replaces the windows by their refined versions.
+        """
+
+        new_points = [
+            _.points[window.mesh.npoints:]
+            for window, _ in zip(self.windows, fine)
+        ]
+
+        keys = np.hstack(new_points).round(meshgluer.DomainsGluer.TOL)
+
+        _, firsts, inverse = np.unique(
+            keys, return_index=True, return_inverse=True
+        )
+
+        inverse = np.split(
+            self.mesh.npoints + inverse,
+            np.cumsum([_.size for _ in new_points])[:-1]
+        )
+
+        nodnums = [
+            np.hstack([window.nodnums, inds])
+            for window, inds in zip(self.windows, inverse)
+        ]
+
+        self.cache |= {
+            'nodes-window2data': nodnums,
+            'new-nodes-firsts': firsts
+        }
+
+        mesh = self.mesh.deltriangs_at(self.windows_trinums)
+        mesh = mesh.add_points(np.hstack(new_points)[firsts])
+
+        mesh = mesh.add_triangs(
+            np.vstack([nums[_.triangs] for nums, _ in zip(nodnums, fine)])
+        )
+
+        return mesh.twin()
+
+    def make_data_refiner(self, fine):
+        """Composes the data-refiners of the windows.
+        """
+
+        refiners = [_.meta['data-refiner'] for _ in fine]
+        ncols = max(_.nodes_images.shape[1] for _ in refiners)
+
+        images = [
+            np.repeat(np.arange(self.mesh.npoints)[:, None], ncols, axis=1)
+        ]
+
+        weights = [
+            np.eye(1, ncols).repeat(self.mesh.npoints, axis=0)
+        ]
+
+        for window, refiner in zip(self.windows, refiners):
+
+            new_images, new_weights = _padded_images(refiner, ncols)
+
+            images.append(
+                window.nodnums[new_images[window.mesh.npoints:]]
+            )
+
+            weights.append(
+                new_weights[window.mesh.npoints:]
+            )
+
+        firsts = self.cache['new-nodes-firsts']
+
+        meta = {
+            'nodes-images': np.vstack(
+                [images[0], np.vstack(images[1:])[firsts]]
+            ),
+            'nodes-weights': np.vstack(
+                [weights[0], np.vstack(weights[1:])[firsts]]
+            )
+        }
+
+        return trirefine.DataRefiner(self.mesh, meta)
+
+    def make_new_trees(self, fine):
+        """Trees of the refined windows with the new families renumbered.
+        """
+
+        nfamilies = tritree.gettree(self.mesh).nfamilies
+
+        trees = []
+        famdata = []
+
+        shift = 0
+
+        for tree in [_.meta['amr-tree'] for _ in fine]:
+
+            data = tree.data.copy()
+            data[1, data[1, :] >= nfamilies] += shift
+
+            trees.append(
+                tritree.TriTree(data, tree.hanging, tree.famdata)
+            )
+
+            famdata.append(
+                tree.famdata[:, nfamilies:]
+            )
+
+            shift += famdata[-1].shape[1]
+
+        return trees, np.hstack(famdata)
+
+
+class WindowCollector:
+    """Data-collector of the windowed coarsening.
+
+    Attributes
+    ----------
+    mesh : TriMesh
+        Source triangle mesh.
+    meta : dict
+        Collector meta-data (i).
+
+    Notes
+    -----
+
+    (i) Items of the lists go over the windows.
+
+    """
+
+    def __init__(self, mesh, meta):
+        self.mesh = mesh
+        self.meta = meta
+
+    def __call__(self, data):
+        return self.collect(data)
+
+    @property
+    def root2window(self):
+        """Images of the window nodes on the source mesh, per window.
+        """
+        return self.meta['root2window']
+
+    @property
+    def root2data(self):
+        """Images of the coarse mesh nodes on the source mesh.
+        """
+        return self.meta['root2data']
+
+    @property
+    def window2data(self):
+        """Coarse mesh nodes of the coarsened windows nodes, per window.
+        """
+        return self.meta['window2data']
+
+    @property
+    def window_collectors(self):
+        return self.meta['window-collect']
+
+    def permuted(self, permuter):
+        """Adapts the collector to renumbered nodes of the coarse mesh.
+
+        Parameters
+        ----------
+        permuter : flat-int-array
+            Permutation of the coarse mesh nodes.
+
+        Returns
+        -------
+        WindowCollector
+            New data-collector.
+
+        """
+
+        invperm = np.argsort(permuter)
+
+        new_meta = {
+            'root2data': np.copy(self.root2data[permuter], order='C'),
+            'window2data': [invperm[_] for _ in self.window2data]
+        }
+
+        return self.__class__(
+            self.mesh, self.meta | new_meta
+        )
+
+    def collect(self, data):
+
+        data_new = np.copy(
+            data[self.root2data], order='C'
+        )
+
+        for root2window, window2data, collector in zip(
+            self.root2window, self.window2data, self.window_collectors
+        ):
+            data_new[window2data] = collector(data[root2window])
+
+        return data_new
+
+
+def find_groups(mesh, bodies, ngroups, hanging=None):
+    """Splits the targets into groups with non-touching windows.
+
+    Parameters
+    ----------
+    mesh : TriMesh
+        Input triangle mesh.
+    bodies : int-table
+        Triangles of the targets, one row per target.
+    ngroups : int
+        Maximum number of groups.
+    hanging : flat-bool-array = None
+        Flags of the hanging nodes.
+
+    Returns
+    -------
+    list
+        Pairs of the window triangles and the targets rows, per group.
+
+    Notes
+    -----
+
+    - Clusters are the node-connected parts of the common window.
+    - Clusters are spread over the groups by the number of triangles,
+    largest first, each to the smallest group.
+
+    """
+
+    window = find_window(mesh, bodies.ravel(), hanging)
+
+    if ngroups == 1:
+        return [(window, np.arange(bodies.shape[0]))]
+
+    labels = _cluster_labels(mesh, window)
+
+    sizes = np.bincount(labels)
+    groups = np.zeros(sizes.size, dtype=int)
+
+    loads = np.zeros(min(ngroups, sizes.size), dtype=int)
+
+    for label in np.argsort(-sizes, kind='stable'):
+        groups[label] = np.argmin(loads)
+        loads[groups[label]] += sizes[label]
+
+    trigroups = groups[labels]
+    rowgroups = trigroups[np.searchsorted(window, bodies[:, 0])]
+
+    return [
+        (window[trigroups == k], np.flatnonzero(rowgroups == k))
+        for k in range(loads.size)
+    ]
+
+
+def _cluster_labels(mesh, window):
+    """Labels of the node-connected parts of the window triangles.
+    """
+
+    triangs = mesh.triangs[window]
+
+    _, nodes = np.unique(triangs, return_inverse=True)
+    nodes = nodes.reshape(triangs.shape)
+
+    graph = sp.coo_array(
+        (np.ones(2 * window.size), (
+            np.hstack([nodes[:, 0], nodes[:, 1]]),
+            np.hstack([nodes[:, 1], nodes[:, 2]])
+        )),
+        shape=(nodes.max() + 1,) * 2
+    )
+
+    _, labels = csgraph.connected_components(graph, directed=False)
+    return labels[nodes[:, 0]]
+
+
+def _coarsen_in_worker(mesh, trinums):
+    return tricoarsen.coarsen_mesh(mesh, trinums)
+
+
+def _refine_in_worker(mesh, trinums, depth):
+
+    if depth == 1:
+        return trirefine.refine_mesh(mesh, trinums)
+
+    return multirefine.refine_mesh(mesh, trinums, depth)
+
+
+def _padded_images(refiner, ncols):
+    """Images and weights of a refiner padded to the number of columns.
+    """
+
+    images = refiner.nodes_images
+    weights = refiner.nodes_weights
+
+    if weights is None:
+        weights = np.full(images.shape, 1. / images.shape[1])
+
+    npad = ncols - images.shape[1]
+
+    return (
+        np.hstack([images, images[:, [0] * npad]]),
+        np.hstack([weights, np.zeros((weights.shape[0], npad))])
+    )
+
+
+def find_window(mesh, trinums, hanging=None):
+    """Pads triangles with their vertex neighbors.
+
+    Parameters
+    ----------
+    mesh : TriMesh
+        Input triangle mesh.
+    trinums : flat-int-array
+        Triangles to pad.
+    hanging : flat-bool-array = None
+        Flags of the hanging nodes.
+
+    Returns
+    -------
+    flat-int-array
+        Sorted numbers of the padded triangles.
+
+    Notes
+    -----
+
+    - Neighbors are found by rotating the half-edges around their origins,
+    so the cost scales with the window size, not the mesh size.
+    - Nodes pinching the window edge get their neighbors too, so that the
+    window edge splits into loops.
+    - Hanging nodes on the window edge get their neighbors too, so that
+    the voids pivots keep their ranks.
+
+    """
+
+    halfedges = mesh.halfedges()
+
+    window = _add_rings(
+        halfedges, np.unique(trinums), _halfedges_at(trinums)
+    )
+
+    while True:
+
+        starts = _find_open_nodes(halfedges, window, hanging)
+
+        if starts.size == 0:
+            return window
+
+        window = _add_rings(halfedges, window, starts)
+
+
+def _add_rings(halfedges, window, starts):
+    """Adds triangles around the origins of the half-edges.
+    """
+
+    twins = halfedges.twins
+    nexts = halfedges.nexts
+
+    found = [window]
+
+    for rotate in (_rotate_ccw, _rotate_cw):
+
+        passed = np.unique(starts)
+        edges = starts
+
+        while edges.size > 0:
+
+            edges = rotate(edges, twins, nexts)
+            edges = np.unique(edges[edges >= 0])
+
+            edges = edges[
+                np.isin(edges, passed, assume_unique=True, invert=True)
+            ]
+
+            passed = np.union1d(passed, edges)
+            found.append(edges // 3)
+
+    return np.unique(np.hstack(found))
+
+
+def _find_open_nodes(halfedges, window, hanging):
+    """Edge half-edges starting at pinching or hanging nodes.
+    """
+
+    edges = _halfedges_at(window)
+    twins = halfedges.twins[edges]
+
+    isedge = np.ones(edges.size, dtype=bool)
+    isedge[twins >= 0] = np.isin(
+        twins[twins >= 0] // 3, window, invert=True
+    )
+
+    edges = edges[isedge]
+    origins = halfedges.mesh.triangs.flat[edges]
+
+    _, inds, counts = np.unique(
+        origins, return_inverse=True, return_counts=True
+    )
+
+    isopen = counts[inds] > 1
+
+    if hanging is not None:
+        isopen |= hanging[origins]
+
+    return edges[isopen]
+
+
+def _halfedges_at(trinums):
+    return (3 * trinums[:, None] + np.arange(3)).ravel()
+
+
+def _rotate_ccw(edges, twins, nexts):
+    """Next half-edges with the same origins, in the CCW order.
+    """
+    return twins[nexts[nexts[edges]]]
+
+
+def _rotate_cw(edges, twins, nexts):
+    """Next half-edges with the same origins, in the CW order.
+    """
+
+    twins = twins[edges]
+
+    return np.where(
+        twins >= 0, nexts[np.maximum(twins, 0)], -1
+    )
@@ -6,23 +6,45 @@ from triellipt.fem import femoprs
 from triellipt.utils import pairs, tables
 
 
-def constr_data(mesh, data):
-    """Constrains data on a mesh.
+def sort_mesh(mesh, curve):
+    """Orders a mesh along a space-filling curve.
+
+    Parameters
+    ----------
+    mesh : TriMesh
+        Mesh after refinement or coarsening.
+    curve : str
+        Curve type, "hilbert" or "morton".
+
+    Returns
+    -------
+    TriMesh
+        New mesh with the data transmitters and the tree renumbered.
+
     """
 
-    voids_trinums = mesh.getvoids()
+    new_mesh = mesh.sorted_triangles(curve)
+    triangs_permuter = new_mesh.meta['triangs-permuter']
 
-    if voids_trinums.size == 0:
-        return data
-    voids_triangs = mesh.triangs[voids_trinums, :]
+    new_mesh = new_mesh.sorted_points(curve)
+    permuter = new_mesh.meta['nodes-permuter']
 
-    west, east, pivs = voids_triangs.T
+    transmitters = {
+        k: v.permuted(permuter) for k, v in mesh.meta.items()
+        if k in TRANSMITTERS
+    }
 
-    data[pivs] = 0.5 * (
-        data[west] + data[east]
-    )
+    if 'amr-tree' in mesh.meta:
+        transmitters['amr-tree'] = mesh.meta['amr-tree'].permuted(
+            triangs_permuter, permuter
+        )
 
-    return data.copy('C')
+    return new_mesh.add_meta(transmitters)
+
+
+TRANSMITTERS = (
+    'data-refiner', 'data-collect'
+)
 
 
 def reconnect_nodes(mesh, nodes1, nodes2):
@@ -46,10 +68,32 @@ def clean_twin_voids(mesh):
     """Removes twin voids from a mesh.
     """
 
-    trinums = mesh.getvoids()
+    trinums = find_twin_voids(mesh)
+
+    if trinums.size == 0:
+        return mesh
+    return mesh.deltriangs_at(trinums)
+
+
+def clean_voids_on_edge(mesh, edge):
+    """Removes voids that are on the edge.
+    """
+
+    trinums = find_voids_on_edge(mesh, edge)
 
     if trinums.size == 0:
         return mesh
+    return mesh.deltriangs_at(trinums)
+
+
+def find_twin_voids(mesh):
+    """Finds voids sharing the long edges.
+    """
+
+    trinums = mesh.getvoids()
+
+    if trinums.size == 0:
+        return trinums
 
     codes = pairs.paircols(
         mesh.triangs[trinums, 0:2]
@@ -57,30 +101,20 @@ def clean_twin_voids(mesh):
 
     _, twinums, _ = tables.maptable(codes).atrank(2)
 
-    if twinums.size == 0:
-        return mesh
-
-    return mesh.deltriangs(*trinums[twinums])
+    return trinums[twinums]
 
 
-def clean_voids_on_edge(mesh, edge):
-    """Removes voids that are on the edge.
+def find_voids_on_edge(mesh, edge):
+    """Finds voids with the pivots on the edge.
     """
 
     trinums = mesh.getvoids()
 
     if trinums.size == 0:
-        return mesh
-
-    voids_pivots = mesh.triangs[trinums, 2]
+        return trinums
 
     on_edge = np.isin(
-        voids_pivots, edge.nodnums_unique
+        mesh.triangs[trinums, 2], edge.nodnums_unique
     )
 
-    bad_trinums = trinums[on_edge]
-
-    if bad_trinums.size == 0:
-        return mesh
-
-    return mesh.deltriangs(*bad_trinums)
+    return trinums[on_edge]
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""Tests the FEM matrix factory.
+"""
+import unittest
+import numpy as np
+from triellipt import fem, mesher, amr
+from triellipt.fem import femfactory
+
+
+def generic_factory(unit):
+
+    maker = femfactory.FactoryMaker(unit)
+    maker.set_constraints_status(True)
+
+    ij_meta = femfactory.IJSorter(
+        *unit.ij_stream.ij_tuple
+    ).get_ij_sorted_meta()
+
+    return maker.from_ij_sorted_meta(ij_meta)
+
+
+class TestBinner(unittest.TestCase):
+
+    MESHES = [
+        mesher.trigrid(9, 7, 'east-slope'),
+        mesher.trigrid(9, 7, 'west-slope'),
+        mesher.trigrid(9, 7, 'cross-wise'),
+        mesher.trigrid(9, 7, 'east-snake'),
+        mesher.trilattice(9, 7)
+    ]
+
+    def test_generic(self):
+        """Matches the sorting factory on grid meshes.
+        """
+
+        for mesh in self.MESHES:
+
+            unit = fem.getunit(mesh)
+
+            binned = femfactory.IJBinner(
+                *unit.ij_stream.ij_tuple, unit.mesh_count
+            ).get_ij_sorted_meta()
+
+            assert binned is not None
+
+            factory = unit.fem_factory()
+            generic = generic_factory(unit)
+
+            data = np.random.default_rng(1).random(unit.ij_stream.size)
+
+            matrix, _ = factory(data)
+            matrix_generic, _ = generic(data)
+
+            assert np.array_equal(matrix.indptr, matrix_generic.indptr)
+            assert np.array_equal(matrix.indices, matrix_generic.indices)
+            assert np.array_equal(matrix.data, matrix_generic.data)
+
+    def test_voids(self):
+        """Does not fit the streams of meshes with voids.
+        """
+
+        unit = amr.getunit(mesher.trigrid(5, 5, 'west-slope'))
+        unit = fem.getunit(unit.refine([0]).mesh)
+
+        binner = femfactory.IJBinner(
+            *unit.ij_stream.ij_tuple, unit.mesh_count
+        )
+
+        assert binner.get_ij_sorted_meta() is None
+
+
+if __name__ == '__main__':
+    unittest.main()
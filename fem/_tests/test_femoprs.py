@@ -134,5 +134,26 @@ class TestOprsWithVoids(TestData, unittest.TestCase):
         assert np.all(self.diff_1y[2, :] == 0.)
 
 
+class TestOprsCompact(unittest.TestCase):
+
+    def test_grid(self):
+
+        mesh = mesher.trigrid(5, 4, 'east-snake') * 0.25
+        oprs, shapenums = femoprs.getoprs_compact(mesh)
+
+        assert oprs['massmat'].shape == (4, 9)
+        assert shapenums.size == mesh.ntriangs
+
+        for key, opr in femoprs.getoprs(mesh).items():
+            assert np.all(oprs[key][shapenums] == opr)
+
+    def test_voids(self):
+
+        mesh = mesher.trigrid(2, 2, 'west-snake')
+        mesh = mesh.add_points(0.5).add_triangs([2, 0, 4])
+
+        assert femoprs.getoprs_compact(mesh) == (None, None)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -2,8 +2,9 @@
 """Tests the unit partition.
 """
 import unittest
+import numpy as np
 from triellipt import mesher
-from triellipt.fem import femunit
+from triellipt.fem import femunit, fempartt
 
 
 SPEC_WITH_DIRICHS = {
@@ -12,6 +13,12 @@ SPEC_WITH_DIRICHS = {
     'dirichlet-sides': (1, 3)
 }
 
+SPEC_PHYSICAL = {
+    'name': 'box',
+    'physical': ['bottom', 'right'],
+    'dirichlet-sides': (1,)
+}
+
 SPEC_NO_DIRICHS = {
     'name': 'box',
     'anchors': [(1, 0), (1, 1), (0, 1)],
@@ -70,5 +77,81 @@ class TestParttNoDirichlets(Tester):
         assert self.box.core.tolist() == list(range(25))
 
 
+class TestParttPhysical(Tester):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.UNIT = femunit.getunit(
+            cls.mesh_with_groups(), anchors=[(0, 0)]
+        )
+        cls.UNIT.add_partition(SPEC_PHYSICAL)
+
+    @classmethod
+    def mesh_with_groups(cls):
+
+        mesh = cls.mesh()
+
+        groups = {
+            'bottom': _side_lines(mesh, mesh.points.imag == 0),
+            'right': _side_lines(mesh, mesh.points.real == 1)
+        }
+
+        return mesh.add_meta({'physical-lines': groups})
+
+    def test_edge(self):
+        assert self.box.edge[1].tolist() == [0, 1, 2, 3]
+        assert self.box.edge[2].tolist() == [4, 5, 6, 7, 8]
+        assert self.box.edge[3].tolist() == list(range(9, 16))
+
+    def test_core(self):
+        assert self.box.core.tolist() == list(range(4, 25))
+
+    def test_unknown_group(self):
+        with self.assertRaises(fempartt.FEMParttError):
+            self.UNIT.add_partition(
+                SPEC_PHYSICAL | {'physical': ['left']}
+            )
+
+
+class TestParttPhysicalWrapped(Tester):
+    """Group crossing the loop origin.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.UNIT = femunit.getunit(
+            cls.mesh_with_groups(), anchors=[(0, 0)]
+        )
+        cls.UNIT.add_partition(SPEC_PHYSICAL | {'physical': ['corner']})
+
+    @classmethod
+    def mesh_with_groups(cls):
+
+        mesh = cls.mesh()
+
+        left = (mesh.points.real == 0) & (mesh.points.imag <= 0.5)
+        bottom = (mesh.points.imag == 0) & (mesh.points.real <= 0.5)
+
+        groups = {
+            'corner': np.vstack([
+                _side_lines(mesh, left), _side_lines(mesh, bottom)
+            ])
+        }
+
+        return mesh.add_meta({'physical-lines': groups})
+
+    def test_edge(self):
+        assert self.box.edge[1].tolist() == [14, 15, 0, 1, 2]
+        assert self.box.edge[2].tolist() == list(range(3, 14))
+
+
+def _side_lines(mesh, mask):
+
+    nodes = np.flatnonzero(mask)
+    nodes = nodes[np.argsort(abs(mesh.points[nodes]))]
+
+    return np.column_stack([nodes[:-1], nodes[1:]])
+
+
 if __name__ == '__main__':
     unittest.main()
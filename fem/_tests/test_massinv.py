@@ -94,6 +94,31 @@ class TestWithConstr(Tester):
     def test_has_constraints(self):
         assert self.massdiag_inv.has_constraints is True
 
+    def test_batched(self):
+
+        rho = np.vstack([self.rho, 2. * self.rho]).T
+        sol = self.massdiag_lu(self.rho)
+
+        assert self.allclose(
+            self.massdiag_inv(rho), np.vstack([sol, 2. * sol]).T
+        )
+
+    def test_out(self):
+
+        massinv = self.massdiag_inv
+        out = np.empty_like(self.rho)
+
+        assert massinv(self.rho, out=out) is out
+        assert self.allclose(out, self.massdiag_lu(self.rho))
+
+    def test_inplace(self):
+
+        rho = self.rho
+        sol = self.massdiag_lu(rho)
+
+        assert self.massdiag_inv(rho, out=rho) is rho
+        assert self.allclose(rho, sol)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -171,6 +171,17 @@ class FactoryMaker(UnitAgent):
 
     def make_ij_sorted_meta(self):
 
+        if not self.unit.hasvoids:
+
+            ij_binner = IJBinner(
+                *self.unit.ij_stream.ij_tuple, self.unit.mesh_count
+            )
+
+            ij_meta = ij_binner.get_ij_sorted_meta()
+
+            if ij_meta is not None:
+                return ij_meta
+
         ij_sorter = IJSorter(
             *self.unit.ij_stream.ij_tuple
         )
@@ -464,8 +475,173 @@ class IJSorter:
         }
 
 
+class IJBinner:
+    """Sort-free binner of ij pairs from a nodes map.
+
+    Notes
+    -----
+
+    Works for streams made of three blocks over a nodes map, which link
+    each node to itself, to its ccw-1 and to its ccw-2 neighbors. Rows
+    are padded to a narrow table and sorted in place, entries are then
+    counted into their slots in the stream order, so the cost is linear
+    in the number of nodes and the result is the same as by `IJSorter`.
+
+    """
+
+    MAX_RANK = 16
+
+    def __init__(self, i_stream, j_stream, npoints):
+        self.i_stream = i_stream
+        self.j_stream = j_stream
+        self.npoints = npoints
+        self.cache = {}
+
+    @property
+    def blocksize(self):
+        return self.i_stream.size // 3
+
+    @property
+    def rownums(self):
+        return self.i_stream[:self.blocksize]
+
+    @property
+    def colnums1(self):
+        return self.j_stream[self.blocksize:2 * self.blocksize]
+
+    @property
+    def colnums2(self):
+        return self.j_stream[2 * self.blocksize:]
+
+    def get_ij_sorted_meta(self):
+        """Returns ij-binned metadata, None if the stream does not fit.
+        """
+
+        if not self.isnodal():
+            return None
+
+        table = self.make_table()
+        slots = self.make_slots(table)
+
+        return self.from_slots(slots)
+
+    def isnodal(self):
+
+        if self.i_stream.size != 3 * self.blocksize:
+            return False
+
+        rows = self.rownums
+        size = self.blocksize
+
+        if np.any(rows[1:] < rows[:-1]):
+            return False
+
+        if not np.array_equal(rows, self.i_stream[size:2 * size]):
+            return False
+        if not np.array_equal(rows, self.i_stream[2 * size:]):
+            return False
+
+        ranks = np.bincount(rows, minlength=self.npoints)
+        self.cache['ranks'] = ranks
+
+        return ranks.max(initial=0) <= self.MAX_RANK
+
+    def make_table(self):
+        """Pads the columns of each row to a table.
+        """
+
+        ranks = self.cache['ranks']
+        width = ranks.max(initial=0)
+
+        rows = self.rownums
+        locs = np.arange(rows.size) - (np.cumsum(ranks) - ranks)[rows]
+
+        table = np.full((self.npoints, 1 + 2 * width), self.npoints)
+        table[:, 0] = np.arange(self.npoints)
+
+        cells = rows * table.shape[1] + locs + 1
+        self.cache['locs'] = locs
+
+        np.ravel(table)[cells] = self.colnums1
+        np.ravel(table)[cells + width] = self.colnums2
+
+        self.cache['cells'] = (cells, cells + width)
+        return table
+
+    def make_slots(self, table):
+        """Finds the slots of the entries in the compressed pattern.
+        """
+
+        order = np.argsort(table, axis=1)
+        table_sorted = np.take_along_axis(table, order, axis=1)
+
+        fronts = np.ones(table.shape, dtype=bool)
+        fronts[:, 1:] = table_sorted[:, 1:] != table_sorted[:, :-1]
+        fronts &= table_sorted < self.npoints
+
+        slots_sorted = np.cumsum(fronts).reshape(table.shape) - 1
+
+        slots_table = np.empty_like(slots_sorted)
+        np.put_along_axis(slots_table, order, slots_sorted, axis=1)
+
+        self.cache['ij-tuple'] = (
+            np.repeat(np.arange(self.npoints), fronts.sum(axis=1)),
+            table_sorted[fronts]
+        )
+
+        return self.gather_slots(slots_table)
+
+    def gather_slots(self, slots_table):
+
+        size = self.blocksize
+        slots = np.empty(3 * size, dtype=int)
+
+        cells1, cells2 = self.cache['cells']
+
+        np.take(slots_table[:, 0], self.rownums, out=slots[:size])
+        np.take(slots_table, cells1, out=slots[size:2 * size])
+        np.take(slots_table, cells2, out=slots[2 * size:])
+
+        return slots
+
+    def from_slots(self, slots):
+        """Groups entries by slots in the stream order, None on repeats.
+        """
+
+        nslots = self.cache['ij-tuple'][0].size
+        slots0, slots1, slots2 = np.split(slots, 3)
+
+        counts1 = np.bincount(slots1, minlength=nslots)
+        counts2 = np.bincount(slots2, minlength=nslots)
+
+        if max(counts1.max(initial=0), counts2.max(initial=0)) > 1:
+            return None
+
+        ranks = self.cache['ranks']
+
+        counts = counts1 + counts2
+        counts[slots0[self.cache['locs'] == 0]] += ranks[ranks > 0]
+
+        fronts = np.cumsum(counts) - counts
+
+        size = self.blocksize
+        data_perm = np.empty_like(slots)
+
+        data_perm[fronts[slots0] + self.cache['locs']] = np.arange(size)
+        data_perm[fronts[slots1]] = np.arange(size, 2 * size)
+        data_perm[fronts[slots2] + counts1[slots2]] = np.arange(
+            2 * size, 3 * size
+        )
+
+        return {
+            'ij-tuple': self.cache['ij-tuple'],
+            'data-perm': data_perm,
+            'bins-reduce': fronts
+        }
+
+
 def _sort_data(data):
-    sorter = np.argsort(data).astype(int)
+    sorter = np.argsort(data, kind='stable').astype(int)
     return data[sorter], sorter
 
 
@@ -4,6 +4,8 @@
 import numpy as np
 
 
+MAX_SHAPES = 8
+
 FEMOPRS = [
     'massmat',
     'massdig',
@@ -29,6 +31,43 @@ def getoprs(mesh) -> dict:
     }
 
 
+def getoprs_compact(mesh):
+    """Returns basic FEM operators per triangle shape.
+
+    Parameters
+    ----------
+    mesh : TriMesh
+        Triangular mesh.
+
+    Returns
+    -------
+    dict
+        FEM operators over the distinct shapes, None if not compact (i).
+    flat-int-array
+        Shape numbers of the mesh triangles, None if not compact.
+
+    Notes
+    -----
+
+    (i) Mesh is compact, if it has no voids and all triangles are the
+    translations of at most `MAX_SHAPES` triangles, e.g. a grid mesh.
+
+    """
+
+    shapes = ShapesFinder.from_mesh(mesh).find_shapes()
+
+    if shapes is None:
+        return None, None
+
+    trinums, shapenums = shapes
+
+    submesh = mesh.update_triangs(
+        mesh.triangs[trinums]
+    )
+
+    return getoprs(submesh), shapenums
+
+
 def mesh_grad(mesh):
     """Returns the mesh gradient operator.
 
@@ -273,6 +312,45 @@ class MetricMaker(MeshAgent):
         }
 
 
+class ShapesFinder(MeshAgent):
+    """Finds triangles equal up to a translation.
+    """
+
+    def find_shapes(self, max_shapes=MAX_SHAPES):
+        """Returns sample triangles and shape numbers, None if too many.
+        """
+
+        if self.mesh.hasvoids():
+            return None
+
+        deltas = np.diff(
+            self.vertices[:, [0, 1, 2, 0]], axis=1
+        )
+
+        if _count_rows(deltas[:8 * max_shapes]) > max_shapes:
+            return None
+
+        shapenums = np.full(self.mesh.ntriangs, -1)
+        trinums = []
+
+        while len(trinums) < max_shapes:
+
+            first = np.argmax(shapenums < 0)
+
+            if shapenums[first] >= 0:
+                break
+
+            same = np.all(deltas == deltas[first], axis=1)
+
+            shapenums[same] = len(trinums)
+            trinums.append(first)
+
+        if np.any(shapenums < 0):
+            return None
+
+        return np.array(trinums), shapenums
+
+
 class MetricAgent:
     """Operator on a mesh metric.
     """
@@ -526,6 +604,12 @@ class TriGrad:
         )
 
 
+def _count_rows(data2d):
+    return len(
+        {row.tobytes() for row in data2d}
+    )
+
+
 def _mono_matrix(data):
     return np.repeat(data, 3, axis=1)
 
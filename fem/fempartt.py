@@ -91,7 +91,10 @@ class UnitPartter(UnitAgent):
 
     def make_edges(self):
 
-        sides = self.split_loops()
+        if 'physical' in self.cache['spec']:
+            sides = self.split_loops_physical()
+        else:
+            sides = self.split_loops()
 
         return {
             i + 1: v for i, v in enumerate(sides)
@@ -126,6 +129,88 @@ class UnitPartter(UnitAgent):
 
         return nodenums[closestinds]
 
+    def split_loops_physical(self):
+        """Splits loops into sections by physical groups of the root mesh.
+
+        Notes
+        -----
+
+        - A node belongs to the group of the edge starting at it, the end
+        node of a group goes to the group, if the next edge is uncovered.
+        - Loops are rolled to start at a section boundary, so that groups
+        crossing the loop origin make one ordered section.
+
+        """
+
+        loops = [self.owned_loop(loop) for loop in self.unit.loops]
+
+        nodes = np.hstack([nodes for nodes, _ in loops])
+        owners = np.hstack([owners for _, owners in loops])
+
+        sides = [
+            nodes[owners == i + 1] for i in range(len(self.physical_names))
+        ]
+
+        if np.any(owners == 0):
+            sides.append(nodes[owners == 0])
+
+        return sides
+
+    def owned_loop(self, loop):
+        """Nodes of a loop with their groups, rolled to a group start.
+        """
+
+        owners = self.find_owners(
+            _edge_keys(loop.nodnums1, loop.nodnums2, self.unit.mesh_count)
+        )
+
+        prevs = np.roll(owners, 1)
+        owners = np.where((owners == 0) & (prevs > 0), prevs, owners)
+
+        starts = np.flatnonzero(owners != np.roll(owners, 1))
+        shift = starts[0] if starts.size > 0 else 0
+
+        return (
+            np.roll(loop.nodnums1, -shift), np.roll(owners, -shift)
+        )
+
+    def find_owners(self, loops_keys):
+
+        owners = np.zeros(loops_keys.size, dtype=int)
+
+        for i, lines in enumerate(self.get_physical_lines()):
+
+            keys = _edge_keys(*lines.T, self.unit.mesh_count)
+            owners[np.isin(loops_keys, keys)] = i + 1
+
+        return owners
+
+    def get_physical_lines(self):
+        """Physical lines in terms of the unit nodes.
+        """
+
+        groups = self.unit.perm.mesh.meta.get('physical-lines')
+
+        if not groups:
+            raise FEMParttError(
+                "parent mesh has no physical lines"
+            )
+
+        for name in self.physical_names:
+            if name not in groups:
+                raise FEMParttError(
+                    f"no physical group '{name}' in the parent mesh"
+                )
+
+        return [
+            self.unit.perm.perm_inv[groups[name]]
+            for name in self.physical_names
+        ]
+
+    @property
+    def physical_names(self):
+        return self.cache['spec']['physical']
+
     @property
     def loops_as_arrays(self):
         return [
@@ -285,5 +370,9 @@ class FEMPartt(DataPartt):
         return self.unit.mesh.points2d[:, self[key]]
 
 
+def _edge_keys(nodes1, nodes2, count):
+    return np.minimum(nodes1, nodes2) * count + np.maximum(nodes1, nodes2)
+
+
 def _find_closest(points, anchor):
     return np.argmin(abs(points - anchor))
@@ -362,6 +362,19 @@ class FEMUnit(FEMRoot):
         self
             Unit with the partition added.
 
+        Notes
+        -----
+
+        The specification has the keys:
+
+        - "name" is the partition name
+        - "dirichlet-sides" lists the edge sections with constraints
+        - "anchors" gives `(float, float)` points splitting the loops, or
+        - "physical" gives names of physical groups of the parent mesh
+
+        With "physical", edge sections are numbered in the order of names.
+        Boundary edges outside the groups, if any, make the last section.
+
         """
 
         self.set_partition(
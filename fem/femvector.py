@@ -156,20 +156,22 @@ class VectorFEM(VectorData):
         self.body[indexer] = data
 
 
-def constr_data(mesh, data):
+def constr_data(mesh, data, out=None):
     """Constrains data on a mesh.
-    """
-
-    voids_trinums = mesh.getvoids()
 
-    if voids_trinums.size == 0:
-        return data
-    voids_triangs = mesh.triangs[voids_trinums, :]
+    Parameters
+    ----------
+    mesh : TriMesh
+        Mesh with the hanging nodes.
+    data : float-flat-array
+        Data on the mesh nodes.
+    out : float-flat-array = None
+        Output array, can be the data itself.
 
-    west, east, pivs = voids_triangs.T
+    Returns
+    -------
+    float-flat-array
+        Constrained data, a new array if `out` is None.
 
-    data[pivs] = 0.5 * (
-        data[west] + data[east]
-    )
-
-    return data.copy('C')
+    """
+    return mesh.constraints().apply(data, out)
@@ -12,6 +12,16 @@ def getmassinv(unit):
 
 class MassDiagInv:
     """Inverse of a lumped-mass matrix.
+
+    Notes
+    -----
+
+    - Nodes free of constraints are solved in a single pass, by scaling
+    the data with the inverse diagonal.
+    - Constrained nodes are then solved by the LU-factors of their block.
+    - The scaling vector is built once, the output can be preallocated
+    or be the data itself.
+
     """
 
     def __init__(self, unit=None, meta=None):
@@ -23,67 +33,76 @@ class MassDiagInv:
     def has_constraints(self):
         return self.meta['has-constraints']
 
-    def __call__(self, data):
-        return self.solve(data)
+    def __call__(self, data, out=None):
+        return self.solve(data, out)
 
-    def solve(self, data):
-        if self.has_constraints is False:
-            return self.solve_no_constraints(data)
-        return self.solve_with_constraints(data)
+    def solve(self, data, out=None):
+        """Applies the inverse mass.
 
-    def solve_with_constraints(self, data):
+        Parameters
+        ----------
+        data : flat-float-array | float-table
+            Data on the mesh nodes, flat or with columns of samples.
+        out : flat-float-array | float-table = None
+            Output of the same layout, if None a new array is created.
 
-        self.perm_data(data)
-        self.find_solution()
-        self.perm_solution()
+        Returns
+        -------
+        flat-float-array | float-table
+            Solution, `out` if given.
 
-        _ = self.push_solution()
-        return _
-
-    def push_solution(self):
+        """
 
-        _ = self.cache['sol-permuted']
-        self.cache.clear()
+        if out is None:
+            out = np.empty_like(data, order='C')
 
-        return np.copy(
-            _, order='C'
+        scale = self.scale.reshape(
+            (-1,) + (1,) * (np.ndim(data) - 1)
         )
 
-    def perm_data(self, data):
-        self.cache['data-permuted'] = data[self.meta['perm']]
+        if self.has_constraints is False:
+            return np.multiply(data, scale, out=out)
 
-    def find_solution(self):
+        # Taken before scaling, since the output can be the data itself.
+        rhs = data[self.constr_nodes]
 
-        self.solve_mass_diag_only()
-        self.solve_mass_with_constr()
+        np.multiply(data, scale, out=out)
+        out[self.constr_nodes] = self.meta['constr-lu'].solve(rhs)
 
-        self.cache['sol'] = np.hstack(
-            [self.cache['sol-diag'], self.cache['sol-constr']]
-        )
+        return out
+
+    def solve_with_constraints(self, data):
+        return self.solve(data)
 
-    def perm_solution(self):
-        _ = self.cache['sol'][self.meta['perm-inv']]
-        self.cache['sol-permuted'] = _
+    def solve_no_constraints(self, data):
+        return self.solve(data)
 
-    def solve_mass_diag_only(self):
+    @property
+    def scale(self):
+        """Inverse diagonal, zero on the constrained nodes.
+        """
 
-        mass = self.meta['mass-diag']
-        data = self.cache['data-permuted'][:self.diag_size]
+        if 'scale' not in self.cache:
+            self.cache['scale'] = self.make_scale()
+        return self.cache['scale']
 
-        self.cache['sol-diag'] = data / mass
+    @property
+    def constr_nodes(self):
+        return self.meta['perm'][self.diag_size:]
 
-    def solve_mass_with_constr(self):
+    def make_scale(self):
 
-        mass = self.meta['constr-lu']
-        data = self.cache['data-permuted'][self.diag_size:]
+        if self.has_constraints is False:
+            return 1. / self.meta['mass-diag']
 
-        self.cache['sol-constr'] = mass.solve(data)
+        scale = np.zeros(self.meta['perm'].size)
 
-    def solve_no_constraints(self, data):
-        return np.copy(
-            data / self.meta['mass-diag'], order='C'
+        scale[self.meta['perm'][:self.diag_size]] = (
+            1. / self.meta['mass-diag']
         )
 
+        return scale
+
     @property
     def diag_size(self):
         return self.meta['mass-diag'].size
@@ -156,7 +175,6 @@ class MakerMassInv:
     def make_massinv_meta(self):
         return {
             'perm': self.perm,
-            'perm-inv': self.perm_inv,
             'mass-diag': self.mass_diag_only,
             'constr-lu': self.mass_with_constr_lu,
             'has-constraints': True
@@ -213,10 +231,6 @@ class MakerMassInv:
     def dsize(self):
         return self.cache['perm-meta']['diagsize']
 
-    @property
-    def perm_inv(self):
-        return np.argsort(self.perm)
-
     def make_pattern_mask(self):
 
         mask = np.sum(
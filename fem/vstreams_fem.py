@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """Stream of matrix entries (FEM).
 """
+import copy
 import numpy as np
 from triellipt.fem import femoprs
 
@@ -36,13 +37,17 @@ class _StreamOprs(SkelAgent):
     """
 
     def fetch_meta(self):
+
+        oprs, shapenums = femoprs.getoprs_compact(self.skel.mesh)
+
+        if oprs is None:
+            oprs = femoprs.getoprs(self.skel.mesh)
+
         return {
-            'fem-oprs': self.fetch_fem_oprs()
+            'fem-oprs': oprs,
+            'shape-nums': shapenums
         }
 
-    def fetch_fem_oprs(self):
-        return femoprs.getoprs(self.skel.mesh)
-
     @property
     def massmat(self):
         return self.meta['fem-oprs']['massmat']
@@ -141,7 +146,15 @@ class StreamOprs(_StreamOprs):
 
     @property
     def stream_opr(self):
-        return StreamOpr.from_skel(self.skel)
+        """Streamer shared by all operators to reuse data indices.
+        """
+
+        if 'stream-opr' not in self.cache:
+            self.cache['stream-opr'] = StreamOpr.from_skel(
+                self.skel
+            ).with_shapes(self.meta['shape-nums'])
+
+        return self.cache['stream-opr']
 
 
 class StreamOpr(SkelAgent):
@@ -151,9 +164,19 @@ class StreamOpr(SkelAgent):
     def __init__(self, skel):
         super().__init__(skel)
         self.opr = None
+        self.shapenums = None
 
     def with_opr(self, opr):
-        self.opr = opr
+        """Returns a streamer of the operator sharing the cache.
+        """
+        streamer = copy.copy(self)
+        streamer.opr = opr
+        return streamer
+
+    def with_shapes(self, shapenums):
+        """Sets shape numbers of triangles for compact operators.
+        """
+        self.shapenums = shapenums
         return self
 
     def get_stream(self):
@@ -170,7 +193,7 @@ class StreamOpr(SkelAgent):
         )
 
     def get_stream_from_nodes(self):
-        return self.stream_from_map(self.nodesmap)
+        return self.stream_from_map('nodesmap')
 
     def get_stream_from_voids(self):
 
@@ -184,9 +207,9 @@ class StreamOpr(SkelAgent):
 
     def stream_west(self):
 
-        west = self.stream_from_map(self.westmap)
-        core = self.stream_from_map(self.coremap)
-        east = self.stream_from_map(self.eastmap)
+        west = self.stream_from_map('westmap')
+        core = self.stream_from_map('coremap')
+        east = self.stream_from_map('eastmap')
 
         return VStream.from_data_train(
             0.5 * west.data, 0.5 * core.data, 0.5 * east.data
@@ -194,34 +217,50 @@ class StreamOpr(SkelAgent):
 
     def stream_east(self):
 
-        west = self.stream_from_map(self.westmap)
-        core = self.stream_from_map(self.coremap)
-        east = self.stream_from_map(self.eastmap)
+        west = self.stream_from_map('westmap')
+        core = self.stream_from_map('coremap')
+        east = self.stream_from_map('eastmap')
 
         return VStream.from_data_train(
             0.5 * west.data, 0.5 * core.data, 0.5 * east.data
         )
 
-    def stream_from_map(self, srcmap):
+    def stream_from_map(self, mapname):
+        return VStream.from_data(
+            np.ravel(self.opr)[self.get_map_index(mapname)]
+        )
+
+    def get_map_index(self, mapname):
+        """Indices of the map entries in operators, cached per map name.
+        """
 
-        from_node_self = self.opr.flat[
-            9 * srcmap.trinums + 3 * srcmap.locnums + srcmap.locnums
-        ]
+        key = ('map-index', mapname)
 
-        from_node_ccw1 = self.opr.flat[
-            9 * srcmap.trinums + 3 * srcmap.locnums + srcmap.locnums1
-        ]
+        if key not in self.cache:
+            self.cache[key] = self.make_map_index(
+                getattr(self, mapname)
+            )
 
-        from_node_ccw2 = self.opr.flat[
-            9 * srcmap.trinums + 3 * srcmap.locnums + srcmap.locnums2
-        ]
+        return self.cache[key]
 
-        return VStream.from_data_train(
-            from_node_self, from_node_ccw1, from_node_ccw2
-        )
+    def make_map_index(self, srcmap):
+
+        trinums = srcmap.trinums
+
+        if self.shapenums is not None:
+            trinums = self.shapenums[trinums]
+
+        shift = 9 * trinums + 3 * srcmap.locnums
+
+        return np.hstack([
+            shift + srcmap.locnums,
+            shift + srcmap.locnums1,
+            shift + srcmap.locnums2
+        ])
 
     def set_voids_submaps(self):
-        self.cache |= self.skel.voids_submaps()
+        if 'westmap' not in self.cache:
+            self.cache |= self.skel.voids_submaps()
 
     @property
     def westmap(self):
@@ -2,6 +2,7 @@
 """Tests curves.
 """
 import unittest
+import numpy as np
 from triellipt import geom
 
 
@@ -24,6 +25,20 @@ class TestCurve(unittest.TestCase):
     def test_length(self):
         assert geom.line(0j, 1j).length() == 1.
 
+    def test_getderiv(self):
+
+        args = np.linspace(0.1, 0.9, 5)
+
+        for curve in self.curves():
+
+            fdiff = (
+                curve.getpath(*(args + 1e-6)) - curve.getpath(*(args - 1e-6))
+            )
+
+            assert np.allclose(
+                curve.getderiv(*args), fdiff / 2e-6, atol=1e-6
+            )
+
     def curves(self):
         """Defines curves to test.
         """
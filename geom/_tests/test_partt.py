@@ -7,14 +7,13 @@ from triellipt import geom
 from triellipt.geom import partt
 
 
-class TestCurvePartt(unittest.TestCase):
+class TestCurvesPartt(unittest.TestCase):
 
     def test_find_args(self):
 
-        args = self.find_args()
+        owners, args = self.find_args()
 
-        assert args[+0] == 0.
-        assert args[-1] == 1.
+        assert owners.tolist() == 4 * [0] + 2 * [1]
 
         assert np.all(
             (args > 0.) @ (args < 1.)
@@ -22,45 +21,54 @@ class TestCurvePartt(unittest.TestCase):
 
     def find_args(self):
 
-        args = self.prttn.find_args(
-            nparts=5, ratio=1, nseeds=100
+        lenmap = self.prttn.get_lenmap(rtol=1e-8, maxitr=10)
+
+        return self.prttn.find_args(
+            lenmap, params=[(5, 1), (3, 2)]
         )
 
-        return args
+    def test_line_args(self):
+        _, args = self.find_args()
+        assert np.allclose(args[:4], [0.2, 0.4, 0.6, 0.8])
+
+    def test_partitions(self):
 
-    def test_length_from_linspace(self):
-        assert self.prttn.length_from_linspace(2) == 1.
+        path1, path2 = self.prttn.get_partitions([(2, 1), (1, 1)])
 
-    def test_lenfunc_from_linspace(self):
-        assert self.prttn.lenfunc_from_linspace(2).tolist() == [0.5, 1.]
+        assert np.allclose(path1, [0j, 0.5j, 1j])
+        assert np.allclose(path2, [0j, 2.])
 
     @property
     def prttn(self):
-        return partt.CurvePartt(
-            curve=geom.line(0j, 1j)
+        return partt.CurvesPartt.from_curves(
+            geom.line(0j, 1j), geom.bezier2(0j, 1j, 2.)
         )
 
+
 class TestLenEstim(unittest.TestCase):
 
-    def test_get_length(self):
-        assert isinstance(
-            self.get_length(), float
+    def test_get_lengths(self):
+        assert np.allclose(
+            self.get_lengths(), [1., np.pi]
         )
 
-    def test_get_nseeds(self):
-        assert isinstance(
-            self.get_nseeds(), int
-        )
+    def test_lenmap(self):
 
-    def get_length(self):
-        return partt.LenEstim(self.line).get_length(rtol=1e-4, maxitr=10)
+        lenmap = self.estim.get_lenmap(rtol=1e-8, maxitr=10)
 
-    def get_nseeds(self):
-        return partt.LenEstim(self.line).get_nseeds(rtol=1e-4, maxitr=10)
+        assert np.all(np.diff(lenmap.owners) >= 0)
+        assert np.allclose(
+            lenmap.offsets[lenmap.owners == 0], [0., .25, .5, .75]
+        )
+
+    def get_lengths(self):
+        return self.estim.get_lengths(rtol=1e-8, maxitr=10)
 
     @property
-    def line(self):
-        return geom.line(0j, 1j)
+    def estim(self):
+        return partt.LenEstim.from_curves(
+            geom.line(0j, 1j), geom.elliparc((0, 0), (1, 1), (0, np.pi))
+        )
 
 
 if __name__ == '__main__':
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """Curves classes.
 """
+import math
 from abc import ABC, abstractmethod
 import numpy as np
 from triellipt.geom import partt
@@ -35,6 +36,48 @@ class Curve(ABC):
         """Picks points on the curve for a given parameters array. 
         """
 
+    def getderiv(self, *args):
+        """Computes the curve derivative.
+
+        Parameters
+        ----------
+        args : *float
+            Parameters in [0, 1].
+
+        Returns
+        -------
+        flat-complex-array
+            Derivatives at the parameters.
+
+        """
+        return self._getderiv(np.array(args, dtype=float))
+
+    def _getderiv(self, args):
+        return self.batch_derivs(
+            [self], np.zeros(args.shape, dtype=int), args
+        )
+
+    @classmethod
+    @abstractmethod
+    def batch_derivs(cls, curves, owners, args):
+        """Derivatives of several curves of the same class.
+
+        Parameters
+        ----------
+        curves : list
+            Curves of the class.
+        owners : flat-int-array
+            Curve numbers in the list.
+        args : flat-float-array
+            Parameters on the owner curves.
+
+        Returns
+        -------
+        flat-complex-array
+            Derivatives at the parameters.
+
+        """
+
     def linspace(self, nparts):
         """Splits the curve uniformly in the parameter space.
 
@@ -70,16 +113,16 @@ class Curve(ABC):
 
         """
 
-        ratio = ratio if ratio > 0. else 1.
-        nseeds = partt.LenEstim(self).get_nseeds(rtol=1e-4, maxitr=10)
+        paths = partt.CurvesPartt.from_curves(self).get_partitions(
+            [(nparts, ratio)]
+        )
 
-        if nseeds is None:
+        if paths is None:
             raise CurveError(
                 "cannot estimate the length, split the curve"
             )
 
-        partter = partt.CurvePartt(self)
-        return partter.get_partition(nparts, ratio, nseeds)
+        return paths[0]
 
     def length(self, *, places=4, maxitr=10):
         """Estimates the curve length iteratively.
@@ -99,10 +142,10 @@ class Curve(ABC):
         """
 
         rtol = pow(10, -places)
-        length = partt.LenEstim(self).get_length(rtol, maxitr)
+        lengths = partt.LenEstim.from_curves(self).get_lengths(rtol, maxitr)
 
-        if length is not None:
-            return length
+        if lengths is not None:
+            return lengths[0].item()
 
         raise CurveError(
             "cannot estimate the length, maximum iteration reached"
@@ -133,6 +176,21 @@ class Line(Curve):
     def _getpath(self, args):
         return (1. - args) * self.startpoint + args * self.endpoint
 
+    def length(self, *, places=4, maxitr=10):
+        """Returns the exact line length.
+        """
+        return float(abs(self.endpoint - self.startpoint))
+
+    @classmethod
+    def batch_derivs(cls, curves, owners, args):
+
+        chords = np.array(
+            [curve.endpoint - curve.startpoint for curve in curves],
+            dtype=complex
+        )
+
+        return chords.reshape(-1)[owners] + np.zeros(args.shape)
+
 
 class EllipArc(Curve):
     """Elliptic arc.
@@ -164,6 +222,22 @@ class EllipArc(Curve):
     def linphi(self, args):
         return (1. - args) * self.phis[0] + args * self.phis[1]
 
+    @classmethod
+    def batch_derivs(cls, curves, owners, args):
+
+        data = np.array([
+            [*curve.axes, *curve.phis, curve.tilt] for curve in curves
+        ])[owners]
+
+        axes1, axes2, phis1, phis2, tilts = data.T
+
+        phi = (1. - args) * phis1 + args * phis2
+
+        phase1 = 0.5 * (axes1 + axes2) * np.exp(+1j * phi)
+        phase2 = 0.5 * (axes1 - axes2) * np.exp(-1j * phi)
+
+        return 1j * (phis2 - phis1) * (phase1 - phase2) * np.exp(1j * tilts)
+
     @property
     def center(self):
         return self.o_xy[0] + self.o_xy[1] * 1j
@@ -200,6 +274,30 @@ class Hyperb(Curve):
 
         return xpos + 1j * ypos
 
+    @classmethod
+    def batch_derivs(cls, curves, owners, args):
+
+        data = np.array([
+            [curve.alfa, curve.ksi0, *curve.ksis, *curve.etas]
+            for curve in curves
+        ])[owners]
+
+        alfa, ksi0, ksis1, ksis2, etas1, etas2 = data.T
+
+        dksi = ksi0 * (ksis2 - ksis1)
+        deta = etas2 - etas1
+
+        ksis = ksi0 * (ksis1 + args * (ksis2 - ksis1))
+        etas = etas1 + args * deta
+
+        sqrt_eta = np.sqrt(1 + etas * etas)
+        sqrt_ksi = np.sqrt(1 - ksis * ksis)
+
+        xder = dksi * sqrt_eta + ksis * etas * deta / sqrt_eta
+        yder = deta * sqrt_ksi - etas * ksis * dksi / sqrt_ksi
+
+        return alfa * (xder + 1j * yder)
+
     @property
     def aval(self):
         return self.axes[0]
@@ -245,6 +343,27 @@ class Bezier(Curve):
 
         return westchord * (1. - args) + eastchord * args
 
+    @classmethod
+    def batch_derivs(cls, curves, owners, args):
+        """Derivatives via the Bernstein form of the hodograph.
+        """
+
+        points = np.array(
+            [curve.points for curve in curves], dtype=complex
+        ).reshape(len(curves), -1)[owners]
+
+        degree = points.shape[1] - 1
+        deltas = degree * np.diff(points, axis=1)
+
+        derivs = np.zeros(args.shape, dtype=complex)
+
+        for i in range(degree):
+            derivs += deltas[:, i] * math.comb(degree - 1, i) * (
+                args**i * (1. - args)**(degree - 1 - i)
+            )
+
+        return derivs
+
     @abstractmethod
     def getwestchord(self):
         """Returns the west curve in a linear combination.
@@ -4,6 +4,7 @@
 import itertools as itr
 import numpy as np
 from triellipt.geom import dump
+from triellipt.geom import partt
 
 CurvesLoopError = type(
     'CurvesLoopError', (Exception,), {}
@@ -120,11 +121,18 @@ class CurvesLoop:
         if len(params) == 0:
             return np.array([], dtype=complex)
 
-        args = self.zip_partition_args(*params)
+        curves, params = zip(
+            *self.zip_partition_args(*params)
+        )
 
-        paths = [
-            curve.partition(*params) for curve, params in args
-        ]
+        paths = partt.CurvesPartt(curves).get_partitions(
+            [_partt_params(*args) for args in params]
+        )
+
+        if paths is None:
+            raise CurvesLoopError(
+                "cannot estimate the lengths, split the curves"
+            )
 
         paths = [
             path[:-1] for path in paths
@@ -293,6 +301,10 @@ class PathMap:
         return _CycleColor.from_colors(self.colors)
 
 
+def _partt_params(nparts, ratio=1):
+    return nparts, ratio
+
+
 class _CycleColor:
 
     COLOR = np.dtype(
@@ -1,143 +1,332 @@
 # -*- coding: utf-8 -*-
-"""Curve partition.
+"""Curves partition.
 """
 import numpy as np
 
+GAUSS_NODES, GAUSS_WEIGHTS = np.polynomial.legendre.leggauss(5)
+
+
+class CurvesAgent:
+    """Operator on a batch of curves.
+
+    Notes
+    -----
+
+    Curves are evaluated by classes, i.e. one call per curves class.
 
-class CurveAgent:
-    """Operator on a curve.
     """
 
-    def __init__(self, curve):
-        self.curve = curve
+    NSTART = 4
+    NEWTON = 3
+
+    def __init__(self, curves=None):
+        self.curves = curves
+        self.groups = _group_by_class(curves)
 
-    def lenfunc_from_linspace(self, nseeds):
+    @classmethod
+    def from_curves(cls, *curves):
+        return cls(curves)
 
-        path = self.curve.linspace(nseeds)
-        pins = np.abs(np.diff(path))
+    @property
+    def ncurves(self):
+        return len(self.curves)
 
-        return np.add.accumulate(pins)
+    def derivs(self, owners, args):
+        """Derivatives of curves at their parameters.
+        """
+
+        groups, ranks, classes = self.groups
+
+        derivs = np.empty(args.shape, dtype=complex)
 
-    def length_from_linspace(self, nseeds):
+        for num, curves in enumerate(classes):
 
-        path = self.curve.linspace(nseeds)
-        pins = np.abs(np.diff(path))
+            mask = groups[owners] == num
 
-        return np.sum(pins)
+            derivs[mask] = type(curves[0]).batch_derivs(
+                curves, ranks[owners[mask]], args[mask]
+            )
 
+        return derivs
+
+    def gauss_lengths(self, owners, starts, ends):
+        """Lengths of curve pieces by the Gauss-Legendre quadrature.
+        """
 
-class CurvePartt(CurveAgent):
-    """Curve partitioner.
+        halfs = 0.5 * (ends - starts)
+        mids = 0.5 * (ends + starts)
+
+        args = mids[:, None] + halfs[:, None] * GAUSS_NODES
+
+        speeds = abs(
+            self.derivs(np.repeat(owners, GAUSS_NODES.size), args.ravel())
+        )
+
+        return halfs * (
+            speeds.reshape(args.shape) @ GAUSS_WEIGHTS
+        )
+
+
+class LenEstim(CurvesAgent):
+    """Curves length estimator.
     """
 
-    def get_partition(self, nparts, ratio, nseeds):
-        """Returns the curve partition as a complex-flat-array.
+    def get_lengths(self, rtol, maxitr):
+        """Returns lengths of curves, None if not resolved.
+        """
+
+        lenmap = self.get_lenmap(rtol, maxitr)
+
+        if lenmap is None:
+            return None
+
+        return lenmap.totals
+
+    def get_lenmap(self, rtol, maxitr):
+        """Returns the length map, None if not resolved.
+
+        Notes
+        -----
+
+        Pieces are split in halves, until the halves sum up to the whole.
+        Pieces resolved within the tolerance are not evaluated again.
+
         """
 
-        args = self.find_args(nparts, ratio, nseeds)
-        path = self.from_args(args)
+        lenmap = LenMap.from_uniform(self.ncurves, self.NSTART)
+        lenmap.lens = self.gauss_lengths(*lenmap.pieces)
+
+        for _ in range(maxitr):
 
-        return path
+            owners, starts, ends = lenmap.pieces
+            mids = 0.5 * (starts + ends)
 
-    def from_args(self, args):
-        return self.curve.getpath(*args)
+            west = self.gauss_lengths(owners, starts, mids)
+            east = self.gauss_lengths(owners, mids, ends)
 
-    def find_args(self, nparts, ratio, nseeds):
+            errors = abs(west + east - lenmap.lens)
+            totals = np.bincount(owners, west + east, self.ncurves)
 
-        data = self.create_lenmap(nparts, ratio, nseeds)
-        args = self.invert_lenmap(data)
+            tosplit = errors > rtol * totals[owners] * (ends - starts)
 
-        return args
+            if not np.any(tosplit):
+                lenmap.lens = west + east
+                return lenmap
 
-    def create_lenmap(self, nparts, ratio, nseeds):
+            lenmap = lenmap.split(tosplit, west, east)
 
-        func_we_know = self.lenfunc_we_know(nseeds)
-        func_we_want = self.lenfunc_we_want(nparts, ratio, nseeds)
+        return None
 
-        return {
-            'func-we-know': func_we_know,
-            'func-we-want': func_we_want
-        }
 
-    def lenfunc_we_know(self, nseeds):
-        return self.lenfunc_from_linspace(nseeds)
+class LenMap:
+    """Curves pieces with their lengths.
 
-    def lenfunc_we_want(self, nparts, ratio, nseeds):
+    Attributes
+    ----------
+    owners : flat-int-array
+        Curves numbers of pieces, sorted.
+    starts : flat-float-array
+        Start parameters of pieces.
+    ends : flat-float-array
+        End parameters of pieces.
+    lens : flat-float-array
+        Lengths of pieces.
+
+    """
 
-        usteps = self.usteps_from_params(nparts, ratio)
-        length = self.length_from_linspace(nseeds)
+    def __init__(self, owners, starts, ends, lens=None):
+        self.owners = owners
+        self.starts = starts
+        self.ends = ends
+        self.lens = lens
 
-        return np.add.accumulate(
-            usteps * (length / np.sum(usteps))
+    @classmethod
+    def from_uniform(cls, ncurves, npieces):
+
+        bounds = np.linspace(0., 1., npieces + 1)
+
+        return cls(
+            np.repeat(np.arange(ncurves), npieces),
+            np.tile(bounds[:-1], ncurves),
+            np.tile(bounds[1:], ncurves)
         )
 
-    def usteps_from_params(self, nparts, ratio):
-        return 1. + np.linspace(0., 1., nparts) * (ratio - 1.)
+    @property
+    def pieces(self):
+        return self.owners, self.starts, self.ends
 
-    def invert_lenmap(self, lenmap):
+    @property
+    def totals(self):
+        return np.bincount(self.owners, self.lens, self.owners[-1] + 1)
 
-        func_we_know = lenmap['func-we-know']
-        func_we_want = lenmap['func-we-want']
+    @property
+    def offsets(self):
+        """Lengths of curves before the pieces.
+        """
 
-        func_we_know = _normalize_lenfunc(func_we_know)
-        func_we_want = _normalize_lenfunc(func_we_want)
+        cumlens = np.cumsum(self.lens) - self.lens
+        heads = np.searchsorted(self.owners, self.owners)
 
-        args_we_know = np.linspace(
-            0., 1., func_we_know.size
-        )
+        return cumlens - cumlens[heads]
 
-        args_we_want = np.interp(
-            func_we_want, func_we_know, args_we_know
-        )
+    def split(self, mask, west, east):
+        """Splits pieces in halves, keeps the others refined.
+        """
 
-        return np.r_[
-            0., args_we_want[1:-1], 1.
-        ]
+        counts = 1 + mask
+        heads = np.cumsum(counts) - counts
+
+        mids = 0.5 * (self.starts + self.ends)
+
+        owners = np.repeat(self.owners, counts)
+        starts = np.repeat(self.starts, counts)
+        ends = np.repeat(self.ends, counts)
+        lens = np.repeat(west + east, counts)
 
+        ends[heads[mask]] = mids[mask]
+        starts[heads[mask] + 1] = mids[mask]
 
-def _normalize_lenfunc(data):
-    return np.r_[
-        0., data / data[-1]
-    ]
+        lens[heads[mask]] = west[mask]
+        lens[heads[mask] + 1] = east[mask]
 
+        return self.__class__(owners, starts, ends, lens)
 
-class LenEstim(CurveAgent):
-    """Curve length estimator.
+
+class CurvesPartt(LenEstim):
+    """Curves partitioner.
     """
 
-    def get_length(self, rtol, maxitr) -> float:
-        """Returns the length estimate.
+    RTOL = 1e-8
+    MAXITR = 20
+
+    def get_partitions(self, params):
+        """Splits curves into segments based on length.
+
+        Parameters
+        ----------
+        params : list
+            Pairs (nparts, ratio) for each curve, see `Curve().partition()`
+
+        Returns
+        -------
+        list
+            Partitions as complex-flat-arrays, None if not resolved.
+
         """
 
-        length, _ = self.estimate(
-            getlen=self.length_from_linspace, rtol=rtol, maxitr=maxitr
+        lenmap = self.get_lenmap(self.RTOL, self.MAXITR)
+
+        if lenmap is None:
+            return None
+
+        owners, args = self.find_args(lenmap, params)
+        splits = np.searchsorted(owners, np.arange(1, self.ncurves))
+
+        return [
+            curve._getpath(np.r_[0., inner, 1.]) for curve, inner in zip(
+                self.curves, np.split(args, splits)
+            )
+        ]
+
+    def find_args(self, lenmap, params):
+        """Finds inner parameters of partitions.
+        """
+
+        owners, targets = self.make_targets(lenmap.totals, params)
+
+        pieces = self.find_pieces(lenmap, owners, targets)
+
+        starts = lenmap.starts[pieces]
+        ends = lenmap.ends[pieces]
+
+        offsets = lenmap.offsets[pieces]
+
+        args = starts + (ends - starts) * (
+            (targets - offsets) / lenmap.lens[pieces]
         )
 
-        return length
+        for _ in range(self.NEWTON):
+
+            lens = offsets + self.gauss_lengths(owners, starts, args)
+            speeds = abs(self.derivs(owners, args))
+
+            args -= np.divide(
+                lens - targets, speeds, out=np.zeros(args.shape),
+                where=speeds > 0
+            )
+
+            args = np.clip(args, starts, ends)
 
-    def get_nseeds(self, rtol, maxitr) -> int:
-        """Number of seeds we need to get the length estimate.
+        return owners, args
+
+    def make_targets(self, totals, params):
+        """Lengths of inner partition nodes for each curve.
         """
 
-        _, nseeds = self.estimate(
-            getlen=self.length_from_linspace, rtol=rtol, maxitr=maxitr
+        owners, steps = [], []
+
+        for num, (nparts, ratio) in enumerate(params):
+
+            ratio = ratio if ratio > 0. else 1.
+            usteps = 1. + np.linspace(0., 1., nparts) * (ratio - 1.)
+
+            steps.append(usteps / np.sum(usteps))
+            owners.append(np.full(nparts, num))
+
+        steps = np.hstack(steps)
+        owners = np.hstack(owners)
+
+        heads = np.searchsorted(owners, owners)
+        fracs = np.cumsum(steps) - (np.cumsum(steps) - steps)[heads]
+
+        inner = np.diff(np.r_[owners, -1]) == 0
+
+        return owners[inner], (fracs * totals[owners])[inner]
+
+    def find_pieces(self, lenmap, owners, targets):
+        """Finds pieces with the target lengths.
+        """
+
+        totals = lenmap.totals
+
+        keys = lenmap.owners + (lenmap.offsets + lenmap.lens) / (
+            totals[lenmap.owners]
         )
 
-        return nseeds
+        locs = np.searchsorted(keys, owners + targets / totals[owners])
 
-    def estimate(self, getlen, rtol, nseeds=5, maxitr=10):
+        return np.minimum(locs, lenmap.owners.size - 1)
 
-        prev = getlen(nseeds)
 
-        for _ in range(maxitr):
+def _group_by_class(curves):
+    """Groups curves by classes.
+
+    Returns
+    -------
+    flat-int-array
+        Group numbers of curves.
+    flat-int-array
+        Positions of curves in their groups.
+    list
+        Groups as lists of curves.
+
+    """
+
+    numbers = {}
+    classes = []
+
+    groups = np.zeros(len(curves), dtype=int)
+    ranks = np.zeros(len(curves), dtype=int)
+
+    for num, curve in enumerate(curves):
 
-            nseeds *= 2
+        if type(curve) not in numbers:
+            numbers[type(curve)] = len(classes)
+            classes.append([])
 
-            curr = getlen(nseeds)
-            rerr = abs(curr/prev - 1.)
+        groups[num] = numbers[type(curve)]
+        ranks[num] = len(classes[groups[num]])
 
-            if rerr < rtol:
-                return curr, nseeds
-            prev = curr
+        classes[groups[num]].append(curve)
 
-        return None, None
+    return groups, ranks, classes
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""Tests meshing of path-maps.
+"""
+import unittest
+import numpy as np
+from triellipt import geom, mesher
+
+
+def signed_areas(mesh):
+
+    vertices = mesh.points[mesh.triangs]
+
+    side1 = vertices[:, 1] - vertices[:, 0]
+    side2 = vertices[:, 2] - vertices[:, 0]
+
+    return 0.5 * np.imag(np.conj(side1) * side2)
+
+
+def polygon_area(points):
+    return 0.5 * np.imag(
+        np.sum(np.conj(points) * np.roll(points, -1))
+    )
+
+
+class TestRectMesh(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.PATH = geom.makerect((0, 0), (2, 1)).discretize((4, 1))
+        cls.MESH = mesher.pathmesh(cls.PATH, {0: 0.1, 1: 0.1, 2: 0.1, 3: 0.1})
+
+    def test_points(self):
+        assert np.all(
+            self.MESH.points[:self.PATH.size] == self.PATH.points
+        )
+
+    def test_triangs(self):
+        assert np.all(signed_areas(self.MESH) > 0)
+        assert not self.MESH.hasghosts()
+
+    def test_area(self):
+        assert np.isclose(signed_areas(self.MESH).sum(), 2.)
+
+    def test_sizes(self):
+        vertices = self.MESH.points[self.MESH.triangs]
+        assert np.max(abs(vertices - np.roll(vertices, 1, axis=1))) < 0.2
+
+
+class TestHoleMesh(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.PATH = geom.makeellip((0, 0), (1, 1)).discretize((48, 1))
+        cls.HOLE = geom.makeellip((0.2, 0), (0.3, 0.2)).discretize((24, 1))
+
+        cls.MESH = mesher.pathmesh(
+            cls.PATH, {}, [cls.HOLE], sizefunc=lambda z: 0.05 + 0.1 * abs(z)
+        )
+
+    def test_area(self):
+
+        area = polygon_area(self.PATH.points)
+        area -= polygon_area(self.HOLE.points)
+
+        assert np.isclose(signed_areas(self.MESH).sum(), area)
+
+    def test_hole(self):
+        centrs = self.MESH.points[self.MESH.triangs].mean(axis=1)
+        dists = ((centrs.real - 0.2) / 0.3)**2 + (centrs.imag / 0.2)**2
+        assert np.all(dists > 0.9)
+
+    def test_quality(self):
+
+        vertices = self.MESH.points[self.MESH.triangs]
+        edges = abs(vertices - np.roll(vertices, 1, axis=1))
+
+        quality = 4 * np.sqrt(3) * signed_areas(self.MESH) / np.sum(
+            edges**2, axis=1
+        )
+
+        assert quality.min() > 0.4
+
+
+class TestErrors(unittest.TestCase):
+
+    def test_short_loop(self):
+
+        path = geom.PathMap.from_paths(np.array([0, 1]))
+
+        with self.assertRaises(mesher.tridelaunay.TriDelaunayError):
+            mesher.pathmesh(path, {})
+
+    def test_not_converged(self):
+        """Fails after a pass that splits segments, or adds points.
+        """
+
+        path = geom.makerect((0, 0), (2, 1)).discretize((4, 1))
+
+        for maxiter in (1, 2):
+
+            maker = mesher.tridelaunay.get_mesher(path, {0: 0.05})
+            maker.MAXITER = maxiter
+
+            with self.assertRaises(mesher.tridelaunay.TriDelaunayError):
+                maker.get_mesh()
+
+
+if __name__ == '__main__':
+    unittest.main()
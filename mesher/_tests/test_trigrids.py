@@ -3,6 +3,7 @@
 """
 from abc import ABC, abstractmethod
 import unittest
+import numpy as np
 from triellipt import mesher
 
 
@@ -89,5 +90,37 @@ class TestTriCrossWise(TestTriGrid, unittest.TestCase):
         return mesher.trigrid(2, 2, 'cross-wise')
 
 
+class TestTiles(unittest.TestCase):
+
+    def test_tiles(self):
+        for key in ['west-slope', 'east-slope', 'cross-wise']:
+            tiles = list(mesher.trigrid_tiles(5, 4, key, rows=3))
+            assert len(tiles) == 2
+            assert np.array_equal(
+                np.vstack(tiles), mesher.trigrid(5, 4, key).triangs
+            )
+
+    def test_tiles_snake(self):
+        tiles = np.vstack(list(mesher.trigrid_tiles(5, 4, 'east-snake', 1)))
+        assert sorted(tiles.tolist()) == sorted(
+            mesher.trigrid(5, 4, 'east-snake').triangs.tolist()
+        )
+
+
+class TestTriLattice(unittest.TestCase):
+
+    def test_lattice(self):
+        mesh = mesher.trilattice(5, 4)
+        assert mesh.npoints == 10
+        assert mesh.triangs[:2].tolist() == [[2, 0, 4], [5, 1, 2]]
+
+    def test_lattice_closed(self):
+        mesh = mesher.trilattice(5, 4, close=True)
+        assert mesh.npoints == 14
+        assert mesh.ntriangs == 15
+        assert np.sum(mesh.points.real == 0) == 4
+        assert np.sum(mesh.points.real == 4) == 4
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -3,6 +3,7 @@
 """
 from triellipt.mesher import trigrids
 from triellipt.mesher import trilattices
+from triellipt.mesher import tridelaunay
 
 
 def trigrid(xsize, ysize, slopes):
@@ -41,6 +42,43 @@ def trigrid(xsize, ysize, slopes):
     )
 
 
+def trigrid_tiles(xsize, ysize, slopes, rows):
+    """Generates triangles of a grid tile by tile.
+
+    Parameters
+    ----------
+    xsize : int
+        Number of nodes in x-direction.
+    ysize : int
+        Number of nodes in y-direction.
+    slopes : str
+        Controls orientation of triangles, as in `trigrid()`.
+    rows : int
+        Number of cell rows in x-direction per tile.
+
+    Returns
+    -------
+    generator
+        Yields 3-column-int-tables of triangles (i).
+
+    Notes
+    -----
+
+    (i) Triangles refer to the global node numbers of `trigrid()`:
+
+    - node `(i, j)` has the number `i * ysize + j`
+    - center of cell `(i, j)` in "cross-wise" grids has the number
+    `xsize * ysize + i * (ysize - 1) + j`
+
+    Tiles stacked together give `trigrid().triangs`, except for the
+    snake grids, where the order of triangles differs.
+
+    """
+    return trigrids.gettiles(
+        int(xsize), int(ysize), slopes, rows
+    )
+
+
 def trilattice(xsize, ysize, close=False):
     """Creates a lattice of equilateral triangles.
 
@@ -60,3 +98,38 @@ def trilattice(xsize, ysize, close=False):
 
     """
     return trilattices.get_lattice(xsize, ysize, close)
+
+
+def pathmesh(path, seeds, holes=(), sizefunc=None):
+    """Meshes a domain bounded by path-maps.
+
+    Parameters
+    ----------
+    path : PathMap
+        Outer boundary of the domain.
+    seeds : dict
+        Maps colours to the seed mesh sizes (i).
+    holes : tuple = ()
+        Path-maps of the holes inside the domain.
+    sizefunc : callable = None
+        Maps complex points to mesh sizes, replaces the seeds (ii).
+
+    Returns
+    -------
+    TriMesh
+        Constrained Delaunay mesh of the domain (iii).
+
+    Notes
+    -----
+
+    (i) Seeds refer to the colours of all path-maps, as in `togeo()`.
+    Nodes without seeds take the mean length of the adjacent segments.
+    Sizes inside are linearly interpolated from the boundary nodes.
+
+    (ii) Size function must work on flat complex arrays.
+
+    (iii) Boundary points go first, boundary segments are split
+    to follow the mesh sizes.
+
+    """
+    return tridelaunay.get_mesh(path, seeds, holes, sizefunc)
@@ -0,0 +1,646 @@
+# -*- coding: utf-8 -*-
+"""Constrained Delaunay meshing of path-maps.
+"""
+import math
+import numpy as np
+from scipy import spatial
+from scipy import sparse as sp
+from scipy.sparse import csgraph
+from triellipt.trimesh import trimesh_
+
+TriDelaunayError = type(
+    'TriDelaunayError', (Exception,), {}
+)
+
+
+def get_mesh(path, seeds, holes=(), sizefunc=None):
+    _ = get_mesher(path, seeds, holes, sizefunc)
+    return _.get_mesh()
+
+
+def get_mesher(path, seeds, holes=(), sizefunc=None):
+
+    loops = [path, *holes]
+
+    if any(loop.size < 3 for loop in loops):
+        raise TriDelaunayError(
+            "expected loops with at least 3 nodes"
+        )
+
+    return TriDelaunay.from_loops(loops, seeds, sizefunc)
+
+
+class TriDelaunay:
+    """Maker of a constrained Delaunay mesh.
+
+    Attributes
+    ----------
+    points : complex-flat-array
+        Mesh points, boundary points go first.
+    segments : 2-column-int-table
+        Boundary segments as pairs of points numbers.
+    sizer : callable
+        Mesh size field, maps complex points to sizes.
+
+    Notes
+    -----
+
+    Delaunay refinement:
+
+    - boundary segments missing in the triangulation are split
+    - boundary segments encroached by inner points are split
+    - circumcenters of too large or bad-shaped triangles are added
+
+    """
+
+    MAXITER = 200
+
+    SIZE_TOL = 1.25
+    QUALITY = math.sqrt(2.)
+    QUALITY_SIZE = 0.5
+    SPLIT_SIZE = 0.75
+    SPACING = 0.5
+    FLAT_TOL = 1e-10
+
+    def __init__(self, points=None, segments=None, sizer=None):
+        self.points = points
+        self.segments = segments
+        self.sizer = sizer
+
+    @classmethod
+    def from_loops(cls, loops, seeds, sizefunc=None):
+
+        points, segments = _loops_segments(loops)
+
+        if sizefunc is None:
+            sizer = SeedsSizer.from_loops(loops, seeds)
+        else:
+            sizer = sizefunc
+
+        return cls(points, segments, sizer).with_presplit()
+
+    def with_presplit(self):
+        """Splits segments into parts of the size field length.
+        """
+
+        starts = self.points[self.segments[:, 0]]
+        ends = self.points[self.segments[:, 1]]
+
+        sizes = self.sizer(0.5 * (starts + ends))
+        counts = np.maximum(np.rint(abs(ends - starts) / sizes), 1)
+
+        counts = counts.astype(int)
+        inners = counts - 1
+
+        locs = np.repeat(np.arange(counts.size), inners)
+        steps = np.arange(locs.size) - np.repeat(
+            np.cumsum(inners) - inners, inners
+        )
+
+        fracs = (steps + 1) / counts[locs]
+        new_points = starts[locs] + fracs * (ends - starts)[locs]
+
+        new_nums = self.points.size + np.arange(new_points.size)
+
+        nodes = np.empty(counts.sum() + counts.size, dtype=int)
+        heads = np.cumsum(counts + 1) - counts - 1
+
+        mask = np.full(nodes.size, True)
+        mask[heads] = False
+        mask[heads + counts] = False
+
+        nodes[heads] = self.segments[:, 0]
+        nodes[heads + counts] = self.segments[:, 1]
+        nodes[mask] = new_nums
+
+        pairs = np.column_stack([nodes[:-1], nodes[1:]])
+        pairs = np.delete(pairs, heads[1:] - 1, axis=0)
+
+        self.points = np.hstack([self.points, new_points])
+        self.segments = pairs
+
+        return self
+
+    def get_mesh(self):
+
+        triangs = self.refine()
+
+        return trimesh_.TriMesh(
+            self.points, _oriented(self.points, triangs)
+        )
+
+    def refine(self):
+        """Runs Delaunay refinement, returns the domain triangles.
+
+        Raises TriDelaunayError, if not converged in MAXITER iterations.
+        """
+
+        for _ in range(self.MAXITER):
+
+            triu = TriuAgent.from_delaunay(self)
+
+            if self.split_segments(triu.find_missing()):
+                continue
+
+            triu.find_inside()
+
+            if self.split_segments(triu.find_encroached()):
+                continue
+
+            steiner, encroached = triu.find_steiner()
+
+            if self.split_segments(encroached):
+                continue
+
+            if steiner.size == 0:
+                return triu.inner_triangs
+
+            self.points = np.hstack([self.points, steiner])
+
+        raise TriDelaunayError(
+            f"refinement did not converge in {self.MAXITER} iterations"
+        )
+
+    def split_segments(self, segnums):
+        """Splits segments in the middle, returns True if any.
+        """
+
+        if segnums.size == 0:
+            return False
+
+        starts = self.segments[segnums, 0]
+        ends = self.segments[segnums, 1]
+
+        midnums = self.points.size + np.arange(segnums.size)
+
+        self.points = np.hstack(
+            [self.points, 0.5 * (self.points[starts] + self.points[ends])]
+        )
+
+        self.segments[segnums, 1] = midnums
+
+        self.segments = np.vstack(
+            [self.segments, np.column_stack([midnums, ends])]
+        )
+
+        return True
+
+
+class TriuAgent:
+    """Operator on a Delaunay triangulation.
+    """
+
+    def __init__(self, maker, triu):
+        self.maker = maker
+        self.triu = triu
+        self.cache = {}
+
+    @classmethod
+    def from_delaunay(cls, maker):
+        return cls(
+            maker, spatial.Delaunay(_complex_to_rows(maker.points))
+        )
+
+    @property
+    def points(self):
+        return self.maker.points
+
+    @property
+    def segments(self):
+        return self.maker.segments
+
+    @property
+    def triangs(self):
+        return self.triu.simplices
+
+    @property
+    def inner_triangs(self):
+        return self.triangs[self.inside]
+
+    @property
+    def inside(self):
+        return self.cache['inside']
+
+    @property
+    def edges_segnums(self):
+        """Segments numbers of triangle edges, -1 if not a segment.
+
+        Edge k is opposite to the vertex k.
+        """
+
+        if 'edges-segnums' not in self.cache:
+            self.cache['edges-segnums'] = self.make_edges_segnums()
+
+        return self.cache['edges-segnums']
+
+    def make_edges_segnums(self):
+
+        count = self.points.size
+
+        segkeys = _edge_keys(*self.segments.T, count)
+        order = np.argsort(segkeys)
+
+        edgekeys = _edge_keys(
+            self.triangs[:, [1, 2, 0]], self.triangs[:, [2, 0, 1]], count
+        )
+
+        locs = np.searchsorted(segkeys, edgekeys, sorter=order)
+        locs = np.minimum(locs, segkeys.size - 1)
+
+        segnums = order[locs]
+
+        return np.where(
+            segkeys[segnums] == edgekeys, segnums, -1
+        )
+
+    def find_missing(self):
+        """Finds segments missing in the triangulation.
+        """
+
+        present = np.full(self.segments.shape[0], False)
+        present[self.edges_segnums[self.edges_segnums >= 0]] = True
+
+        return np.flatnonzero(~present)
+
+    def find_inside(self):
+        """Marks triangles inside the domain.
+
+        Notes
+        -----
+
+        Triangles are grouped by neighbors, not separated by segments.
+        Each group is classified by the even-odd rule at its largest triangle.
+        Groups of flat triangles, e.g. along straight hull segments, are out.
+
+        """
+
+        neighs = self.triu.neighbors
+        trinums = np.repeat(np.arange(neighs.shape[0]), 3)
+
+        mask = np.logical_and(
+            neighs.ravel() >= 0, self.edges_segnums.ravel() < 0
+        )
+
+        graph = sp.coo_matrix(
+            (np.ones(mask.sum()), (trinums[mask], neighs.ravel()[mask])),
+            shape=(neighs.shape[0], neighs.shape[0])
+        )
+
+        _, labels = csgraph.connected_components(graph, directed=False)
+
+        vertices = self.points[self.triangs]
+        areas = abs(_signed_areas(vertices))
+
+        order = np.lexsort((-areas, labels))
+        _, firsts = np.unique(labels[order], return_index=True)
+
+        largest = order[firsts]
+
+        centrs = vertices[largest].mean(axis=1)
+        sizes2 = _sizes2(vertices[largest])
+
+        inside = np.logical_and(
+            _even_odd(centrs, self.points[self.segments]),
+            areas[largest] > self.maker.FLAT_TOL * sizes2
+        )
+
+        self.cache['inside'] = inside[labels]
+
+        return self.inside
+
+    def find_encroached(self):
+        """Finds long segments encroached by vertices of inner triangles.
+        """
+
+        triangs = self.inner_triangs
+        segnums = self.edges_segnums[self.inside]
+
+        mask = segnums >= 0
+
+        vertex = self.points[triangs][mask]
+        starts = self.points[triangs[:, [1, 2, 0]]][mask]
+        ends = self.points[triangs[:, [2, 0, 1]]][mask]
+
+        angles = np.real(
+            (starts - vertex) * np.conj(ends - vertex)
+        )
+
+        return self.filter_long(
+            np.unique(segnums[mask][angles < 0])
+        )
+
+    def filter_long(self, segnums):
+        """Keeps segments long enough to split.
+        """
+
+        starts = self.points[self.segments[segnums, 0]]
+        ends = self.points[self.segments[segnums, 1]]
+
+        sizes = self.maker.sizer(0.5 * (starts + ends))
+        long = abs(ends - starts) > self.maker.SPLIT_SIZE * sizes
+
+        return segnums[long]
+
+    def find_steiner(self):
+        """Finds new points and segments encroached by them.
+        """
+
+        trinums = np.flatnonzero(self.inside)
+        trinums = trinums[self.find_bad(trinums)]
+
+        centers = _circumcenters(self.points[self.triangs[trinums]])
+
+        hosts, crossed = self.walk_to(centers, trinums)
+        inner = crossed == -1
+
+        encroaching, segnums = self.find_encroaching(
+            centers[inner], hosts[inner]
+        )
+
+        segnums = np.hstack([segnums, crossed[crossed >= 0]])
+
+        return (
+            self.drop_close(centers[inner][~encroaching]),
+            self.filter_long(np.unique(segnums))
+        )
+
+    def walk_to(self, points, trinums):
+        """Walks from triangles to the ones containing the points.
+
+        Returns
+        -------
+        flat-int-array
+            Triangles containing the points.
+        flat-int-array
+            Segments blocking the walk, -1 if not blocked, -2 at hull.
+
+        Notes
+        -----
+
+        Walks go across the edge with the most negative barycentric
+        coordinate and stop at segments, so they stay inside the domain.
+
+        """
+
+        hosts = np.copy(trinums)
+        crossed = np.full(hosts.size, -1)
+
+        active = np.arange(hosts.size)
+
+        for _ in range(self.triangs.shape[0]):
+
+            if active.size == 0:
+                break
+
+            bary = self.barycentric(points[active], hosts[active])
+
+            locs = np.argmin(bary, axis=1)
+            done = bary[np.arange(active.size), locs] >= 0
+
+            segnums = self.edges_segnums[hosts[active], locs]
+            neighs = self.triu.neighbors[hosts[active], locs]
+
+            blocked = np.logical_and(
+                ~done, np.logical_or(segnums >= 0, neighs < 0)
+            )
+
+            crossed[active[blocked]] = np.where(
+                segnums[blocked] >= 0, segnums[blocked], -2
+            )
+
+            going = ~(done | blocked)
+            hosts[active[going]] = neighs[going]
+
+            active = active[going]
+
+        return hosts, crossed
+
+    def barycentric(self, points, trinums):
+
+        vertices = self.points[self.triangs[trinums]]
+
+        starts = vertices[:, [1, 2, 0]] - points[:, None]
+        ends = vertices[:, [2, 0, 1]] - points[:, None]
+
+        areas = np.imag(np.conj(starts) * ends)
+
+        return areas / areas.sum(axis=1)[:, None]
+
+    def find_bad(self, trinums):
+        """Finds too large or bad-shaped triangles, sorted by badness.
+        """
+
+        vertices = self.points[self.triangs[trinums]]
+
+        edges = abs(
+            vertices[:, [1, 2, 0]] - vertices[:, [2, 0, 1]]
+        )
+
+        radii = _circumradii(vertices, edges)
+        sizes = self.maker.sizer(vertices.mean(axis=1))
+
+        ratios = math.sqrt(3.) * radii / sizes
+
+        isbig = ratios > self.maker.SIZE_TOL
+
+        isbad = np.logical_and(
+            radii > self.maker.QUALITY * edges.min(axis=1),
+            ratios > self.maker.QUALITY_SIZE
+        )
+
+        locs = np.flatnonzero(isbig | isbad)
+        return locs[np.argsort(-ratios[locs], kind='stable')]
+
+    def find_encroaching(self, centers, hosts):
+        """Finds points in diametral circles of their host edges.
+        """
+
+        segnums = self.edges_segnums[hosts]
+        triangs = self.triangs[hosts]
+
+        starts = self.points[triangs[:, [1, 2, 0]]]
+        ends = self.points[triangs[:, [2, 0, 1]]]
+
+        angles = np.real(
+            (starts - centers[:, None]) * np.conj(ends - centers[:, None])
+        )
+
+        hits = np.logical_and(segnums >= 0, angles < 0)
+
+        return np.any(hits, axis=1), segnums[hits]
+
+    def drop_close(self, centers):
+        """Drops points too close to the preceding ones.
+        """
+
+        if centers.size < 2:
+            return centers
+
+        sizes = self.maker.sizer(centers)
+
+        tree = spatial.cKDTree(_complex_to_rows(centers))
+
+        pairs = tree.query_pairs(
+            self.maker.SPACING * sizes.max(), output_type='ndarray'
+        )
+
+        dists = abs(centers[pairs[:, 0]] - centers[pairs[:, 1]])
+        limits = self.maker.SPACING * np.minimum(
+            sizes[pairs[:, 0]], sizes[pairs[:, 1]]
+        )
+
+        pairs = pairs[dists < limits]
+
+        mask = np.full(centers.size, True)
+        mask[pairs.max(axis=1)] = False
+
+        return centers[mask]
+
+
+class SeedsSizer:
+    """Size field interpolated from the boundary seeds.
+
+    Notes
+    -----
+
+    Sizes are linear inside the Delaunay triangles of the loops nodes.
+    Nodes without seeds take the mean length of the adjacent segments.
+
+    """
+
+    def __init__(self, triu=None, sizes=None):
+        self.triu = triu
+        self.sizes = sizes
+
+    @classmethod
+    def from_loops(cls, loops, seeds):
+
+        points, segments = _loops_segments(loops)
+        colors = np.hstack([loop.colors for loop in loops])
+
+        lengths = abs(
+            points[segments[:, 1]] - points[segments[:, 0]]
+        )
+
+        spacing = 0.5 * (lengths + lengths[_prev_segments(segments)])
+
+        sizes = np.array(
+            [seeds.get(color, 0) for color in colors], dtype=float
+        )
+
+        sizes = np.where(sizes > 0, sizes, spacing)
+
+        return cls(
+            spatial.Delaunay(_complex_to_rows(points)), sizes
+        )
+
+    def __call__(self, points):
+
+        rows = _complex_to_rows(points)
+        trinums = self.triu.find_simplex(rows)
+
+        transform = self.triu.transform[trinums]
+
+        bary = np.einsum(
+            'ijk,ik->ij', transform[:, :2], rows - transform[:, 2]
+        )
+
+        weights = np.column_stack([bary, 1. - bary.sum(axis=1)])
+        values = self.sizes[self.triu.simplices[trinums]]
+
+        return np.where(
+            trinums >= 0, np.sum(weights * values, axis=1), self.sizes.min()
+        )
+
+
+def _loops_segments(loops):
+
+    points = np.hstack([loop.points for loop in loops])
+    counts = np.array([loop.size for loop in loops])
+
+    starts = np.repeat(np.cumsum(counts) - counts, counts)
+    locs = np.arange(points.size) - starts
+
+    nexts = starts + (locs + 1) % np.repeat(counts, counts)
+
+    return points, np.column_stack([np.arange(points.size), nexts])
+
+
+def _prev_segments(segments):
+    prevs = np.empty(segments.shape[0], dtype=int)
+    prevs[segments[:, 1]] = np.arange(segments.shape[0])
+    return prevs
+
+
+def _edge_keys(nodes1, nodes2, count):
+    return np.minimum(nodes1, nodes2) * count + np.maximum(nodes1, nodes2)
+
+
+def _even_odd(points, segments):
+    """Even-odd test of points against segments by the east ray.
+    """
+
+    starts = segments[:, 0][None, :]
+    ends = segments[:, 1][None, :]
+
+    points = points[:, None]
+
+    spans = (starts.imag > points.imag) != (ends.imag > points.imag)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        xcross = starts.real + (points.imag - starts.imag) * (
+            (ends.real - starts.real) / (ends.imag - starts.imag)
+        )
+
+    crossing = np.logical_and(spans, xcross > points.real)
+    return np.sum(crossing, axis=1) % 2 == 1
+
+
+def _circumcenters(vertices):
+
+    vert0 = vertices[:, 0]
+
+    side1 = vertices[:, 1] - vert0
+    side2 = vertices[:, 2] - vert0
+
+    denom = 2. * np.imag(np.conj(side1) * side2)
+
+    shift = -1j * (
+        abs(side1)**2 * side2 - abs(side2)**2 * side1
+    ) / denom
+
+    return vert0 + shift
+
+
+def _circumradii(vertices, edges):
+    return np.prod(edges, axis=1) / (
+        4. * abs(_signed_areas(vertices))
+    )
+
+
+def _signed_areas(vertices):
+
+    side1 = vertices[:, 1] - vertices[:, 0]
+    side2 = vertices[:, 2] - vertices[:, 0]
+
+    return 0.5 * np.imag(np.conj(side1) * side2)
+
+
+def _sizes2(vertices):
+    return np.max(
+        abs(vertices[:, [1, 2, 0]] - vertices[:, [2, 0, 1]])**2, axis=1
+    )
+
+
+def _oriented(points, triangs):
+
+    clockwise = _signed_areas(points[triangs]) < 0
+
+    triangs = triangs.copy()
+    triangs[clockwise] = triangs[clockwise][:, [0, 2, 1]]
+
+    return triangs
+
+
+def _complex_to_rows(points):
+    return np.column_stack([points.real, points.imag])
@@ -11,6 +11,14 @@ TriGridsError = type(
 
 
 def getgrid(xsize, ysize, key):
+    return getgridder(xsize, ysize, key).get_trimesh()
+
+
+def gettiles(xsize, ysize, key, rows):
+    return getgridder(xsize, ysize, key).gen_tiles(rows)
+
+
+def getgridder(xsize, ysize, key):
 
     xsize = max(xsize, 2)
     ysize = max(ysize, 2)
@@ -20,11 +28,23 @@ def getgrid(xsize, ysize, key):
             f"got undefined grid type '{key}'"
         )
 
-    return TRIGRIDS[key](xsize, ysize).get_trimesh()
+    return TRIGRIDS[key](xsize, ysize)
 
 
 class TriGridder(ABC):
     """Triangle grid maker.
+
+    Grid cell
+    ---------
+      3 — 2
+      | 4 |
+      0 — 1
+
+    Notes
+    -----
+
+    Node (i, j) of the grid has the number `i * ysize + j`.
+
     """
 
     def __init__(self, xsize, ysize):
@@ -32,14 +52,10 @@ class TriGridder(ABC):
         self.ysize = ysize
 
     def get_trimesh(self):
-        points, triangs = self.gen_meshdata()
-        return trimesh_.TriMesh.from_data(points, triangs)
-
-    def gen_meshdata(self):
-        yield self.get_points()
-        yield self.get_triangs()
+        return trimesh_.TriMesh(
+            self.get_points(), self.get_triangs()
+        )
 
-    @abstractmethod
     def get_points(self):
         """Creates the mesh points.
 
@@ -49,6 +65,7 @@ class TriGridder(ABC):
             Mesh points.
 
         """
+        return _grid_points(self.xsize, self.ysize)
 
     def get_triangs(self):
         """Creates the triangles table.
@@ -59,31 +76,51 @@ class TriGridder(ABC):
             Table of mesh triangles.
 
         """
+        return self.make_triangs(0, self.xsize - 1)
 
-        cells = self.make_cells()
-        triangs = self.from_cells(cells)
+    def gen_tiles(self, rows):
+        """Yields triangles of consecutive blocks of cell rows.
+        """
 
-        return triangs
+        rows = max(int(rows), 1)
+
+        for start in range(0, self.xsize - 1, rows):
+            yield self.make_triangs(
+                start, min(start + rows, self.xsize - 1)
+            )
 
     @abstractmethod
-    def make_cells(self):
-        """Returns table of grid cells.
+    def make_triangs(self, start, stop):
+        """Makes triangles of cells in rows from start to stop.
         """
 
-    @abstractmethod
-    def from_cells(self, cells):
-        """Makes triangles from grid cells.
+    def cells_bases(self, start, stop):
+        """Returns 0-corners of cells as a 2D array.
         """
 
-    def pack_triangs(self, *tables):
+        inds = np.arange(start, stop)[:, None] * self.ysize
 
-        tris_flat = np.hstack(tables).flatten()
+        return inds + np.arange(self.ysize - 1)
+
+    def corner_nums(self, bases, corner):
+        """Returns numbers of the cells corners.
+        """
 
-        triangs = np.reshape(
-            tris_flat, (tris_flat.size // 3, 3)
+        offsets = (
+            0, self.ysize, self.ysize + 1, 1
         )
 
-        return triangs.copy('C')
+        return bases + offsets[corner]
+
+    def fill_triangs(self, triangs, bases, paths):
+        """Writes triangles of cells into a preallocated table.
+        """
+
+        table = triangs.reshape(bases.size, len(paths), 3)
+
+        for k, path in enumerate(paths):
+            for m, corner in enumerate(path):
+                table[:, k, m] = self.corner_nums(bases, corner)
 
 
 class TriOneSlope(TriGridder):
@@ -100,24 +137,14 @@ class TriOneSlope(TriGridder):
         (3, 0, 1)
     )
 
-    def get_points(self):
-        return self.numgrid.get_points()
+    def make_triangs(self, start, stop):
 
-    def make_cells(self):
-        """Creates 4-column table of cells corners.
-        """
-        return self.numgrid.get_cells_m4()
+        bases = self.cells_bases(start, stop).ravel()
+        triangs = np.empty((2 * bases.size, 3), dtype=int)
 
-    def gen_snake_masks(self):
+        self.fill_triangs(triangs, bases, self.paths)
 
-        mask = self.numgrid.snake_mask_flat()
-
-        yield mask
-        yield np.logical_not(mask)
-
-    @property
-    def numgrid(self):
-        return NumGrid(self.xsize, self.ysize)
+        return triangs
 
 
 class TriEastSlope(TriOneSlope):
@@ -130,12 +157,9 @@ class TriEastSlope(TriOneSlope):
 
     """
 
-    def from_cells(self, cells):
-
-        trisone = cells[:, self.TRIS_EAST[0]]
-        tristwo = cells[:, self.TRIS_EAST[1]]
-
-        return self.pack_triangs(trisone, tristwo)
+    @property
+    def paths(self):
+        return self.TRIS_EAST
 
 
 class TriWestSlope(TriOneSlope):
@@ -148,49 +172,40 @@ class TriWestSlope(TriOneSlope):
 
     """
 
-    def from_cells(self, cells):
-
-        trisone = cells[:, self.TRIS_WEST[0]]
-        tristwo = cells[:, self.TRIS_WEST[1]]
-
-        return self.pack_triangs(trisone, tristwo)
+    @property
+    def paths(self):
+        return self.TRIS_WEST
 
 
 class TriSnake(TriOneSlope):
     """Grid via splitting by diagonals in a snake mode.
-    """
 
-    def from_cells(self, cells):
+    Notes
+    -----
 
-        mask1, mask2 = self.gen_snake_masks()
-        path11, path12, path21, path22 = self.gen_paths()
+    Triangles of the first-slope cells go before the second-slope ones.
 
-        tris11 = cells[mask1, :]
-        tris12 = cells[mask1, :]
-
-        tris21 = cells[mask2, :]
-        tris22 = cells[mask2, :]
+    """
 
-        tris11 = tris11[:, path11]
-        tris12 = tris12[:, path12]
+    def make_triangs(self, start, stop):
 
-        tris21 = tris21[:, path21]
-        tris22 = tris22[:, path22]
+        bases = self.cells_bases(start, stop)
+        mask = _snake_mask(start, stop, self.ysize - 1)
 
-        trisone = np.vstack([tris11, tris21])
-        tristwo = np.vstack([tris12, tris22])
+        bases1 = bases[mask]
+        bases2 = bases[~mask]
 
-        return self.pack_triangs(trisone, tristwo)
+        triangs = np.empty((2 * bases.size, 3), dtype=int)
 
-    def gen_paths(self):
+        self.fill_triangs(
+            triangs[:2 * bases1.size], bases1, self.get_paths_one()
+        )
 
-        paths1 = self.get_paths_one()
-        paths2 = self.get_paths_two()
+        self.fill_triangs(
+            triangs[2 * bases1.size:], bases2, self.get_paths_two()
+        )
 
-        yield paths1[0]
-        yield paths1[1]
-        yield paths2[0]
-        yield paths2[1]
+        return triangs
 
     @abstractmethod
     def get_paths_one(self):
@@ -235,132 +250,71 @@ class TriCrossWise(TriGridder):
     4-1-2
     4-2-3
 
-    """
-
-    def get_points(self):
+    Notes
+    -----
 
-        points1 = self.numgrid_base.get_points()
-        points2 = self.numgrid_core.get_points()
+    Core nodes go after the grid nodes, the core of cell (i, j) has the
+    number `xsize * ysize + i * (ysize - 1) + j`.
 
-        points = [
-            points1, points2 + (0.5 + 0.5 * 1j)
-        ]
-
-        return np.hstack(points)
-
-    def make_cells(self):
-        return self.numgrid_base.get_cells_m5()
+    """
 
-    def from_cells(self, cells):
+    PATHS = (
+        (4, 3, 0),
+        (4, 0, 1),
+        (4, 1, 2),
+        (4, 2, 3)
+    )
 
-        tris1 = cells[:, [4, 3, 0]]
-        tris2 = cells[:, [4, 0, 1]]
-        tris3 = cells[:, [4, 1, 2]]
-        tris4 = cells[:, [4, 2, 3]]
+    def get_points(self):
 
-        return self.pack_triangs(
-            tris1, tris2, tris3, tris4
+        points = np.empty(
+            self.xsize * self.ysize + (self.xsize - 1) * (self.ysize - 1),
+            dtype=complex
         )
 
-    @property
-    def numgrid_base(self):
-        return NumGrid(self.xsize, self.ysize)
+        offset = self.xsize * self.ysize
 
-    @property
-    def numgrid_core(self):
-        return self.numgrid_base.coarsen()
+        points[:offset] = _grid_points(self.xsize, self.ysize)
+        points[offset:] = _grid_points(self.xsize - 1, self.ysize - 1)
+        points[offset:] += 0.5 + 0.5 * 1j
 
+        return points
 
-class NumGrid:
-    """2D grid of indices.
+    def make_triangs(self, start, stop):
 
-    Grid cell
-    ---------
-      3 — 2
-      | 4 |
-      0 — 1
+        bases = self.cells_bases(start, stop).ravel()
+        triangs = np.empty((4 * bases.size, 3), dtype=int)
 
-    """
+        self.fill_triangs(triangs, bases, self.PATHS)
 
-    def __init__(self, xsize, ysize):
-
-        self.grid = np.reshape(
-            np.arange(xsize*ysize), (xsize, ysize)
-        )
-
-        self.xsize = xsize
-        self.ysize = ysize
-
-    @property
-    def offset(self):
-        """Maximum number in the grid.
-        """
-        return self.xsize * self.ysize
-
-    @property
-    def subgrid(self):
-        return self.coarsen()
-
-    def coarsen(self):
-        return self.__class__(
-            self.xsize - 1, self.ysize - 1
-        )
-
-    def get_points(self):
+        return triangs
 
-        xpos, ypos = map(
-            np.ravel, np.mgrid[:self.xsize, :self.ysize]
-        )
+    def corner_nums(self, bases, corner):
 
-        return xpos + 1j * ypos
+        if corner != 4:
+            return super().corner_nums(bases, corner)
 
-    def get_cells_m4(self):
-        return _packgen(
-            self.gen_cells_m4()
-        )
+        # Cores are numbered as grid cells, i.e. without the last column.
+        return bases - bases // self.ysize + self.xsize * self.ysize
 
-    def get_cells_m5(self):
-        return _packgen(
-            self.gen_cells_m5()
-        )
 
-    def gen_cells_m4(self):
-        yield self.grid[:-1, :-1].flatten()
-        yield self.grid[1::, :-1].flatten()
-        yield self.grid[1::, 1::].flatten()
-        yield self.grid[:-1, 1::].flatten()
+def _grid_points(xsize, ysize):
 
-    def gen_cells_m5(self):
-        for data in self.gen_cells_m4():
-            yield data
-        yield self.get_cores()
+    points = np.empty((xsize, ysize), dtype=complex)
 
-    def get_cores(self):
-        subgrid = self.subgrid.grid
-        return subgrid.flatten() + self.offset
+    points.real = np.arange(xsize)[:, None]
+    points.imag = np.arange(ysize)
 
-    def snake_mask_flat(self):
-        return _snake_mask(
-            self.xsize - 1, self.ysize - 1
-        )
+    return points.ravel()
 
 
-def _packgen(genobj):
-    """Packs generator of arrays to a table.
+def _snake_mask(start, stop, jsize):
+    """Cells with even sum of indices.
     """
-    return np.vstack(list(genobj)).T.copy('C')
-
-
-def _snake_mask(isize, jsize):
-
-    mask = np.full(
-        (isize, jsize), False
-    )
 
-    mask[0::2, 0::2] = True
-    mask[1::2, 1::2] = True
+    inds = np.arange(start, stop)[:, None] + np.arange(jsize)
 
-    return mask.flatten()
+    return inds % 2 == 0
 
 
 TRIGRIDS = {
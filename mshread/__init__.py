@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
-"""Reader of Gmsh meshes.
+"""Reader and writer of Gmsh meshes.
 """
 from .mshreader import getreader
-from .mshreader import MSHReader
\ No newline at end of file
+from .mshreader import MSHReader
+from .mshwriter import write_msh
+from .mshwriter import append_msh
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""Tests binary MSH reader.
+"""
+import os
+import tempfile
+import unittest
+import numpy as np
+from triellipt.mshread import mshbinary
+
+
+def tobytes(data, dtype):
+    return np.asarray(data, dtype=dtype).tobytes()
+
+
+def make_content(order):
+
+    i4, u8, f8 = order + 'i4', order + 'u8', order + 'f8'
+
+    return b''.join([
+        b'$MeshFormat\n4.1 1 8\n', tobytes([1], i4), b'\n$EndMeshFormat\n',
+        b'$PhysicalNames\n1\n1 5 "wall"\n$EndPhysicalNames\n',
+        b'$Entities\n', tobytes([1, 1, 0, 0], u8),
+        tobytes([1], i4), tobytes([0, 0, 0], f8), tobytes([0], u8),
+        tobytes([1], i4), tobytes([0, 0, 0, 1, 1, 0], f8),
+        tobytes([1], u8), tobytes([5], i4), tobytes([2], u8),
+        tobytes([1, -1], i4), b'\n$EndEntities\n',
+        b'$Nodes\n', tobytes([1, 3, 1, 4], u8),
+        tobytes([2, 1, 0], i4), tobytes([3], u8), tobytes([1, 4, 2], u8),
+        tobytes([0, 0, 0, 1, 0, 0, 0, 1, 0], f8), b'\n$EndNodes\n',
+        b'$Elements\n', tobytes([2, 2, 1, 2], u8),
+        tobytes([1, 1, 1], i4), tobytes([1], u8), tobytes([1, 1, 4], u8),
+        tobytes([2, 1, 2], i4), tobytes([1], u8), tobytes([2, 1, 2, 4], u8),
+        b'\n$EndElements\n'
+    ])
+
+
+class TestBinary(unittest.TestCase):
+
+    def test_little_endian(self):
+        self.check_mesh(self.read_mesh('<'))
+
+    def test_big_endian(self):
+        self.check_mesh(self.read_mesh('>'))
+
+    def test_no_nodes(self):
+        with self.assertRaises(mshbinary.MSHBinaryError):
+            mshbinary.MSHBinary.from_buffer(
+                b'$MeshFormat\n4.1 1 8\n\x01\x00\x00\x00\n$EndMeshFormat\n'
+            ).read()
+
+    def test_read_msh(self):
+        """Reads a file and copies the data out of the memory map.
+        """
+
+        with tempfile.TemporaryDirectory() as path:
+
+            filepath = os.path.join(path, 'mesh.msh')
+
+            with open(filepath, mode='wb') as file:
+                file.write(make_content('<'))
+
+            mesh = mshbinary.read_msh(filepath)
+
+        self.check_mesh(mesh)
+
+        assert mesh['nodes'].flags.writeable
+        assert mesh['elements'].flags.writeable
+        assert mesh['physical-lines']['wall'].flags.writeable
+
+    def check_mesh(self, mesh):
+        assert mesh['elements'].tolist() == [[0, 1, 3]]
+        assert mesh['physical-lines']['wall'].tolist() == [[0, 3]]
+        assert np.array_equal(
+            mesh['nodes'], [[0, 0], [0, 1], [0, 0], [1, 0]]
+        )
+
+    def read_mesh(self, order):
+        return mshbinary.MSHBinary.from_buffer(
+            make_content(order)
+        ).read()
+
+
+if __name__ == '__main__':
+    unittest.main()
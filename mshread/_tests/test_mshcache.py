@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""Tests cache of converted meshes.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+from triellipt.mshread import MSHReader
+
+
+def dirpath():
+    return os.path.join(
+        os.path.dirname(__file__), 'msh'
+    )
+
+
+class TestCache(unittest.TestCase):
+
+    def setUp(self):
+
+        self.tempdir = tempfile.mkdtemp()
+
+        self.meshdir = os.path.join(self.tempdir, 'msh')
+        self.cachedir = os.path.join(self.tempdir, 'cache')
+
+        shutil.copytree(dirpath(), self.meshdir)
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir, ignore_errors=True)
+
+    def test_warm_read(self):
+
+        mesh1 = self.reader().read_mesh('rect-gmsh.msh')
+        mesh2 = self.reader().read_mesh('rect-gmsh.msh')
+
+        assert isinstance(mesh2.points, np.memmap)
+        assert np.array_equal(mesh1.triangs, mesh2.triangs)
+
+    def test_invalidation(self):
+
+        self.reader().read_mesh('rect-gmsh.msh')
+
+        shutil.copy(
+            os.path.join(self.meshdir, 'circ-gmsh.msh'),
+            os.path.join(self.meshdir, 'rect-gmsh.msh')
+        )
+
+        mesh1 = self.reader().read_mesh('rect-gmsh.msh')
+        mesh2 = self.reader().read_mesh_nocache('circ-gmsh.msh')
+
+        assert np.array_equal(mesh1.points, mesh2.points)
+
+    def test_eviction(self):
+
+        reader = self.reader(max_bytes=1)
+
+        reader.read_mesh('rect-gmsh.msh')
+        reader.read_mesh('circ-gmsh.msh')
+
+        assert len(reader.meshcache.entries()) == 1
+
+    def reader(self, max_bytes=None):
+        return MSHReader.from_path(self.meshdir).with_cache(
+            self.cachedir, max_bytes
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,7 @@
 """
 import os
 import unittest
+import numpy as np
 from triellipt.mshread import MSHReader
 
 
@@ -30,6 +31,45 @@ class TestReader(unittest.TestCase):
         assert self.mesh_circ['elements'].shape == (64, 3)
         assert self.mesh_circ['elements'].dtype.name == 'int32'
 
+    def test_read_meshes(self):
+
+        meshes = dict(
+            self.READER.read_meshes(workers=2)
+        )
+
+        assert meshes['circ-gmsh.msh'].ntriangs == 64
+        assert meshes['rect-gmsh.msh'].ntriangs == 66
+
+    def test_parallel_serial(self):
+        """Parallel reading gives the same meshes as the serial one.
+        """
+
+        meshes = dict(
+            self.READER.read_meshes(workers=2)
+        )
+
+        for name, mesh in meshes.items():
+
+            serial = self.READER.read_mesh(name)
+
+            assert np.array_equal(mesh.points, serial.points)
+            assert np.array_equal(mesh.triangs, serial.triangs)
+
+            assert mesh.meta.keys() == serial.meta.keys()
+
+            assert np.array_equal(
+                mesh.meta['old-nodes-numbers'],
+                serial.meta['old-nodes-numbers']
+            )
+
+            groups = mesh.meta['physical-lines']
+            serial_groups = serial.meta['physical-lines']
+
+            assert groups.keys() == serial_groups.keys()
+
+            for key, nodes in groups.items():
+                assert np.array_equal(nodes, serial_groups[key])
+
     @property
     def mesh_circ(self):
         return self.READER.read_mesh_data('circ-gmsh.msh')
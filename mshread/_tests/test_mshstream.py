@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""Tests streaming MSH reader.
+"""
+import io
+import os
+import unittest
+import numpy as np
+from triellipt.mshread import mshstream
+
+
+def filepath(name):
+    return os.path.join(
+        os.path.dirname(__file__), 'msh', name
+    )
+
+
+class TestStream(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.MESH = mshstream.read_msh(filepath('rect-gmsh.msh'))
+
+    def test_nodes(self):
+        assert self.MESH['nodes'].shape == (44, 2)
+        assert self.MESH['nodes'][8].tolist() == [1., 0.2]
+
+    def test_elements(self):
+        assert self.MESH['elements'].shape == (66, 3)
+        assert self.MESH['elements'][0].tolist() == [32, 37, 36]
+
+    def test_no_elements(self):
+        with self.assertRaises(mshstream.MSHStreamError):
+            self.read_bytes(self.content_no_elements)
+
+    @property
+    def content_no_elements(self):
+        return (
+            b'$MeshFormat\n4.1 0 8\n$EndMeshFormat\n'
+            b'$Nodes\n1 1 1 1\n0 1 0 1\n1\n0 0 0\n$EndNodes\n'
+        )
+
+    def read_bytes(self, content):
+        return mshstream.MSHStream.from_file(
+            io.BytesIO(content)
+        ).read()
+
+
+class TestStreamTags(unittest.TestCase):
+
+    CONTENT = (
+        b'$MeshFormat\n4.1 0 8\n$EndMeshFormat\n'
+        b'$Comments\nany text\n$EndComments\n'
+        b'$Nodes\n1 3 1 4\n2 1 0 3\n1\n4\n2\n0 0 0\n1 0 0\n0 1 0\n'
+        b'$EndNodes\n'
+        b'$Elements\n1 1 1 1\n2 1 2 1\n1 1 2 4\n$EndElements\n'
+    )
+
+    def test_nodes_by_tags(self):
+        assert np.array_equal(
+            self.mesh['nodes'], [[0, 0], [0, 1], [0, 0], [1, 0]]
+        )
+
+    def test_elements(self):
+        assert self.mesh['elements'].tolist() == [[0, 1, 3]]
+
+    @property
+    def mesh(self):
+        return mshstream.MSHStream.from_file(
+            io.BytesIO(self.CONTENT)
+        ).read()
+
+
+class TestStreamGroups(unittest.TestCase):
+
+    CONTENT = (
+        b'$MeshFormat\n4.1 0 8\n$EndMeshFormat\n'
+        b'$PhysicalNames\n2\n1 5 "wall"\n2 6 "domain"\n$EndPhysicalNames\n'
+        b'$Entities\n1 2 0 0\n1 0 0 0 0\n'
+        b'1 0 0 0 1 0 0 1 5 2 1 -1\n2 0 0 0 0 1 0 1 7 0\n$EndEntities\n'
+        b'$Nodes\n1 3 1 3\n2 1 0 3\n1\n2\n3\n0 0 0\n1 0 0\n0 1 0\n'
+        b'$EndNodes\n'
+        b'$Elements\n3 4 1 4\n1 1 1 1\n1 1 2\n1 2 1 1\n2 1 3\n'
+        b'2 1 2 2\n3 1 2 3\n4 3 2 1\n$EndElements\n'
+    )
+
+    def test_groups(self):
+        assert list(self.mesh['physical-lines']) == ['wall', '7']
+        assert self.mesh['physical-lines']['wall'].tolist() == [[0, 1]]
+        assert self.mesh['physical-lines']['7'].tolist() == [[0, 2]]
+
+    def test_elements(self):
+        assert self.mesh['elements'].tolist() == [[0, 1, 2], [2, 1, 0]]
+
+    @property
+    def mesh(self):
+        return mshstream.MSHStream.from_file(
+            io.BytesIO(self.CONTENT)
+        ).read()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""Tests MSH writer.
+"""
+import os
+import tempfile
+import unittest
+import numpy as np
+from triellipt import mesher, amr
+from triellipt.mshread import mshwriter, mshstream, mshbinary
+
+
+class TestWriter(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.MESH = mesher.trigrid(3, 3, 'west-slope').add_meta(
+            {'voids': np.array([1])}
+        )
+
+    def test_ascii(self):
+        self.check_mesh(self.write_read(False, mshstream.read_msh))
+
+    def test_binary(self):
+        self.check_mesh(self.write_read(True, mshbinary.read_msh))
+
+    def test_node_data(self):
+
+        with tempfile.TemporaryDirectory() as path:
+
+            filepath = os.path.join(path, 'mesh.msh')
+
+            mshwriter.write_msh(filepath, self.MESH).close()
+
+            with mshwriter.append_msh(filepath) as writer:
+                writer.write_node_data(
+                    'u', np.arange(1, 10), step=3, time=0.5
+                )
+
+            with open(filepath) as file:
+                text = file.read()
+
+        values = ''.join(f'{i} {i}\n' for i in range(1, 10))
+
+        assert text.endswith(
+            '$NodeData\n1\n"u"\n1\n0.5\n3\n3\n1\n9\n'
+            + values + '$EndNodeData\n'
+        )
+
+    def test_data_count(self):
+        """Rejects data not matching the mesh nodes or triangles.
+        """
+
+        with tempfile.TemporaryDirectory() as path:
+
+            filepath = os.path.join(path, 'mesh.msh')
+
+            with mshwriter.write_msh(filepath, self.MESH) as writer:
+                with self.assertRaises(mshwriter.MSHWriterError):
+                    writer.write_node_data('u', [1, 2])
+                with self.assertRaises(mshwriter.MSHWriterError):
+                    writer.write_elem_data('v', np.ones(self.MESH.npoints))
+
+            with mshwriter.append_msh(filepath) as writer:
+                with self.assertRaises(mshwriter.MSHWriterError):
+                    writer.write_elem_data('v', [1, 2])
+
+    def test_amr_voids(self):
+        """Finds the voids of a mesh with no voids in the meta.
+        """
+
+        unit = amr.getunit(mesher.trigrid(5, 5, 'west-slope'))
+        mesh = unit.refine([0, 1]).mesh
+
+        voids = mesh.getvoids()
+
+        with tempfile.TemporaryDirectory() as path:
+
+            filepath = os.path.join(path, 'mesh.msh')
+            mshwriter.write_msh(filepath, mesh).close()
+
+            elements = mshstream.read_msh(filepath)['elements']
+
+        assert voids.size > 0
+        assert elements[-voids.size:].tolist() == mesh.triangs[voids].tolist()
+
+    def check_mesh(self, mesh):
+        assert np.array_equal(
+            mesh['nodes'], self.MESH.points2d.T
+        )
+        assert mesh['elements'].tolist() == [
+            *np.delete(self.MESH.triangs, 1, axis=0).tolist(),
+            self.MESH.triangs[1].tolist()
+        ]
+
+    def write_read(self, binary, reader):
+
+        with tempfile.TemporaryDirectory() as path:
+
+            filepath = os.path.join(path, 'mesh.msh')
+
+            with mshwriter.write_msh(filepath, self.MESH, binary) as writer:
+                writer.write_node_data('u', self.MESH.points)
+                writer.write_elem_data('v', np.ones(self.MESH.ntriangs))
+
+            return reader(filepath)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,438 @@
+# -*- coding: utf-8 -*-
+"""Reader of binary MSH files.
+"""
+import mmap
+import numpy as np
+from triellipt.mshread import mshgroups
+
+MSHBinaryError = type(
+    'MSHBinaryError', (Exception,), {}
+)
+
+
+def is_binary(filepath):
+    """Checks if an MSH file is binary.
+    """
+
+    with open(filepath, mode='rb') as file:
+        head = file.readline().strip()
+        spec = file.readline().split()
+
+    if head != b'$MeshFormat' or len(spec) < 2:
+        return False
+    return spec[1] == b'1'
+
+
+def read_msh(filepath):
+    """Reads mesh data from a binary MSH 4.1 file.
+
+    Parameters
+    ----------
+    filepath : str
+        Path to the `.msh` file.
+
+    Returns
+    -------
+    dict
+        Mesh data with "nodes", "elements" and "physical-lines" (i).
+
+    Notes
+    -----
+
+    (i) Arrays are copied out of the memory map, closed on return.
+
+    """
+
+    with open(filepath, mode='rb') as file:
+        with mmap.mmap(
+            file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as buffer:
+            return MSHBinary.from_buffer(buffer).read()
+
+
+class MSHBinary:
+    """Reads MSH sections from a binary buffer.
+    """
+
+    def __init__(self, buffer=None):
+        self.buffer = buffer
+        self.offset = 0
+        self.meta = {}
+
+    @classmethod
+    def from_buffer(cls, buffer):
+        return cls(buffer)
+
+    @property
+    def int_type(self):
+        return self.meta['MeshFormat']['int-type']
+
+    @property
+    def size_type(self):
+        return self.meta['MeshFormat']['size-type']
+
+    @property
+    def float_type(self):
+        return self.meta['MeshFormat']['float-type']
+
+    def read(self):
+
+        for name in self.gen_section_names():
+            self.read_section(name)
+
+        return self.get_mesh_dict()
+
+    def gen_section_names(self):
+
+        while True:
+
+            line = self.read_line()
+
+            if line is None:
+                return
+
+            if not line:
+                continue
+
+            if not line.startswith(b'$'):
+                raise MSHBinaryError(
+                    "corrupted MSH file, got data outside sections"
+                )
+
+            yield line[1:].decode()
+
+    def read_section(self, name):
+
+        reader = SECTION_READERS.get(name, SkipReader)
+
+        self.meta[name] = reader.from_binary(self).read(name)
+        self.read_section_end(name)
+
+    def read_section_end(self, name):
+
+        line = self.read_line()
+
+        if not line:
+            line = self.read_line()
+
+        if line != b'$End' + name.encode():
+            raise MSHBinaryError(
+                f"corrupted MSH file, '$End{name}' not found"
+            )
+
+    def read_line(self):
+
+        if self.offset >= len(self.buffer):
+            return None
+
+        end = self.buffer.find(b'\n', self.offset)
+
+        if end == -1:
+            end = len(self.buffer)
+
+        line = self.buffer[self.offset:end]
+        self.offset = end + 1
+
+        return bytes(line).strip()
+
+    def take(self, dtype, count):
+        """Views the next `count` items, moves the offset.
+        """
+
+        dtype = np.dtype(dtype)
+        nbytes = dtype.itemsize * count
+
+        if self.offset + nbytes > len(self.buffer):
+            raise MSHBinaryError(
+                "corrupted MSH file, data truncated"
+            )
+
+        data = np.frombuffer(
+            self.buffer, dtype=dtype, count=count, offset=self.offset
+        )
+
+        self.offset += nbytes
+        return data
+
+    def take_ints(self, dtypes):
+        return [
+            int(self.take(dtype, 1)[0]) for dtype in dtypes
+        ]
+
+    def get_mesh_dict(self):
+
+        nodes = self.get_section_data('Nodes')
+        elements = self.get_section_data('Elements')
+
+        return {
+            'nodes': nodes,
+            'elements': elements['triangs'],
+            'physical-lines': self.get_physical_lines(elements['lines'])
+        }
+
+    def get_physical_lines(self, lines_blocks):
+        return mshgroups.group_lines(
+            lines_blocks,
+            self.meta.get('Entities', {}).get('curves', {}),
+            self.meta.get('PhysicalNames', {})
+        )
+
+    def get_section_data(self, name):
+
+        if name not in self.meta:
+            raise MSHBinaryError(
+                f"cannot find '{name}' in sections"
+            )
+
+        return self.meta[name]
+
+
+class SectionReader:
+    """Reads the body of a binary MSH section.
+    """
+
+    def __init__(self, binary):
+        self.binary = binary
+        self.cache = {}
+
+    @classmethod
+    def from_binary(cls, binary):
+        return cls(binary)
+
+    def read(self, name):
+        return None
+
+    def take(self, dtype, count):
+        return self.binary.take(dtype, count)
+
+    @property
+    def block_spec_types(self):
+
+        itype = self.binary.int_type
+        stype = self.binary.size_type
+
+        return [itype, itype, itype, stype]
+
+    @property
+    def section_spec_types(self):
+        return 4 * [self.binary.size_type]
+
+
+class SkipReader(SectionReader):
+    """Skips a section.
+    """
+
+    def read(self, name):
+
+        end = self.binary.buffer.find(
+            b'$End' + name.encode(), self.binary.offset
+        )
+
+        if end == -1:
+            raise MSHBinaryError(
+                f"corrupted MSH file, '$End{name}' not found"
+            )
+
+        self.binary.offset = end
+
+
+class FormatReader(SectionReader):
+    """Reads the mesh format and the byte order.
+    """
+
+    def read(self, name):
+
+        version, file_type, data_size = self.binary.read_line().split()
+
+        if not version.startswith(b'4'):
+            raise MSHBinaryError(
+                f"got unsupported MSH version {version.decode()}"
+            )
+
+        if int(file_type) != 1:
+            raise MSHBinaryError(
+                "got ASCII MSH file, expected binary"
+            )
+
+        order = self.find_byte_order()
+
+        return {
+            'version': version.decode(),
+            'file-type': 1,
+            'int-type': order + 'i4',
+            'size-type': order + f'u{int(data_size)}',
+            'float-type': order + 'f8'
+        }
+
+    def find_byte_order(self):
+
+        one = self.take('<i4', 1)[0]
+
+        if one == 1:
+            return '<'
+        return '>'
+
+
+class NodesReader(SectionReader):
+    """Reads nodes by node tags.
+    """
+
+    def read(self, name):
+
+        nblocks, _, _, max_tag = self.binary.take_ints(
+            self.section_spec_types
+        )
+
+        nodes = np.zeros((max_tag, 2))
+
+        for _ in range(nblocks):
+            self.read_block(nodes)
+
+        return nodes
+
+    def read_block(self, nodes):
+
+        dim, _, parametric, count = self.binary.take_ints(
+            self.block_spec_types
+        )
+
+        tags = self.take(self.binary.size_type, count)
+
+        rank = 3 + (dim if parametric else 0)
+
+        coords = self.take(
+            self.binary.float_type, rank * count
+        )
+
+        nodes[tags.astype(np.int64) - 1] = coords.reshape(count, rank)[:, :2]
+
+
+class ElementsReader(SectionReader):
+    """Reads triangles into a preallocated table.
+    """
+
+    NODES_IN_ELM_TYPE = {
+        1: 2,
+        2: 3,
+        3: 4,
+        15: 1
+    }
+
+    def read(self, name):
+
+        nblocks, count, _, _ = self.binary.take_ints(
+            self.section_spec_types
+        )
+
+        self.cache |= {
+            'triangs': np.empty((count, 3), dtype=int),
+            'ntriangs': 0,
+            'lines': []
+        }
+
+        for _ in range(nblocks):
+            self.read_block()
+
+        return {
+            'triangs': self.cache['triangs'][:self.cache['ntriangs']].copy(),
+            'lines': self.cache['lines']
+        }
+
+    def read_block(self):
+
+        _, enty_tag, elm_type, count = self.binary.take_ints(
+            self.block_spec_types
+        )
+
+        if elm_type not in self.NODES_IN_ELM_TYPE:
+            raise MSHBinaryError(
+                f"got unknown element type {elm_type}"
+            )
+
+        rank = 1 + self.NODES_IN_ELM_TYPE[elm_type]
+
+        data = self.take(
+            self.binary.size_type, rank * count
+        )
+
+        if elm_type not in (1, 2):
+            return
+
+        nodes = data.reshape(count, rank)[:, 1:].astype(np.int64) - 1
+
+        if elm_type == 1:
+            self.cache['lines'].append((enty_tag, nodes))
+            return
+
+        start = self.cache['ntriangs']
+        self.cache['triangs'][start:start + count] = nodes
+
+        self.cache['ntriangs'] += count
+
+
+class PhysicalNamesReader(SectionReader):
+    """Reads names of physical groups, stored as text in binary files.
+    """
+
+    def read(self, name):
+
+        count = int(self.binary.read_line())
+
+        return dict(
+            mshgroups.parse_physical_name(self.binary.read_line().decode())
+            for _ in range(count)
+        )
+
+
+class EntitiesReader(SectionReader):
+    """Reads physical tags of curves.
+    """
+
+    def read(self, name):
+
+        npoints, ncurves, _, _ = self.binary.take_ints(
+            self.section_spec_types
+        )
+
+        for _ in range(npoints):
+            self.skip_point()
+
+        curves = dict(
+            self.read_curve() for _ in range(ncurves)
+        )
+
+        SkipReader.from_binary(self.binary).read(name)
+
+        return {
+            'curves': curves
+        }
+
+    def skip_point(self):
+        self.take(self.binary.int_type, 1)
+        self.take(self.binary.float_type, 3)
+        self.take_tags()
+
+    def read_curve(self):
+
+        tag, = self.binary.take_ints([self.binary.int_type])
+        self.take(self.binary.float_type, 6)
+
+        physicals = self.take_tags()
+        self.take_tags()
+
+        return tag, physicals.tolist()
+
+    def take_tags(self):
+
+        count, = self.binary.take_ints([self.binary.size_type])
+
+        return self.take(self.binary.int_type, count)
+
+
+SECTION_READERS = {
+    'MeshFormat': FormatReader,
+    'PhysicalNames': PhysicalNamesReader,
+    'Entities': EntitiesReader,
+    'Nodes': NodesReader,
+    'Elements': ElementsReader
+}
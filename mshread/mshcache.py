@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""Cache of converted meshes.
+"""
+import hashlib
+import json
+import os
+import shutil
+from triellipt.trimesh import trimesh_
+
+SOURCE = 'source.json'
+DIGEST_CHUNK = 2**22
+
+
+class MSHCache:
+    """Stores meshes read from MSH files as `.npy` dumps.
+
+    Attributes
+    ----------
+    root_path : str
+        Cache directory.
+    max_bytes : int
+        Size bound of the cache, unbounded if None.
+
+    """
+
+    def __init__(self, root_path=None, max_bytes=None):
+        self.root_path = root_path
+        self.max_bytes = max_bytes
+
+    @classmethod
+    def from_path(cls, path, max_bytes=None):
+        os.makedirs(path, exist_ok=True)
+        return cls(path, max_bytes)
+
+    def fetch(self, filepath):
+        """Loads a cached mesh, returns None on a miss.
+        """
+
+        entry = self.entry_path(filepath)
+
+        if not self.is_valid(entry, filepath):
+            return None
+
+        _touch(
+            os.path.join(entry, SOURCE)
+        )
+
+        return trimesh_.TriMesh.load(entry, mmap_mode='c')
+
+    def store(self, filepath, mesh):
+        """Puts a mesh to the cache and evicts old entries.
+        """
+
+        entry = self.entry_path(filepath)
+
+        if os.path.isdir(entry):
+            shutil.rmtree(entry)
+
+        mesh.dump(entry)
+        _write_spec(entry, filepath)
+
+        self.evict(keep=entry)
+
+    def is_valid(self, entry, filepath):
+
+        spec_path = os.path.join(entry, SOURCE)
+
+        if not os.path.isfile(spec_path):
+            return False
+
+        with open(spec_path) as file:
+            spec = json.load(file)
+
+        if not self.is_same_source(spec, filepath):
+            return False
+
+        if spec['mtime'] != os.stat(filepath).st_mtime_ns:
+            _write_spec(entry, filepath)
+
+        return True
+
+    def is_same_source(self, spec, filepath):
+
+        stat = os.stat(filepath)
+
+        if spec['size'] != stat.st_size:
+            return False
+
+        if spec['mtime'] == stat.st_mtime_ns:
+            return True
+
+        return spec['digest'] == _digest(filepath)
+
+    def entry_path(self, filepath):
+
+        key = hashlib.sha1(
+            os.path.abspath(filepath).encode()
+        )
+
+        return os.path.join(
+            self.root_path, key.hexdigest()
+        )
+
+    def entries(self):
+
+        names = os.listdir(self.root_path)
+
+        return [
+            os.path.join(self.root_path, name) for name in names
+            if os.path.isfile(os.path.join(self.root_path, name, SOURCE))
+        ]
+
+    def evict(self, keep=None):
+        """Removes the least recently used entries above the size bound.
+        """
+
+        if self.max_bytes is None:
+            return
+
+        entries = sorted(
+            self.entries(), key=_last_used, reverse=True
+        )
+
+        total = 0
+
+        for entry in entries:
+
+            total += _dir_size(entry)
+
+            if total > self.max_bytes and entry != keep:
+                shutil.rmtree(entry)
+
+    def clear(self):
+        """Removes all cache entries.
+        """
+        for entry in self.entries():
+            shutil.rmtree(entry)
+
+
+def _write_spec(entry, filepath):
+    with open(os.path.join(entry, SOURCE), 'w') as file:
+        json.dump(_source_spec(filepath), file)
+
+
+def _source_spec(filepath):
+
+    stat = os.stat(filepath)
+
+    return {
+        'path': os.path.abspath(filepath),
+        'size': stat.st_size,
+        'mtime': stat.st_mtime_ns,
+        'digest': _digest(filepath)
+    }
+
+
+def _digest(filepath):
+
+    digest = hashlib.blake2b()
+
+    with open(filepath, mode='rb') as file:
+        for chunk in iter(lambda: file.read(DIGEST_CHUNK), b''):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def _touch(path):
+    os.utime(path)
+
+
+def _last_used(entry):
+    return os.stat(
+        os.path.join(entry, SOURCE)
+    ).st_mtime_ns
+
+
+def _dir_size(path):
+    return sum(
+        e.stat().st_size for e in os.scandir(path) if e.is_file()
+    )
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""Physical groups of MSH line elements.
+"""
+import numpy as np
+
+
+def group_lines(lines_blocks, curves_physicals, physical_names):
+    """Groups line elements by physical tags.
+
+    Parameters
+    ----------
+    lines_blocks : list
+        Pairs of curve tags and 2-column-int-tables of line elements.
+    curves_physicals : dict
+        Maps curve tags to lists of physical tags.
+    physical_names : dict
+        Maps `(dim, tag)` pairs to physical names.
+
+    Returns
+    -------
+    dict
+        Maps physical names to 2-column-int-tables of line elements (i).
+
+    Notes
+    -----
+
+    (i) Unnamed groups are keyed by physical tags as strings.
+
+    """
+
+    groups = {}
+
+    for curve_tag, lines in lines_blocks:
+        for tag in curves_physicals.get(curve_tag, []):
+            groups.setdefault(tag, []).append(lines)
+
+    return {
+        _group_name(tag, physical_names): np.vstack(tables)
+        for tag, tables in groups.items()
+    }
+
+
+def parse_physical_name(line):
+    """Parses a line of the `$PhysicalNames` section.
+    """
+
+    dim, tag, name = line.split(maxsplit=2)
+
+    return (int(dim), int(tag)), name.strip().strip('"')
+
+
+def _group_name(tag, physical_names):
+    return physical_names.get(
+        (1, tag), str(tag)
+    )
+
+
+def renum_groups(groups, old_nodes):
+    """Renumbers line elements after removing ghost nodes.
+
+    Parameters
+    ----------
+    groups : dict
+        Maps physical names to 2-column-int-tables of line elements.
+    old_nodes : flat-int-array
+        Old numbers of the remaining nodes.
+
+    Returns
+    -------
+    dict
+        Groups in terms of new node numbers.
+
+    """
+
+    if not groups:
+        return {}
+
+    new_nodes = np.full(old_nodes.max() + 1, -1)
+    new_nodes[old_nodes] = np.arange(old_nodes.size)
+
+    return {
+        name: new_nodes[lines] for name, lines in groups.items()
+    }
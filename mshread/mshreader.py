@@ -2,8 +2,11 @@
 """Reads meshes from MSH files.
 """
 import os
-from triellipt.mshread import mshparser
-from triellipt.mshread import mshblocks
+from concurrent import futures
+from triellipt.mshread import mshstream
+from triellipt.mshread import mshbinary
+from triellipt.mshread import mshcache
+from triellipt.mshread import mshgroups
 from triellipt.trimesh import trimesh_
 
 MSHReaderError = type(
@@ -35,6 +38,7 @@ class MSHReader:
     def __init__(self, root_path=None):
 
         self.root_path = root_path
+        self.meshcache = None
 
         if root_path is None:
             return
@@ -55,6 +59,32 @@ class MSHReader:
     def from_path(cls, path):
         return cls(path)
 
+    def with_cache(self, cache_path, max_bytes=None):
+        """Enables caching of the read meshes.
+
+        Parameters
+        ----------
+        cache_path : str
+            Path to the cache directory, created if missing.
+        max_bytes : int = None
+            Size bound of the cache, unbounded if None.
+
+        Returns
+        -------
+        MSHReader
+            Reader with the cache enabled.
+
+        Notes
+        -----
+
+        - Cached meshes are loaded memory-mapped in copy-on-write mode.
+        - An entry is valid while the file size and content are the same.
+        - Least recently used entries are evicted above the size bound.
+
+        """
+        self.meshcache = mshcache.MSHCache.from_path(cache_path, max_bytes)
+        return self
+
     def listmeshes(self):
         """Returns list of `.msh` files in the root directory.
         """
@@ -69,7 +99,7 @@ class MSHReader:
         ]
 
     def read_mesh(self, file_name):
-        """Reads a mesh from an `.msh` file.
+        """Reads a mesh from an ASCII or binary `.msh` file.
 
         Parameters
         ----------
@@ -81,18 +111,149 @@ class MSHReader:
         TriMesh
             Mesh object.
 
+        Notes
+        -----
+
+        - Line elements of physical curves are kept in the mesh meta.
+        - The meta entry "physical-lines" maps group names to node pairs.
+        - Unnamed groups are keyed by physical tags as strings.
+
         """
 
+        if self.meshcache is None:
+            return self.read_mesh_nocache(file_name)
+
+        filepath = self.make_filepath(file_name)
+        trimesh = self.meshcache.fetch(filepath)
+
+        if trimesh is not None:
+            return trimesh
+
+        trimesh = self.read_mesh_nocache(file_name)
+        self.meshcache.store(filepath, trimesh)
+
+        return trimesh
+
+    def read_meshes(self, names=None, workers=None):
+        """Reads meshes from `.msh` files in parallel.
+
+        Parameters
+        ----------
+        names : Iterable = None
+            Names of the `.msh` files, if None takes `listmeshes()`.
+        workers : int = None
+            Number of worker processes, if None takes the CPU count.
+
+        Returns
+        -------
+        generator
+            Yields pairs of file names and results as they finish (i).
+
+        Notes
+        -----
+
+        (i) A result is a `TriMesh` or an `MSHReaderError` for the file.
+
+        """
+
+        if names is None:
+            names = self.listmeshes()
+
+        names = list(names)
+
+        if workers == 1:
+            return self.gen_meshes_serial(names)
+        return self.gen_meshes_parallel(names, workers)
+
+    def gen_meshes_serial(self, names):
+        for name in names:
+            yield name, self.read_mesh_safe(name)
+
+    def gen_meshes_parallel(self, names, workers):
+
+        to_parse = []
+
+        for name in names:
+
+            trimesh = self.fetch_cached(name)
+
+            if trimesh is None:
+                to_parse.append(name)
+                continue
+
+            yield name, trimesh
+
+        if not to_parse:
+            return
+
+        executor = futures.ProcessPoolExecutor(workers)
+
+        try:
+
+            tasks = {
+                executor.submit(_read_in_worker, self.root_path, name): name
+                for name in to_parse
+            }
+
+            for task in futures.as_completed(tasks):
+                yield tasks[task], self.from_worker(tasks[task], task)
+
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def from_worker(self, name, task):
+
+        try:
+            trimesh = task.result()
+        except Exception as exc:
+            return _as_reader_error(name, exc)
+
+        if self.meshcache is not None:
+            self.meshcache.store(self.make_filepath(name), trimesh)
+
+        return trimesh
+
+    def fetch_cached(self, name):
+
+        if self.meshcache is None:
+            return None
+
+        try:
+            return self.meshcache.fetch(self.make_filepath(name))
+        except (OSError, MSHReaderError):
+            return None
+
+    def read_mesh_safe(self, name):
+        try:
+            return self.read_mesh(name)
+        except Exception as exc:
+            return _as_reader_error(name, exc)
+
+    def read_mesh_nocache(self, file_name):
+
         mshdata = self.read_mesh_data(file_name)
         trimesh = self.from_mesh_data(mshdata)
 
         trimesh = trimesh.delghosts()
-        return trimesh
+
+        groups = mshgroups.renum_groups(
+            mshdata.get('physical-lines', {}),
+            trimesh.meta['old-nodes-numbers']
+        )
+
+        return trimesh.add_meta(
+            {'physical-lines': groups}
+        )
 
     def from_mesh_data(self, mesh_dict):
         return trimesh_.TriMesh.from_mesh_dict(mesh_dict)
 
     def read_mesh_data(self, file_name) -> dict:
+        return self.read_msh_file(
+            self.make_filepath(file_name)
+        )
+
+    def make_filepath(self, file_name):
 
         try:
             filepath = os.path.join(
@@ -106,25 +267,24 @@ class MSHReader:
                 "file not found, check the path"
             )
 
-        sections = self.parse_into_sections(filepath)
-        meshdict = self.fetch_from_sections(sections)
+        return filepath
+
+    def read_msh_file(self, filepath):
+
+        if mshbinary.is_binary(filepath):
+            return mshbinary.read_msh(filepath)
+        return mshstream.read_msh(filepath)
 
-        return meshdict
 
-    def parse_into_sections(self, filepath):
-        content = self.read_file(filepath)
-        return mshparser.MSHParser.with_content(content).getsections()
+def _read_in_worker(root_path, file_name):
+    return MSHReader(root_path).read_mesh_nocache(file_name)
 
-    def fetch_from_sections(self, sections: dict):
 
-        nodes = mshblocks.MSHNodes.from_sections(sections)
-        elements = mshblocks.MSHElements.from_sections(sections)
+def _as_reader_error(file_name, exc):
 
-        return {
-            'nodes': nodes,
-            'elements': elements
-        }
+    if isinstance(exc, MSHReaderError):
+        return exc
 
-    def read_file(self, abspath):
-        with open(abspath, encoding='utf-8', mode='r') as file:
-            return file.read()
+    return MSHReaderError(
+        f"cannot read '{file_name}': {exc}"
+    )
@@ -0,0 +1,371 @@
+# -*- coding: utf-8 -*-
+"""Streaming reader of MSH files.
+"""
+import itertools as itr
+import numpy as np
+from triellipt.mshread import mshgroups
+
+CHUNK_LINES = 2**16
+
+MSHStreamError = type(
+    'MSHStreamError', (Exception,), {}
+)
+
+
+def read_msh(filepath):
+    """Reads mesh data from an MSH 4.1 file.
+
+    Parameters
+    ----------
+    filepath : str
+        Path to the `.msh` file.
+
+    Returns
+    -------
+    dict
+        Mesh data with "nodes", "elements" and "physical-lines".
+
+    """
+    with open(filepath, mode='rb') as file:
+        return MSHStream.from_file(file).read()
+
+
+class MSHStream:
+    """Reads MSH sections one by one from an open file.
+    """
+
+    def __init__(self, file=None):
+        self.file = file
+        self.meta = {}
+
+    @classmethod
+    def from_file(cls, file):
+        return cls(file)
+
+    def read(self):
+
+        for name in self.gen_section_names():
+            self.read_section(name)
+
+        return self.get_mesh_dict()
+
+    def gen_section_names(self):
+
+        for line in self.file:
+
+            line = line.strip()
+
+            if not line:
+                continue
+
+            if not line.startswith(b'$'):
+                raise MSHStreamError(
+                    "corrupted MSH file, got data outside sections"
+                )
+
+            yield line[1:].decode()
+
+    def read_section(self, name):
+
+        reader = SECTION_READERS.get(name, SkipReader)
+
+        self.meta[name] = reader.from_stream(self).read()
+        self.read_section_end(name)
+
+    def read_section_end(self, name):
+
+        line = self.file.readline().strip()
+
+        if line != b'$End' + name.encode():
+            raise MSHStreamError(
+                f"corrupted MSH file, '$End{name}' not found"
+            )
+
+    def get_mesh_dict(self):
+
+        nodes = self.get_section_data('Nodes')
+        elements = self.get_section_data('Elements')
+
+        return {
+            'nodes': nodes,
+            'elements': elements['triangs'],
+            'physical-lines': self.get_physical_lines(elements['lines'])
+        }
+
+    def get_physical_lines(self, lines_blocks):
+        return mshgroups.group_lines(
+            lines_blocks,
+            self.meta.get('Entities', {}).get('curves', {}),
+            self.meta.get('PhysicalNames', {})
+        )
+
+    def get_section_data(self, name):
+
+        if name not in self.meta:
+            raise MSHStreamError(
+                f"cannot find '{name}' in sections"
+            )
+
+        return self.meta[name]
+
+
+class SectionReader:
+    """Reads the body of an MSH section.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.cache = {}
+
+    @classmethod
+    def from_stream(cls, stream):
+        return cls(stream)
+
+    @property
+    def file(self):
+        return self.stream.file
+
+    def read(self):
+        return None
+
+    def read_ints(self, count):
+
+        data = _parse_text(
+            self.file.readline(), np.int64
+        )
+
+        if data.size < count:
+            raise MSHStreamError(
+                "corrupted MSH file, cannot read block spec"
+            )
+
+        return data[:count].tolist()
+
+    def read_lines(self, nlines, dtype, ncols):
+        """Parses lines in chunks into a table.
+        """
+
+        table = np.empty((nlines, ncols), dtype=dtype)
+
+        for start in range(0, nlines, CHUNK_LINES):
+
+            stop = min(start + CHUNK_LINES, nlines)
+
+            table[start:stop] = self.parse_lines(
+                stop - start, dtype, ncols
+            )
+
+        return table
+
+    def parse_lines(self, nlines, dtype, ncols):
+
+        text = b''.join(
+            itr.islice(self.file, nlines)
+        )
+
+        data = _parse_text(text, dtype)
+
+        if data.size != nlines * ncols:
+            raise MSHStreamError(
+                "corrupted MSH file, cannot read block data"
+            )
+
+        return data.reshape(nlines, ncols)
+
+    def skip_lines(self, nlines):
+        for _ in itr.islice(self.file, nlines):
+            pass
+
+
+class SkipReader(SectionReader):
+    """Skips a section.
+    """
+
+    def read(self):
+
+        offset = self.file.tell()
+
+        for line in self.file:
+
+            if line.startswith(b'$End'):
+                self.file.seek(offset)
+                return
+
+            offset += len(line)
+
+
+class FormatReader(SectionReader):
+    """Reads the mesh format.
+    """
+
+    def read(self):
+
+        version, file_type, _ = self.file.readline().split()
+
+        if not version.startswith(b'4'):
+            raise MSHStreamError(
+                f"got unsupported MSH version {version.decode()}"
+            )
+
+        if int(file_type) != 0:
+            raise MSHStreamError(
+                "got binary MSH file, expected ASCII"
+            )
+
+        return {
+            'version': version.decode(),
+            'file-type': int(file_type)
+        }
+
+
+class NodesReader(SectionReader):
+    """Reads nodes into a table preallocated by node tags.
+    """
+
+    def read(self):
+
+        nblocks, _, _, max_tag = self.read_ints(4)
+
+        nodes = np.zeros((max_tag, 2))
+
+        for _ in range(nblocks):
+            self.read_block(nodes)
+
+        return nodes
+
+    def read_block(self, nodes):
+
+        dim, _, parametric, count = self.read_ints(4)
+
+        tags = self.read_lines(count, np.int64, 1)[:, 0]
+
+        rank = 3 + (dim if parametric else 0)
+        coords = self.read_lines(count, float, rank)
+
+        nodes[tags - 1] = coords[:, [0, 1]]
+
+
+class ElementsReader(SectionReader):
+    """Reads triangles into a preallocated table.
+    """
+
+    NODES_IN_ELM_TYPE = {
+        1: 2,
+        2: 3,
+        3: 4,
+        15: 1
+    }
+
+    def read(self):
+
+        nblocks, count, _, _ = self.read_ints(4)
+
+        self.cache |= {
+            'triangs': np.empty((count, 3), dtype=int),
+            'ntriangs': 0,
+            'lines': []
+        }
+
+        for _ in range(nblocks):
+            self.read_block()
+
+        return {
+            'triangs': self.cache['triangs'][:self.cache['ntriangs']].copy(),
+            'lines': self.cache['lines']
+        }
+
+    def read_block(self):
+
+        _, enty_tag, elm_type, count = self.read_ints(4)
+
+        if elm_type not in self.NODES_IN_ELM_TYPE:
+            raise MSHStreamError(
+                f"got unknown element type {elm_type}"
+            )
+
+        if elm_type == 1:
+            self.read_lines_block(enty_tag, count)
+            return
+
+        if elm_type != 2:
+            self.skip_lines(count)
+            return
+
+        data = self.read_lines(count, np.int64, 4)
+
+        start = self.cache['ntriangs']
+
+        self.cache['triangs'][start:start + count] = data[:, 1:] - 1
+        self.cache['ntriangs'] += count
+
+    def read_lines_block(self, enty_tag, count):
+
+        data = self.read_lines(count, np.int64, 3)
+
+        self.cache['lines'].append(
+            (enty_tag, data[:, 1:] - 1)
+        )
+
+
+class PhysicalNamesReader(SectionReader):
+    """Reads names of physical groups.
+    """
+
+    def read(self):
+
+        count, = self.read_ints(1)
+
+        return dict(
+            mshgroups.parse_physical_name(self.file.readline().decode())
+            for _ in range(count)
+        )
+
+
+class EntitiesReader(SectionReader):
+    """Reads physical tags of curves.
+    """
+
+    def read(self):
+
+        npoints, ncurves, nsurfs, nvols = self.read_ints(4)
+
+        self.skip_lines(npoints)
+
+        curves = dict(
+            self.read_curve() for _ in range(ncurves)
+        )
+
+        self.skip_lines(nsurfs + nvols)
+
+        return {
+            'curves': curves
+        }
+
+    def read_curve(self):
+
+        items = self.file.readline().split()
+
+        tag = int(items[0])
+        count = int(items[7])
+
+        return tag, [
+            int(v) for v in items[8:8 + count]
+        ]
+
+
+def _parse_text(text, dtype):
+    try:
+        return np.fromstring(text, dtype=dtype, sep=' ')
+    except ValueError as exc:
+        raise MSHStreamError(
+            "corrupted MSH file, got non-numeric data"
+        ) from exc
+
+
+SECTION_READERS = {
+    'MeshFormat': FormatReader,
+    'PhysicalNames': PhysicalNamesReader,
+    'Entities': EntitiesReader,
+    'Nodes': NodesReader,
+    'Elements': ElementsReader
+}
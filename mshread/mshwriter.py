@@ -0,0 +1,417 @@
+# -*- coding: utf-8 -*-
+"""Writer of MSH 4.1 files.
+"""
+import numpy as np
+from triellipt.mshread import mshbinary, mshstream
+
+FLOAT_FORMAT = '%.16g'
+CHUNK_ROWS = 2**16
+
+MSHWriterError = type(
+    'MSHWriterError', (Exception,), {}
+)
+
+
+def write_msh(filepath, mesh, binary=False):
+    """Writes a mesh to an MSH 4.1 file.
+
+    Parameters
+    ----------
+    filepath : str
+        Path to the `.msh` file.
+    mesh : TriMesh
+        Mesh to write.
+    binary : bool = False
+        Writes a binary file, if True.
+
+    Returns
+    -------
+    MSHWriter
+        Open writer to add data series (i).
+
+    Notes
+    -----
+
+    (i) The writer must be closed, or used as a context manager.
+
+    """
+
+    writer = MSHWriter.from_path(filepath, binary, mode='wb')
+    writer.write_mesh(mesh)
+
+    return writer
+
+
+def append_msh(filepath):
+    """Opens an MSH 4.1 file to append data series.
+
+    Parameters
+    ----------
+    filepath : str
+        Path to the `.msh` file written before.
+
+    Returns
+    -------
+    MSHWriter
+        Open writer to add data series.
+
+    """
+
+    binary = mshbinary.is_binary(filepath)
+
+    if binary:
+        mesh = mshbinary.read_msh(filepath)
+    if not binary:
+        mesh = mshstream.read_msh(filepath)
+
+    writer = MSHWriter.from_path(filepath, binary, mode='ab')
+
+    writer.counts = {
+        'NodeData': len(mesh['nodes']),
+        'ElementData': len(mesh['elements'])
+    }
+
+    return writer
+
+
+class MSHWriter:
+    """Writes MSH sections to an open file.
+
+    Attributes
+    ----------
+    file : file
+        Output file open in binary mode.
+    binary : bool
+        Binary MSH format, if True.
+    counts : dict
+        Numbers of nodes and elements of the written mesh.
+
+    """
+
+    def __init__(self, file=None, binary=False):
+        self.file = file
+        self.binary = binary
+        self.counts = None
+
+    @classmethod
+    def from_path(cls, filepath, binary=False, mode='wb'):
+        return cls(open(filepath, mode), binary)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self.file.close()
+
+    def write_mesh(self, mesh):
+        """Writes the mesh sections.
+
+        Parameters
+        ----------
+        mesh : TriMesh
+            Mesh to write.
+
+        Notes
+        -----
+
+        - Void triangles make the surface "voids", taken from the mesh
+        meta if present, otherwise found by `mesh.getvoids()`.
+        - Other triangles make the surface "domain".
+        - Element tags are triangle numbers plus one.
+
+        """
+
+        blocks = _surface_blocks(mesh)
+
+        self.counts = {
+            'NodeData': mesh.npoints, 'ElementData': mesh.ntriangs
+        }
+
+        self.write_format()
+        self.write_names(blocks)
+        self.write_entities(mesh, blocks)
+        self.write_nodes(mesh)
+        self.write_elements(mesh, blocks)
+
+    def write_node_data(self, name, data, step=0, time=0.):
+        """Writes a view of node-based data.
+
+        Parameters
+        ----------
+        name : str
+            View name.
+        data : flat-array
+            Float or complex values at the mesh nodes (i).
+        step : int = 0
+            Time step number.
+        time : float = 0.
+            Time value.
+
+        Notes
+        -----
+
+        (i) Complex values are written as 3-component vectors.
+
+        """
+        self.write_data('NodeData', name, data, step, time)
+
+    def write_elem_data(self, name, data, step=0, time=0.):
+        """Writes a view of element-based data.
+
+        Parameters
+        ----------
+        name : str
+            View name.
+        data : flat-array
+            Float or complex values at the mesh triangles.
+        step : int = 0
+            Time step number.
+        time : float = 0.
+            Time value.
+
+        """
+        self.write_data('ElementData', name, data, step, time)
+
+    def write_format(self):
+
+        self.write_line('$MeshFormat')
+        self.write_line(f'4.1 {int(self.binary)} 8')
+
+        if self.binary:
+            self.file.write(np.int32(1).tobytes())
+            self.write_line('')
+
+        self.write_line('$EndMeshFormat')
+
+    def write_names(self, blocks):
+
+        self.write_line('$PhysicalNames')
+        self.write_line(str(len(blocks)))
+
+        for tag, name, _ in blocks:
+            self.write_line(f'2 {tag} "{name}"')
+
+        self.write_line('$EndPhysicalNames')
+
+    def write_entities(self, mesh, blocks):
+
+        xmin, ymin = mesh.points.real.min(), mesh.points.imag.min()
+        xmax, ymax = mesh.points.real.max(), mesh.points.imag.max()
+
+        box = [xmin, ymin, 0, xmax, ymax, 0]
+
+        self.write_line('$Entities')
+
+        if not self.binary:
+            self.write_line(f'0 0 {len(blocks)} 0')
+            for tag, _, _ in blocks:
+                self.write_line(
+                    f'{tag} ' + _format_floats(box) + f' 1 {tag} 0'
+                )
+
+        if self.binary:
+            self.write_array([0, 0, len(blocks), 0], np.uint64)
+            for tag, _, _ in blocks:
+                self.write_array([tag], np.int32)
+                self.write_array(box, np.float64)
+                self.write_array([1], np.uint64)
+                self.write_array([tag], np.int32)
+                self.write_array([0], np.uint64)
+            self.write_line('')
+
+        self.write_line('$EndEntities')
+
+    def write_nodes(self, mesh):
+
+        count = mesh.npoints
+        tags = np.arange(1, count + 1)
+
+        coords = np.column_stack(
+            [mesh.points.real, mesh.points.imag, np.zeros(count)]
+        )
+
+        self.write_line('$Nodes')
+
+        if not self.binary:
+            self.write_line(f'1 {count} 1 {count}')
+            self.write_line(f'2 1 0 {count}')
+            self.write_text(tags[:, None], ['%d'])
+            self.write_text(coords, 3 * [FLOAT_FORMAT])
+
+        if self.binary:
+            self.write_array([1, count, 1, count], np.uint64)
+            self.write_block_spec(2, 1, 0, count)
+            self.write_array(tags, np.uint64)
+            self.write_array(coords, np.float64)
+            self.write_line('')
+
+        self.write_line('$EndNodes')
+
+    def write_elements(self, mesh, blocks):
+
+        count = mesh.ntriangs
+
+        self.write_line('$Elements')
+
+        if not self.binary:
+            self.write_line(f'{len(blocks)} {count} 1 {count}')
+
+        if self.binary:
+            self.write_array([len(blocks), count, 1, count], np.uint64)
+
+        for tag, _, trinums in blocks:
+            self.write_elements_block(mesh, tag, trinums)
+
+        if self.binary:
+            self.write_line('')
+
+        self.write_line('$EndElements')
+
+    def write_elements_block(self, mesh, tag, trinums):
+
+        table = np.column_stack(
+            [trinums + 1, mesh.triangs[trinums] + 1]
+        )
+
+        if not self.binary:
+            self.write_line(f'2 {tag} 2 {trinums.size}')
+            self.write_text(table, 4 * ['%d'])
+
+        if self.binary:
+            self.write_block_spec(2, tag, 2, trinums.size)
+            self.write_array(table, np.uint64)
+
+    def write_data(self, section, name, data, step, time):
+
+        values = _as_components(data)
+        count, ncomps = values.shape
+
+        self.check_count(section, count)
+
+        self.write_line(f'${section}')
+
+        self.write_line('1')
+        self.write_line(f'"{name}"')
+        self.write_line('1')
+        self.write_line(_format_floats([time]))
+        self.write_line('3')
+        self.write_line(str(int(step)))
+        self.write_line(str(ncomps))
+        self.write_line(str(count))
+
+        if not self.binary:
+            self.write_data_text(values)
+
+        if self.binary:
+            self.write_data_binary(values)
+            self.write_line('')
+
+        self.write_line(f'$End{section}')
+
+    def check_count(self, section, count):
+
+        if self.counts is None:
+            raise MSHWriterError(
+                "cannot write data before the mesh"
+            )
+
+        if count != self.counts[section]:
+            raise MSHWriterError(
+                f"expected {self.counts[section]} values, got {count}"
+            )
+
+    def write_data_text(self, values):
+
+        table = np.column_stack(
+            [np.arange(1, len(values) + 1), values]
+        )
+
+        self.write_text(
+            table, ['%d'] + values.shape[1] * [FLOAT_FORMAT]
+        )
+
+    def write_data_binary(self, values):
+
+        count, ncomps = values.shape
+
+        dtype = np.dtype(
+            [('tag', np.int32), ('values', np.float64, (ncomps,))]
+        )
+
+        table = np.empty(count, dtype=dtype)
+
+        table['tag'] = np.arange(1, count + 1)
+        table['values'] = values
+
+        table.tofile(self.file)
+
+    def write_block_spec(self, dim, tag, kind, count):
+        self.write_array([dim, tag, kind], np.int32)
+        self.write_array([count], np.uint64)
+
+    def write_array(self, data, dtype):
+        np.ascontiguousarray(data, dtype=dtype).tofile(self.file)
+
+    def write_text(self, table, formats):
+        """Writes table rows formatting a chunk of rows at once.
+        """
+
+        table = np.asarray(table)
+        line = ' '.join(formats) + '\n'
+
+        for start in range(0, len(table), CHUNK_ROWS):
+
+            chunk = table[start:start + CHUNK_ROWS]
+            text = (len(chunk) * line) % tuple(chunk.ravel().tolist())
+
+            self.file.write(text.encode())
+
+    def write_line(self, line):
+        self.file.write(line.encode() + b'\n')
+
+
+def _surface_blocks(mesh):
+
+    voids = mesh.meta.get('voids')
+
+    if voids is None:
+        voids = mesh.getvoids()
+
+    if np.size(voids) == 0:
+        return [
+            (1, 'domain', np.arange(mesh.ntriangs))
+        ]
+
+    solid = np.ones(mesh.ntriangs, dtype=bool)
+    solid[voids] = False
+
+    return [
+        (1, 'domain', np.flatnonzero(solid)),
+        (2, 'voids', np.flatnonzero(~solid))
+    ]
+
+
+def _format_floats(values):
+    return ' '.join(
+        FLOAT_FORMAT % v for v in values
+    )
+
+
+def _as_components(data):
+
+    data = np.asarray(data)
+
+    if data.ndim != 1:
+        raise MSHWriterError(
+            "expected data as a flat array"
+        )
+
+    if np.iscomplexobj(data):
+        return np.column_stack(
+            [data.real, data.imag, np.zeros(data.size)]
+        )
+
+    return data.astype(float)[:, None]
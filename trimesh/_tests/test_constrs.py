@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""Tests the constraints on hanging nodes.
+"""
+import unittest
+import numpy as np
+from triellipt import mesher
+
+
+class TestConstrs(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.MESH = mesher.trigrid(11, 11, 'east-slope').reduced(1)
+
+    def check(self, data):
+
+        west, east, pivot = self.MESH.triangs[self.MESH.getvoids()].T
+
+        return np.allclose(
+            data[pivot], 0.5 * (data[west] + data[east])
+        )
+
+    def test_cached(self):
+
+        constrs = self.MESH.constraints()
+
+        assert constrs is self.MESH.constraints()
+        assert constrs.size == self.MESH.getvoids().size > 0
+
+    def test_apply(self):
+
+        data = np.random.rand(self.MESH.npoints)
+        copy = data.copy()
+
+        new_data = self.MESH.constraints()(data)
+
+        assert self.check(new_data)
+        assert np.array_equal(data, copy)
+
+    def test_inplace(self):
+
+        data = np.random.rand(self.MESH.npoints, 3)
+        out = self.MESH.constraints()(data, out=data)
+
+        assert out is data
+        assert all(self.check(data[:, k]) for k in range(3))
+
+
+if __name__ == '__main__':
+    unittest.main()
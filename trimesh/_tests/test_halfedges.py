@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""Tests the half-edge structure.
+"""
+import unittest
+from triellipt import mesher
+
+
+class TestHalfEdges(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.EDGES = cls.mesh().halfedges()
+
+    @classmethod
+    def mesh(cls):
+        return mesher.trigrid(2, 2, 'cross-wise')
+
+    def test_twins(self):
+        assert self.EDGES.twins.tolist() == [
+            11, -1, 3, 2, -1, 6, 5, -1, 9, 8, -1, 0
+        ]
+
+    def test_nexts(self):
+        assert self.EDGES.nexts.tolist() == [
+            1, 2, 0, 4, 5, 3, 7, 8, 6, 10, 11, 9
+        ]
+
+    def test_neighbors(self):
+        assert self.EDGES.neighbors().tolist() == [
+            [3, -1, 1], [0, -1, 2], [1, -1, 3], [2, -1, 0]
+        ]
+
+    def test_bound(self):
+        assert sorted(self.EDGES.bound_halfedges()) == [1, 4, 7, 10]
+
+    def test_fan(self):
+        assert self.EDGES.fan(4).tolist() == [0, 1, 2, 3]
+        assert self.EDGES.fan(0).tolist() == [0, 1]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""Tests the mesh persistence.
+"""
+import io
+import tempfile
+import unittest
+import numpy as np
+from triellipt import mesher
+from triellipt.trimesh import TriMesh
+
+
+class TestMeshFile(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.MESH = mesher.trigrid(4, 4, 'west-slope').renumed(
+            np.arange(16)[::-1]
+        )
+        cls.MESH.add_meta(
+            {'physical-lines': {'wall': np.array([[0, 1], [1, 2]])}}
+        )
+
+    def test_npz(self):
+        self.check_loaded(self.load_npz(compressed=False))
+
+    def test_npz_compressed(self):
+        self.check_loaded(self.load_npz(compressed=True))
+
+    def test_dir_mmap(self):
+        with tempfile.TemporaryDirectory() as path:
+            self.MESH.dump(path)
+            mesh = TriMesh.load(path, mmap_mode='r')
+            assert isinstance(mesh.points, np.memmap)
+            self.check_loaded(mesh)
+            del mesh
+
+    def check_loaded(self, mesh):
+        assert np.array_equal(mesh.points, self.MESH.points)
+        assert np.array_equal(mesh.triangs, self.MESH.triangs)
+        assert np.array_equal(
+            mesh.meta['nodes-permuter'], self.MESH.meta['nodes-permuter']
+        )
+        assert list(mesh.meta['physical-lines']) == ['wall']
+        assert mesh.meta['physical-lines']['wall'].tolist() == [[0, 1], [1, 2]]
+
+    def load_npz(self, compressed):
+
+        file = io.BytesIO()
+
+        self.MESH.save(file, compressed)
+        file.seek(0)
+
+        return TriMesh.load(file)
@@ -2,6 +2,7 @@
 """Tests the mesh remunerator.
 """
 import unittest
+import numpy as np
 from triellipt import mesher
 
 
@@ -60,3 +61,28 @@ class TestShuffle(unittest.TestCase):
 
 if __name__ == '__main__':
     unittest.main()
+
+
+class TestSorted(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.MESH = mesher.trigrid(4, 4, 'west-slope')
+
+    def test_sorted_points(self):
+        assert np.allclose(self.points_steps, 1.)
+
+    def test_sorted_triangles(self):
+        assert sorted(self.triangs_permuter) == list(
+            range(self.MESH.ntriangs)
+        )
+
+    @property
+    def points_steps(self):
+        return np.abs(
+            np.diff(self.MESH.sorted_points().points)
+        )
+
+    @property
+    def triangs_permuter(self):
+        return self.MESH.sorted_triangles().meta['triangs-permuter']
@@ -3,6 +3,7 @@
 """
 from abc import ABC,  abstractmethod
 import unittest
+import numpy as np
 from triellipt import mesher
 
 
@@ -76,5 +77,29 @@ class TestSubMesh(Tester, unittest.TestCase):
         yield [7, 4, 3]
 
 
+class TestDelTriangsMask(TestDelTriangs):
+
+    @classmethod
+    def setUpClass(cls):
+
+        mesh = mesher.trigrid(3, 3, 'west-snake')
+
+        cls.MESH = mesh
+        cls.SUBMESH = mesh.deltriangs_at(
+            np.isin(np.arange(8), [0, 3, 4, 7])
+        )
+
+
+class TestSubMeshArray(TestSubMesh):
+
+    @classmethod
+    def setUpClass(cls):
+
+        mesh = mesher.trigrid(3, 3, 'west-snake')
+
+        cls.MESH = mesh
+        cls.SUBMESH = mesh.submesh_at(np.array([0, 3, 4, 7, 8, -1]))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -2,7 +2,9 @@
 """Tests super operations.
 """
 import unittest
+import numpy as np
 from triellipt import mesher
+from triellipt.trimesh import superoprs
 
 
 class TestSupOprs(unittest.TestCase):
@@ -34,6 +36,105 @@ class TestSupOprs(unittest.TestCase):
         assert self.TRIU.reduce(iterate=True).size == 8
         assert self.TRIU.reduce(iterate=False).size == 8
 
+    def test_shrink(self):
+        assert self.TRIU.shrink(0).size == 18
+        assert self.TRIU.shrink(1).size == 0
+
+
+class TestSupPeeler(unittest.TestCase):
+    """Tests peeling against the edges classification.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.TRIU = mesher.trilattice(15, 12, True).supertriu()
+
+    def test_degrees(self):
+
+        spec = self.TRIU.supmesh.edgesmap().getspec()
+        degrees = superoprs.SupPeeler.from_suptriu(self.TRIU).degrees
+
+        for rank, name in enumerate(['spots', 'heads', 'links', 'cores']):
+            assert np.flatnonzero(degrees == rank).tolist() == (
+                spec[name].tolist()
+            )
+
+    def test_smooth(self):
+
+        smoothed = self.TRIU.strip()
+
+        for _ in range(smoothed.size):
+            cleaned = smoothed.smooth(iterate=False)
+            if cleaned.size == smoothed.size:
+                break
+            smoothed = cleaned
+
+        assert np.array_equal(
+            self.TRIU.strip().smooth().data, smoothed.data
+        )
+
+    def test_shrink(self):
+        assert np.array_equal(
+            self.TRIU.shrink(2).data,
+            self.TRIU.strip().smooth().strip().smooth().data
+        )
+
+
+def strip_by_spec(suptriu):
+    spec = suptriu.supmesh.edgesmap().getspec()
+    return suptriu.deltriangs_at(spec['links'])
+
+
+def smooth_by_spec(suptriu):
+
+    for _ in range(suptriu.size):
+
+        spec = suptriu.supmesh.edgesmap().getspec()
+        inds = np.r_[spec['spots'], spec['heads']]
+
+        if inds.size == 0:
+            break
+
+        suptriu = suptriu.deltriangs_at(inds)
+
+    return suptriu
+
+
+class TestPeelOrder(unittest.TestCase):
+    """Pins the order of peeled super-triangles.
+    """
+
+    MESHES = [
+        mesher.trigrid(21, 21, 'west-slope'),
+        mesher.trigrid(15, 15, 'cross-wise'),
+        mesher.trilattice(21, 21, True)
+    ]
+
+    def test_strip(self):
+        for mesh in self.MESHES:
+            triu = mesh.supertriu()
+            assert np.array_equal(
+                triu.strip().data, strip_by_spec(triu).data
+            )
+
+    def test_smooth(self):
+        for mesh in self.MESHES:
+            triu = mesh.supertriu().strip()
+            assert np.array_equal(
+                triu.smooth().data, smooth_by_spec(triu).data
+            )
+
+    def test_shrink(self):
+        for mesh in self.MESHES:
+
+            triu = mesh.supertriu()
+            peeled = triu
+
+            for _ in range(2):
+                peeled = smooth_by_spec(strip_by_spec(peeled))
+
+            assert np.array_equal(triu.shrink(2).data, peeled.data)
+
 
 if __name__ == '__main__':
     unittest.main()
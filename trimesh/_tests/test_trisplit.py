@@ -31,6 +31,11 @@ class TestVoids(unittest.TestCase):
         assert self.mesh_split[1].triangs.tolist() == [[0, 3, 1]]
         assert self.mesh_split[0].triangs.tolist() == [[4, 0, 2], [4, 2, 3]]
 
+    def test_itersplit(self):
+        assert [m.triangs.tolist() for m in self.MESH.itersplit()] == [
+            m.triangs.tolist() for m in self.mesh_split
+        ]
+
     @property
     def mesh_split(self):
         return self.MESH.split()
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""Constraints on hanging nodes.
+"""
+import numpy as np
+
+
+class MeshConstrs:
+    """Constraints on the hanging nodes of a mesh.
+
+    Attributes
+    ----------
+    mesh : TriMesh
+        Parent mesh.
+    data : 3-row-int-table
+        Wests, easts and pivots of the voids.
+
+    Notes
+    -----
+
+    - Data on a pivot is the mean of the data on the void ends.
+    - Work buffers are kept per data layout, so repeated calls do not
+    allocate memory.
+
+    """
+
+    def __init__(self, mesh, data):
+        self.mesh = mesh
+        self.data = data
+        self.cache = {}
+
+    @classmethod
+    def from_mesh(cls, mesh):
+        return cls(
+            mesh, mesh.triangs[mesh.getvoids(), :].T.copy('C')
+        )
+
+    @property
+    def size(self):
+        return self.data.shape[1]
+
+    @property
+    def wests(self):
+        return self.data[0, :]
+
+    @property
+    def easts(self):
+        return self.data[1, :]
+
+    @property
+    def pivots(self):
+        return self.data[2, :]
+
+    def __call__(self, data, out=None):
+        return self.apply(data, out)
+
+    def apply(self, data, out=None):
+        """Constrains data on the pivots.
+
+        Parameters
+        ----------
+        data : float-or-complex-array
+            Data on the mesh nodes, flat or with columns of samples.
+        out : float-or-complex-array = None
+            Output of the same layout, can be the data itself (i).
+
+        Returns
+        -------
+        float-or-complex-array
+            Constrained data, `out` if given.
+
+        Notes
+        -----
+
+        (i) If None, the output is a new copy of the data.
+
+        """
+
+        if out is None:
+            out = np.copy(data, order='C')
+        elif out is not data:
+            np.copyto(out, data)
+
+        if self.size == 0:
+            return out
+
+        buffer1, buffer2 = self.get_buffers(data)
+
+        np.take(data, self.wests, axis=0, out=buffer1, mode='clip')
+        np.take(data, self.easts, axis=0, out=buffer2, mode='clip')
+
+        np.add(buffer1, buffer2, out=buffer1)
+        np.multiply(buffer1, 0.5, out=buffer1)
+
+        out[self.pivots] = buffer1
+        return out
+
+    def get_buffers(self, data):
+
+        key = (data.shape[1:], data.dtype)
+
+        if key not in self.cache:
+            self.cache[key] = (
+                np.empty((self.size,) + key[0], dtype=key[1]),
+                np.empty((self.size,) + key[0], dtype=key[1])
+            )
+
+        return self.cache[key]
@@ -152,7 +152,7 @@ class MakerSupMouths(CleanerAgent):
             np.sum(mask, axis=1) == 2
         )
 
-        return self.cleaner.suptri_prime.subtriu(*inds_mouths)
+        return self.cleaner.suptri_prime.subtriu_at(inds_mouths)
 
     def pair_voids_ears(self):
 
@@ -211,7 +211,7 @@ class MakerMeshAlpha(CleanerAgent):
 
     def draft_new_mesh(self, mesh, meta):
 
-        mesh = mesh.deltriangs(*meta['trinums-to-del'])
+        mesh = mesh.deltriangs_at(meta['trinums-to-del'])
         mesh = mesh.add_triangs(meta['triangs-to-add']['suptriangs'])
         mesh = mesh.add_triangs(meta['triangs-to-add']['extravoids'])
 
@@ -306,7 +306,7 @@ class MakerMeshBeta(CleanerAgent):
         if twins_nums.size == 0:
             return self.mesh_alpha
 
-        return self.mesh_alpha.deltriangs(*twins_nums)
+        return self.mesh_alpha.deltriangs_at(twins_nums)
 
     def find_twins_voids(self):
 
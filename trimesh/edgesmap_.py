@@ -109,10 +109,6 @@ class MeshAgent:
     def from_mesh(cls, mesh):
         return cls(mesh)
 
-    @property
-    def edges_paired(self):
-        return self.mesh.edges_paired()
-
 
 class EdgesMapper(MeshAgent):
     """Mapper of inner mesh edges.
@@ -120,25 +116,23 @@ class EdgesMapper(MeshAgent):
 
     def get_edges_map(self):
 
-        paredges = self.make_edges_paired()
-        edgesmap = self.from_edges_paired(paredges)
+        halfedges = self.mesh.halfedges()
+        edgesmap = self.from_halfedges(halfedges)
 
         return edgesmap
 
-    def from_edges_paired(self, paredges):
+    def from_halfedges(self, halfedges):
 
-        _, rows, cols = paredges.atrank(2)
+        inner1 = halfedges.inner_halfedges()
+        inner2 = halfedges.twins[inner1]
 
-        trinums = np.reshape(rows, (rows.size // 2, 2)).T
-        locnums = np.reshape(cols, (cols.size // 2, 2)).T
+        trinums = np.vstack([inner1 // 3, inner2 // 3])
+        locnums = np.vstack([inner1 % 3, inner2 % 3])
 
         return EdgesMap.from_data(
             mesh=self.mesh, data=np.vstack([trinums, locnums])
         )
 
-    def make_edges_paired(self):
-        return tables.TableMap.from_table(self.edges_paired)
-
 
 class EdgesSpec:
     """Edges classifier.
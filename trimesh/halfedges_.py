@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""Half-edge adjacency of a mesh.
+"""
+import numpy as np
+
+NO_TWIN = -1
+MULTI_TWIN = -2
+
+
+class HalfEdgesData:
+    """Data on mesh half-edges.
+    """
+
+    def __init__(self, mesh=None, data=None, meta=None):
+        self.mesh = mesh
+        self.data = data
+        self.meta = meta or {}
+
+    @classmethod
+    def from_data(cls, mesh, data, meta):
+        return cls(mesh, data, meta)
+
+    @classmethod
+    def from_mesh(cls, mesh):
+        return HalfEdgesMaker(mesh).get_halfedges()
+
+    @property
+    def size(self):
+        return self.data.shape[1]
+
+    @property
+    def twins(self):
+        return self.data[0, :]
+
+    @property
+    def nexts(self):
+        return self.data[1, :]
+
+    @property
+    def trinums(self):
+        return self.data[2, :]
+
+    @property
+    def locnums(self):
+        return self.halfedges_range % 3
+
+    @property
+    def sorter(self):
+        return self.meta['sorter']
+
+    @property
+    def halfedges_range(self):
+        return np.arange(self.size)
+
+
+class HalfEdges(HalfEdgesData):
+    """Half-edge structure of a mesh.
+
+    Half-edge `3 * t + k` runs from the k-th to the (k+1)-th vertex of
+    the triangle `t`.
+
+    Properties
+    ----------
+
+    Name       | Description
+    -----------|------------------------------------
+    `twins`    | Opposite half-edges (i).
+    `nexts`    | Next CCW half-edges in triangles.
+    `trinums`  | Host triangles of half-edges.
+    `locnums`  | Local edge numbers in triangles.
+
+    Notes
+    -----
+
+    (i) Boundary half-edges have -1, non-manifold ones have -2.
+
+    """
+
+    def neighbors(self):
+        """Finds neighbors of triangles.
+
+        Returns
+        -------
+        3-column-int-table
+            Neighbors across local edges, -1 if there are none.
+
+        """
+
+        nbrs = np.where(
+            self.twins >= 0, self.trinums[self.twins], NO_TWIN
+        )
+
+        return nbrs.reshape(self.mesh.ntriangs, 3)
+
+    def inner_halfedges(self):
+        """Inner half-edges, one per pair, ordered by edge keys.
+        """
+        return self.in_sorted(self.twins > self.halfedges_range)
+
+    def bound_halfedges(self):
+        """Boundary half-edges, ordered by edge keys.
+        """
+        return self.in_sorted(self.twins == NO_TWIN)
+
+    def in_sorted(self, mask):
+        return np.compress(
+            mask[self.sorter], self.sorter
+        )
+
+    def fans(self):
+        """Triangles around nodes.
+
+        Returns
+        -------
+        tuple
+            Offsets and triangles numbers in a CSR layout (i).
+
+        Notes
+        -----
+
+        (i) Triangles around node `n` are `trinums[offsets[n]:offsets[n+1]]`.
+
+        """
+
+        if 'fans' not in self.meta:
+            self.meta['fans'] = self.make_fans()
+        return self.meta['fans']
+
+    def make_fans(self):
+
+        nodes = self.mesh.triangs.flatten()
+        order = np.argsort(nodes, kind='stable')
+
+        offsets = np.searchsorted(
+            nodes[order], np.arange(self.mesh.npoints + 1)
+        )
+
+        return offsets, order // 3
+
+    def fan(self, node):
+        """Triangles around a node.
+        """
+
+        offsets, trinums = self.fans()
+
+        return trinums[
+            offsets[node]: offsets[node + 1]
+        ]
+
+
+class HalfEdgesMaker:
+    """Maker of mesh half-edges.
+    """
+
+    def __init__(self, mesh):
+        self.mesh = mesh
+
+    def get_halfedges(self):
+
+        keys = self.make_keys()
+        sorter = np.argsort(keys, kind='stable')
+
+        data = np.vstack([
+            self.make_twins(keys, sorter),
+            self.make_nexts(),
+            self.make_trinums()
+        ])
+
+        return HalfEdges.from_data(
+            self.mesh, data, {'sorter': sorter}
+        )
+
+    def make_keys(self):
+        return self.mesh.edges_paired().flatten()
+
+    def make_twins(self, keys, sorter):
+
+        twins = np.full(keys.size, NO_TWIN)
+
+        if keys.size == 0:
+            return twins
+
+        sorted_keys = keys[sorter]
+
+        fronts = np.flatnonzero(
+            np.r_[True, sorted_keys[1:] != sorted_keys[:-1]]
+        )
+
+        ranks = np.diff(
+            np.r_[fronts, keys.size]
+        )
+
+        twins[sorter] = np.repeat(
+            np.where(ranks > 2, MULTI_TWIN, NO_TWIN), ranks
+        )
+
+        heads = sorter[fronts[ranks == 2]]
+        tails = sorter[fronts[ranks == 2] + 1]
+
+        twins[heads] = tails
+        twins[tails] = heads
+
+        return twins
+
+    def make_nexts(self):
+
+        halfedges = np.arange(3 * self.mesh.ntriangs)
+
+        return halfedges - halfedges % 3 + (halfedges + 1) % 3
+
+    def make_trinums(self):
+        return np.repeat(
+            np.arange(self.mesh.ntriangs), 3
+        )
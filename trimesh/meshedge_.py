@@ -2,7 +2,6 @@
 """Finds the mesh edge.
 """
 import numpy as np
-from triellipt.utils import tables
 from triellipt.utils import loops
 
 
@@ -279,10 +278,6 @@ class MeshAgent:
     def from_mesh(cls, mesh):
         return cls(mesh)
 
-    @property
-    def edges_paired(self):
-        return self.mesh.edges_paired()
-
 
 class EdgeFinder(MeshAgent):
     """Finder of the mesh edge.
@@ -290,25 +285,22 @@ class EdgeFinder(MeshAgent):
 
     def get_mesh_edge(self):
 
-        paredges = self.make_edges_paired()
-        meshedge = self.from_edges_paired(paredges)
+        halfedges = self.mesh.halfedges()
+        meshedge = self.from_halfedges(halfedges)
 
         return meshedge
 
-    def from_edges_paired(self, paredges):
+    def from_halfedges(self, halfedges):
 
-        _, rows, cols = paredges.atrank(1)
+        bound = halfedges.bound_halfedges()
 
-        trinums = rows
-        locnums = cols
+        trinums = bound // 3
+        locnums = bound % 3
 
         return MeshEdge.from_data(
             mesh=self.mesh, data=np.vstack([trinums, locnums])
         )
 
-    def make_edges_paired(self):
-        return tables.TableMap.from_table(self.edges_paired)
-
 
 def _normindex(index, size):
     return min(
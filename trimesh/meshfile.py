@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+"""Mesh persistence.
+"""
+import json
+import os
+import numpy as np
+
+VERSION = 1
+CHUNK = 2**20
+
+HEADER = 'header.json'
+
+MeshFileError = type(
+    'MeshFileError', (Exception,), {}
+)
+
+
+def save_npz(mesh, file, compressed=False):
+    """Saves a mesh to `.npz` file.
+    """
+    _ = NpzWriter.from_mesh(mesh)
+    return _.write(file, compressed)
+
+
+def load_npz(cls, file):
+    """Loads a mesh from `.npz` file.
+    """
+    return NpzReader.from_file(file).read(cls)
+
+
+def save_dir(mesh, path):
+    """Saves a mesh to a directory of `.npy` files.
+    """
+    _ = DirWriter.from_mesh(mesh)
+    return _.write(path)
+
+
+def load_dir(cls, path, mmap_mode=None):
+    """Loads a mesh from a directory of `.npy` files.
+    """
+    return DirReader.from_path(path).read(cls, mmap_mode)
+
+
+class MeshWriter:
+    """Root of a mesh writer.
+    """
+
+    def __init__(self, mesh):
+        self.mesh = mesh
+        self.meta = self.fetch_meta()
+
+    @classmethod
+    def from_mesh(cls, mesh):
+        return cls(mesh)
+
+    def fetch_meta(self):
+        return {
+            'arrays': self.fetch_arrays(),
+            'header': self.fetch_header()
+        }
+
+    def fetch_arrays(self):
+
+        arrays = {
+            'points': self.mesh.points,
+            'triangs': self.mesh.triangs
+        }
+
+        for key, val in self.mesh.meta.items():
+
+            if isinstance(val, np.ndarray):
+                arrays[_meta_name(key)] = val
+
+            if _is_arrays_dict(val):
+                for i, item in enumerate(val.values()):
+                    arrays[_meta_item_name(key, i)] = item
+
+        return arrays
+
+    def fetch_header(self):
+
+        header = {
+            'version': VERSION,
+            'meta-arrays': [],
+            'meta-dicts': {},
+            'meta-values': {}
+        }
+
+        for key, val in self.mesh.meta.items():
+
+            if isinstance(val, np.ndarray):
+                header['meta-arrays'].append(key)
+                continue
+
+            if _is_arrays_dict(val):
+                header['meta-dicts'][key] = list(val)
+                continue
+
+            if _is_jsonable(val):
+                header['meta-values'][key] = val
+
+        return header
+
+    @property
+    def arrays(self):
+        return self.meta['arrays']
+
+    @property
+    def header(self):
+        return self.meta['header']
+
+
+class NpzWriter(MeshWriter):
+    """Writes a mesh to `.npz` file.
+    """
+
+    def write(self, file, compressed):
+
+        saver = np.savez_compressed if compressed else np.savez
+
+        saver(
+            file, header=json.dumps(self.header), **self.arrays
+        )
+
+
+class DirWriter(MeshWriter):
+    """Writes a mesh to a directory.
+    """
+
+    def write(self, path):
+
+        os.makedirs(path, exist_ok=True)
+
+        for name, data in self.arrays.items():
+            _write_chunked(
+                os.path.join(path, name + '.npy'), data
+            )
+
+        with open(os.path.join(path, HEADER), 'w') as file:
+            json.dump(self.header, file, indent=2)
+
+
+class MeshReader:
+    """Root of a mesh reader.
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self.meta = {}
+
+    def read(self, cls, *args):
+
+        self.meta = self.fetch_meta(*args)
+        self.check_header()
+
+        mesh = cls(
+            self.getarray('points'), self.getarray('triangs')
+        )
+
+        return mesh.add_meta(
+            self.fetch_mesh_meta()
+        )
+
+    def fetch_meta(self, *args):
+        return {}
+
+    def check_header(self):
+
+        version = self.header.get('version')
+
+        if version != VERSION:
+            raise MeshFileError(
+                f"got unsupported mesh file version '{version}'"
+            )
+
+    def fetch_mesh_meta(self):
+
+        mesh_meta = dict(
+            self.header['meta-values']
+        )
+
+        for key in self.header['meta-arrays']:
+            mesh_meta[key] = self.getarray(_meta_name(key))
+
+        for key, names in self.header.get('meta-dicts', {}).items():
+            mesh_meta[key] = {
+                name: self.getarray(_meta_item_name(key, i))
+                for i, name in enumerate(names)
+            }
+
+        return mesh_meta
+
+    @property
+    def header(self):
+        return self.meta['header']
+
+    def getarray(self, name):
+        return self.meta['arrays'][name]
+
+
+class NpzReader(MeshReader):
+    """Reads a mesh from `.npz` file.
+    """
+
+    @classmethod
+    def from_file(cls, file):
+        return cls(file)
+
+    def fetch_meta(self, *args):
+
+        with np.load(self.source) as data:
+            arrays = {name: data[name] for name in data.files}
+
+        header = arrays.pop('header', None)
+
+        return {
+            'arrays': arrays,
+            'header': self.decode_header(header)
+        }
+
+    def decode_header(self, header):
+
+        if header is None:
+            return _legacy_header()
+
+        return json.loads(
+            str(header)
+        )
+
+
+class DirReader(MeshReader):
+    """Reads a mesh from a directory.
+    """
+
+    @classmethod
+    def from_path(cls, path):
+        return cls(path)
+
+    def fetch_meta(self, mmap_mode=None):
+
+        header_path = os.path.join(self.source, HEADER)
+
+        if not os.path.isfile(header_path):
+            raise MeshFileError(
+                f"got no '{HEADER}' in '{self.source}'"
+            )
+
+        with open(header_path) as file:
+            header = json.load(file)
+
+        return {
+            'header': header,
+            'mmap-mode': mmap_mode
+        }
+
+    def getarray(self, name):
+        return np.load(
+            os.path.join(self.source, name + '.npy'),
+            mmap_mode=self.meta['mmap-mode']
+        )
+
+
+def _write_chunked(path, data):
+
+    data = np.asanyarray(data)
+
+    if data.ndim == 0:
+        np.save(path, data)
+        return
+
+    out = np.lib.format.open_memmap(
+        path, mode='w+', dtype=data.dtype, shape=data.shape
+    )
+
+    for start in range(0, data.shape[0], CHUNK):
+        out[start: start + CHUNK] = data[start: start + CHUNK]
+
+    out.flush()
+    del out
+
+
+def _meta_name(key):
+    return 'meta-' + key
+
+
+def _meta_item_name(key, index):
+    return f'meta-{key}--{index}'
+
+
+def _is_arrays_dict(value):
+
+    if not isinstance(value, dict) or not value:
+        return False
+
+    return all(
+        isinstance(v, np.ndarray) for v in value.values()
+    )
+
+
+def _is_jsonable(value):
+    try:
+        json.dumps(value)
+    except TypeError:
+        return False
+    return True
+
+
+def _legacy_header():
+    return {
+        'version': VERSION,
+        'meta-arrays': [],
+        'meta-dicts': {},
+        'meta-values': {}
+    }
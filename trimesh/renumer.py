@@ -2,6 +2,11 @@
 """Mesh renumerator.
 """
 import numpy as np
+from triellipt.utils import sfcurves
+
+CurveSortError = type(
+    'CurveSortError', (Exception,), {}
+)
 
 
 class MeshAgent:
@@ -263,3 +268,76 @@ class DownVoids(MeshAgent):
 
     def from_permuter(self, permuter):
         return self.mesh.shuffled(permuter)
+
+
+class CurveSorter(MeshAgent):
+    """Orders mesh items along a space-filling curve.
+    """
+
+    def getkeys(self, curve, data):
+
+        if curve not in sfcurves.SFCURVES:
+            raise CurveSortError(
+                f"got undefined curve type '{curve}'"
+            )
+
+        return sfcurves.SFCURVES[curve](
+            data.real, data.imag
+        )
+
+    def make_permuter(self, curve, data):
+        return np.argsort(
+            self.getkeys(curve, data), kind='stable'
+        )
+
+
+class SortTriangs(CurveSorter):
+    """Orders triangles by centroids along a space-filling curve.
+    """
+
+    def sorted(self, curve):
+        """Sorts mesh triangles.
+
+        Parameters
+        ----------
+        curve : str
+            Curve type, "hilbert" or "morton".
+
+        Returns
+        -------
+        TriMesh
+            New mesh.
+
+        """
+
+        permuter = self.make_permuter(
+            curve, self.mesh.centrs_complex
+        )
+
+        return self.mesh.shuffled(permuter)
+
+
+class SortPoints(CurveSorter):
+    """Orders points along a space-filling curve.
+    """
+
+    def sorted(self, curve):
+        """Sorts mesh points.
+
+        Parameters
+        ----------
+        curve : str
+            Curve type, "hilbert" or "morton".
+
+        Returns
+        -------
+        TriMesh
+            New mesh.
+
+        """
+
+        permuter = self.make_permuter(
+            curve, self.mesh.points
+        )
+
+        return self.mesh.renumed(permuter)
@@ -58,7 +58,13 @@ class SupCleaner(SupAgent):
         """
 
     def make_new_suptriu(self, badtrinums):
-        return self.suptri.deltriangs(*badtrinums)
+
+        mask = np.full(self.suptri.size, True)
+        mask[badtrinums] = False
+
+        return self.suptri.update_data(
+            self.suptri.data[:, mask]
+        )
 
 
 class SupStrip(SupCleaner):
@@ -66,8 +72,8 @@ class SupStrip(SupCleaner):
     """
 
     def find_bad_trinums(self):
-        spec = self.supedgesmap.getspec()
-        return spec['links']
+        degrees = SupPeeler.from_suptriu(self.suptri).degrees
+        return np.flatnonzero(degrees == 2)
 
 
 class SupSmooth(SupCleaner):
@@ -78,40 +84,132 @@ class SupSmooth(SupCleaner):
         """Runs smoothing iteratively.
         """
 
-        count = 0
+        peeler = SupPeeler.from_suptriu(self.suptri)
+        peeler.smooth()
 
-        smoothen = True
-        maxcount = self.suptri.size
+        return peeler.get_suptriu()
 
-        while smoothen:
+    def find_bad_trinums(self):
+        degrees = SupPeeler.from_suptriu(self.suptri).degrees
+        return np.flatnonzero(degrees <= 1)
 
-            self.suptri, smoothen = self.iteration()
 
-            count += 1
+class SupPeeler(SupAgent):
+    """Peels a super-triangulation by degrees of super-triangles.
 
-            if self.suptri.size == 0:
-                return self.suptri
-            if count == maxcount:
-                return self.suptri
+    Degree is the number of super-edges shared with exactly one other
+    super-triangle, i.e. the number of pairs in `EdgesMap.getspec()`.
 
-        return self.suptri
+    Notes
+    -----
 
-    def iteration(self):
+    Edges are counted once, so removals only update the counters of the
+    removed edges and the degrees of their alive owners.
 
-        newsuptriu = self.cleaned()
+    """
 
-        no_smoothing = newsuptriu.size == self.suptri.size
-        is_smoothing = not no_smoothing
+    def __init__(self, suptri=None):
+        super().__init__(suptri)
+        self.alive = np.full(suptri.size, True)
+        self.setup_edges()
 
-        return newsuptriu, is_smoothing
+    def setup_edges(self):
 
-    def find_bad_trinums(self):
+        keys = self.suptri.supmesh.edges_paired()
+        _, edges = np.unique(keys, return_inverse=True)
+
+        edges = edges.reshape(self.suptri.size, 3)
+        counts = np.bincount(edges.ravel())
+
+        order = np.argsort(edges.ravel(), kind='stable')
+
+        offsets = np.searchsorted(
+            edges.ravel()[order], np.arange(counts.size + 1)
+        )
+
+        self.cache['edges'] = edges
+        self.cache['counts'] = counts
+        self.cache['owners'] = (offsets, order // 3)
+
+        self.cache['degrees'] = self.count_degrees(
+            np.arange(self.suptri.size)
+        )
+
+    @property
+    def edges(self):
+        return self.cache['edges']
+
+    @property
+    def counts(self):
+        return self.cache['counts']
+
+    @property
+    def degrees(self):
+        return self.cache['degrees']
+
+    @property
+    def size(self):
+        return np.count_nonzero(self.alive)
+
+    def get_suptriu(self):
+        """Returns the alive super-triangles in the original order.
+        """
+        return self.suptri.update_data(
+            self.suptri.data[:, self.alive]
+        )
 
-        spec = self.supedgesmap.getspec()
+    def strip(self):
+        """Removes super-triangles of degree 2.
+        """
+        self.remove(
+            np.flatnonzero(self.alive & (self.degrees == 2))
+        )
+
+    def smooth(self):
+        """Removes super-triangles of degree 0 or 1 in rounds.
+        """
+
+        trinums = np.flatnonzero(self.alive)
+
+        while trinums.size > 0:
+
+            trinums = trinums[self.alive[trinums]]
+            trinums = trinums[self.degrees[trinums] <= 1]
+
+            trinums = self.remove(trinums)
+
+    def remove(self, trinums):
+        """Removes super-triangles, returns the affected alive ones.
+        """
+
+        self.alive[trinums] = False
+
+        edges = self.edges[trinums].ravel()
+        np.subtract.at(self.counts, edges, 1)
+
+        affected = self.edges_owners(np.unique(edges))
+        affected = affected[self.alive[affected]]
 
-        return np.r_[
-            spec['spots'], spec['heads']
-        ]
+        self.degrees[affected] = self.count_degrees(affected)
+
+        return affected
+
+    def edges_owners(self, edges):
+
+        offsets, owners = self.cache['owners']
+
+        starts = offsets[edges]
+        sizes = offsets[edges + 1] - starts
+
+        locs = np.repeat(starts - np.cumsum(sizes) + sizes, sizes)
+        locs += np.arange(sizes.sum())
+
+        return np.unique(owners[locs])
+
+    def count_degrees(self, trinums):
+        return np.sum(
+            self.counts[self.edges[trinums]] == 2, axis=1
+        )
 
 
 class SupDetach(SupCleaner):
@@ -166,7 +264,7 @@ class SupCompress(SupAgent):
     def from_bfs_tree(self, trinums):
         if trinums is None:
             return None
-        return self.suptri.subtriu(*trinums)
+        return self.suptri.subtriu_at(trinums)
 
     def make_bfs_tree(self, graph):
 
@@ -248,8 +346,18 @@ class SupReduce(SupCompress):
         return compressed
 
     def clean_suptri(self):
-        self.suptri = self.suptri.strip()
-        self.suptri = self.suptri.smooth()
+        """Runs strip-and-smooth on a peeler kept between the trials.
+        """
+
+        if 'peeler' not in self.cache:
+            self.cache['peeler'] = SupPeeler.from_suptriu(self.suptri)
+
+        peeler = self.cache['peeler']
+
+        peeler.strip()
+        peeler.smooth()
+
+        self.suptri = peeler.get_suptriu()
 
 
 class SupVoids(SupAgent):
@@ -276,7 +384,7 @@ class SupVoids(SupAgent):
         )
 
         inds, = np.where(mask)
-        return self.suptri.subtriu(*inds)
+        return self.suptri.subtriu_at(inds)
 
 
 def triangs_distorts(supverts, kerverts):
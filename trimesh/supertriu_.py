@@ -2,7 +2,6 @@
 """Super triangulation.
 """
 import numpy as np
-from triellipt.utils import tables
 from triellipt.trimesh import superoprs
 
 
@@ -15,8 +14,8 @@ class SuperData:
         self.data = data
 
     @classmethod
-    def from_mesh(cls, mesh):
-        return Triangler(mesh).getsuptriu()
+    def from_mesh(cls, mesh, cores=None):
+        return Triangler(mesh, cores).getsuptriu()
 
     @property
     def size(self):
@@ -64,7 +63,7 @@ class SuperData:
 
     @property
     def kermesh(self):
-        return self.mesh.submesh(*self.trinums)
+        return self.mesh.submesh_at(self.trinums)
 
     @property
     def supmesh(self):
@@ -79,17 +78,26 @@ class SuperData:
         return _is_compact_table(self.supbodies)
 
     def subtriu(self, *suptri_inds):
+        return self.subtriu_at(suptri_inds)
+
+    def subtriu_at(self, suptri_inds):
+        """Fetches super-triangles by numbers or by a mask.
+        """
         return self.update_data(
-            self.data[:, suptri_inds]
+            self.data[:, _norminds(suptri_inds)]
         )
 
     def deltriangs(self, *suptri_inds):
+        return self.deltriangs_at(suptri_inds)
 
-        new_data = np.delete(
-            self.data, suptri_inds, axis=1
-        )
+    def deltriangs_at(self, suptri_inds):
+        """Removes super-triangles by numbers or by a mask.
+        """
+
+        tokeep = np.ones(self.size, dtype=bool)
+        tokeep[_norminds(suptri_inds)] = False
 
-        return self.update_data(new_data)
+        return self.update_data(self.data[:, tokeep])
 
     def supvoids(self):
         """Fetches a supertriu made of voids.
@@ -99,6 +107,11 @@ class SuperData:
     def atcores(self, *trinums):
         """Fetches a supertriu with the specified core triangles.
         """
+        return self.withcores(trinums)
+
+    def withcores(self, trinums):
+        """Fetches a supertriu with the core triangles from an array.
+        """
 
         to_delete = np.isin(
             self.trinums, trinums
@@ -211,6 +224,36 @@ class SuperTriu(SuperData):
             return cleaner.cleaned()
         return cleaner.cleaned_iteraly()
 
+    def shrink(self, count):
+        """Runs strip-and-smooth actions several times.
+
+        Parameters
+        ----------
+        count : int
+            Number of strip-and-smooth actions.
+
+        Returns
+        -------
+        SuperTriu
+            Shrinked super-triangulation.
+
+        """
+
+        if self.size == 0:
+            return self
+
+        peeler = superoprs.SupPeeler.from_suptriu(self)
+
+        for _ in range(count):
+
+            peeler.strip()
+            peeler.smooth()
+
+            if peeler.size == 0:
+                break
+
+        return peeler.get_suptriu()
+
     def detach(self):
         """Removes super-triangles touching the background mesh edge.
         """
@@ -261,8 +304,10 @@ class Triangler:
 
     APEXES_OVER_EDGES = np.r_[2, 0, 1]
 
-    def __init__(self, mesh):
-        self.edges = EdgesMap.from_mesh(mesh)
+    def __init__(self, mesh, cores=None):
+        self.mesh = mesh
+        self.cores = cores
+        self.halfedges = mesh.halfedges()
 
     def getsuptriu(self):
 
@@ -281,7 +326,7 @@ class Triangler:
         ]
 
         return SuperTriu(
-            self.edges.mesh, np.vstack(data)
+            self.mesh, np.vstack(data)
         )
 
     def get_vertices(self, neighbors_data):
@@ -297,81 +342,55 @@ class Triangler:
 
     def get_neighbors(self):
 
-        hosttris2d, pairnums2d, inpairs2d = self.triconnects()
-
-        hostriang_inds = 2 * pairnums2d + (inpairs2d + 0)
-        neighbors_inds = 2 * pairnums2d + (inpairs2d + 1) % 2
-
-        neighbors_nums = self.from_trinums_table(neighbors_inds)
-        neighbors_locs = self.from_locnums_table(neighbors_inds)
-        neighbors_ords = self.from_locnums_table(hostriang_inds)
-
-        ccwsorts = tables.trisorts(neighbors_ords)
-
-        neighbors_nums = tables.table_image(neighbors_nums, ccwsorts)
-        neighbors_locs = tables.table_image(neighbors_locs, ccwsorts)
+        host_tris_nums = self.find_cores()
 
-        host_tris_nums = hosttris2d[:, 0].copy('C')
+        twins = self.halfedges.twins[
+            3 * host_tris_nums[:, None] + np.r_[0, 1, 2]
+        ]
 
         return {
             'host-tris-nums': host_tris_nums,
-            'neighbors-nums': neighbors_nums,
-            'neighbors-locs': neighbors_locs
+            'neighbors-nums': twins // 3,
+            'neighbors-locs': twins % 3
         }
 
-    def triconnects(self):
-        for data in self.secondary_edgesmap.atrank(3):
-            yield np.reshape(
-                data, (data.size // 3, 3)
-            )
-
-    def from_trinums_table(self, indexer):
-        return self.edges.trinums2d.flat[indexer]
+    def find_cores(self):
 
-    def from_locnums_table(self, indexer):
-        return self.edges.locnums2d.flat[indexer]
+        if self.cores is not None:
+            return self.find_cores_at(self.cores)
 
-    def from_mesh_triangs(self, indexer):
-        return self.edges.mesh_triangs.flat[indexer]
+        trinums, = np.where(
+            np.all(self.halfedges.neighbors() >= 0, axis=1)
+        )
 
-    @property
-    def secondary_edgesmap(self):
-        return self.edges.secondary_edgesmap()
+        return trinums
 
+    def find_cores_at(self, trinums):
 
-class EdgesMap:
-    """Temporary edges map.
-    """
+        trinums = np.unique(trinums).astype(int)
 
-    def __init__(self, mesh, trinums2d, locnums2d):
-
-        self.mesh = mesh
+        twins = self.halfedges.twins[
+            3 * trinums[:, None] + np.r_[0, 1, 2]
+        ]
 
-        self.trinums2d = trinums2d
-        self.locnums2d = locnums2d
+        return trinums[np.all(twins >= 0, axis=1)]
 
-    @classmethod
-    def from_mesh(cls, mesh):
+    def from_mesh_triangs(self, indexer):
+        return self.mesh.triangs.flat[indexer]
 
-        edges = mesh.edgesmap()
 
-        trinums2d = _packcols(edges.trinums1, edges.trinums2)
-        locnums2d = _packcols(edges.locnums1, edges.locnums2)
+def _packcols(*cols):
+    return np.vstack(cols).T.copy('C')
 
-        return cls(
-            mesh, trinums2d, locnums2d
-        )
 
-    @property
-    def mesh_triangs(self):
-        return self.mesh.triangs
+def _norminds(inds):
 
-    def secondary_edgesmap(self):
-        return tables.TableMap.from_table(self.trinums2d)
+    inds = np.asarray(inds)
 
+    if inds.dtype == bool:
+        return inds
 
-def _packcols(*cols):
-    return np.vstack(cols).T.copy('C')
+    return inds.astype(int, copy=False)
 
 
 def _is_compact_table(table):
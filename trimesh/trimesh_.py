@@ -1,10 +1,14 @@
 # -*- coding: utf-8 -*-
 """Triangle mesh object.
 """
+import os
 import numpy as np
 from triellipt.utils import pairs
 from triellipt.trimesh import (
+    meshfile,
     meshedge_,
+    halfedges_,
+    constrs_,
     edgesmap_,
     nodesmap_,
     delghosts_,
@@ -182,27 +186,95 @@ class _TriMesh(TriData):
         _ = renumer.Shuffler.from_mesh(self)
         return _.shuffled(permuter)
 
-    def save(self, file) -> None:
+    def sorted_triangles(self, curve='hilbert'):
+        """Orders the mesh triangles along a space-filling curve.
+
+        Parameters
+        ----------
+        curve : str = "hilbert"
+            Curve type, "hilbert" or "morton".
+
+        Returns
+        -------
+        TriMesh
+            New mesh with the triangles permuted (i).
+
+        Notes
+        -----
+
+        (i) Triangles are ordered by centroids, see `shuffled()`.
+
+        """
+        _ = renumer.SortTriangs.from_mesh(self)
+        return _.sorted(curve)
+
+    def sorted_points(self, curve='hilbert'):
+        """Orders the mesh points along a space-filling curve.
+
+        Parameters
+        ----------
+        curve : str = "hilbert"
+            Curve type, "hilbert" or "morton".
+
+        Returns
+        -------
+        TriMesh
+            New mesh with the nodes renumbered (i).
+
+        Notes
+        -----
+
+        (i) See `renumed()` for the nodes permutation.
+
+        """
+        _ = renumer.SortPoints.from_mesh(self)
+        return _.sorted(curve)
+
+    def save(self, file, compressed=False) -> None:
         """Saves the mesh to `.npz` file.
 
         Parameters
         ----------
         file : str or file-like
             Same as for `numpy.savez()`.
+        compressed : bool = False
+            Compresses the arrays, if True.
+
+        Notes
+        -----
+
+        The array-valued meta-data is saved with the mesh.
 
         """
-        np.savez(
-            file, points=self.points, triangs=self.triangs
-        )
+        meshfile.save_npz(self, file, compressed)
+
+    def dump(self, path) -> None:
+        """Saves the mesh to a directory of `.npy` files.
+
+        Parameters
+        ----------
+        path : str
+            Path to the output directory.
+
+        Notes
+        -----
+
+        - Arrays are written in chunks, without an extra copy.
+        - Meta-data goes to `header.json` and `meta-*.npy` files.
+
+        """
+        meshfile.save_dir(self, path)
 
     @classmethod
-    def load(cls, file):
-        """Loads the mesh from `.npz` file.
+    def load(cls, file, mmap_mode=None):
+        """Loads the mesh from `.npz` file or a dump directory.
 
         Parameters
         ----------
         file : str or file-like
-            Same as for `numpy.load()`.
+            Same as for `numpy.load()`, or a path to a dump directory.
+        mmap_mode : str = None
+            Same as for `numpy.load()`, works with directories only.
 
         Returns
         -------
@@ -211,11 +283,10 @@ class _TriMesh(TriData):
 
         """
 
-        data = np.load(file)
+        if isinstance(file, (str, os.PathLike)) and os.path.isdir(file):
+            return meshfile.load_dir(cls, file, mmap_mode)
 
-        return cls.from_data(
-            data['points'], data['triangs']
-        )
+        return meshfile.load_npz(cls, file)
 
 
 class TriMesh(_TriMesh):
@@ -272,6 +343,27 @@ class TriMesh(_TriMesh):
         TriMesh
             New mesh object.
 
+        Notes
+        -----
+
+        Varargs version of `submesh_at()`.
+
+        """
+        return self.submesh_at(trinums)
+
+    def submesh_at(self, trinums):
+        """Extracts a submesh.
+
+        Parameters
+        ----------
+        trinums : flat-int-array | flat-bool-array
+            Numbers or mask of triangles to include.
+
+        Returns
+        -------
+        TriMesh
+            New mesh object.
+
         """
 
         inds = _norminds(
@@ -294,20 +386,41 @@ class TriMesh(_TriMesh):
         TriMesh
             New mesh object.
 
+        Notes
+        -----
+
+        Varargs version of `deltriangs_at()`.
+
+        """
+        return self.deltriangs_at(trinums)
+
+    def deltriangs_at(self, trinums):
+        """Removes triangles from the mesh.
+
+        Parameters
+        ----------
+        trinums : flat-int-array | flat-bool-array
+            Numbers or mask of triangles to delete.
+
+        Returns
+        -------
+        TriMesh
+            New mesh object.
+
         """
 
-        if len(trinums) == 0:
+        if np.size(trinums) == 0:
             return self
 
-        inds = _norminds(
-            trinums, self.ntriangs
-        )
+        tokeep = np.ones(self.ntriangs, dtype=bool)
 
-        new_triangs = np.delete(
-            self.triangs, inds, axis=0
-        )
+        tokeep[
+            _norminds(trinums, self.ntriangs)
+        ] = False
 
-        return self.update_triangs(new_triangs)
+        return self.update_triangs(
+            self.triangs[tokeep, :]
+        )
 
     def delghosts(self):
         """Removes ghost points from the mesh.
@@ -350,8 +463,27 @@ class TriMesh(_TriMesh):
     def hasvoids(self):
         return self.getvoids().size != 0
 
+    def constraints(self):
+        """Creates the constraints on the hanging nodes.
+
+        Returns
+        -------
+        MeshConstrs
+            Callable operator that constrains data (i).
+
+        Notes
+        -----
+
+        (i) Built once and kept in the mesh meta-data.
+
+        """
+
+        if 'constraints' not in self.meta:
+            self.meta['constraints'] = constrs_.MeshConstrs.from_mesh(self)
+        return self.meta['constraints']
+
     def delvoids(self):
-        return self.deltriangs(*self.getvoids())
+        return self.deltriangs_at(self.getvoids())
 
     def alignnodes(self, *anchors):
         """Performs the edge-core ordering of the mesh nodes.
@@ -413,6 +545,25 @@ class TriMesh(_TriMesh):
         """
         return edgesmap_.EdgesMap.from_mesh(self)
 
+    def halfedges(self):
+        """Creates the half-edge structure.
+
+        Returns
+        -------
+        HalfEdges
+            Half-edges of the mesh (i).
+
+        Notes
+        -----
+
+        (i) Built once and kept in the mesh meta-data.
+
+        """
+
+        if 'half-edges' not in self.meta:
+            self.meta['half-edges'] = halfedges_.HalfEdges.from_mesh(self)
+        return self.meta['half-edges']
+
     def nodesmap(self):
         """Maps nodes to hosting triangles.
 
@@ -424,16 +575,21 @@ class TriMesh(_TriMesh):
         """
         return nodesmap_.NodesMap.from_mesh(self)
 
-    def supertriu(self):
+    def supertriu(self, cores=None):
         """Creates a super triangulation.
 
+        Parameters
+        ----------
+        cores : flat-int-array = None
+            Candidate core triangles, if None takes all triangles.
+
         Returns
         -------
         SuperTriu
             Super triangulation object.
 
         """
-        return supertriu_.SuperTriu.from_mesh(self)
+        return supertriu_.SuperTriu.from_mesh(self, cores)
 
     def reduced(self, shrink=None, detach=False, seed=None):
         """Tries to compress the mesh.
@@ -491,11 +647,27 @@ class TriMesh(_TriMesh):
         Returns
         -------
         list
-            List of homogeneous submeshes.
+            List of homogeneous submeshes (i).
+
+        Notes
+        -----
+
+        (i) Ordered by the first triangle, voids are removed.
 
         """
         return trisplit.TriSplit(self).split()
 
+    def itersplit(self):
+        """Yields homogeneous parts of the mesh one by one.
+
+        Returns
+        -------
+        generator
+            Generator of homogeneous submeshes, see `split()`.
+
+        """
+        return trisplit.TriSplit(self).genparts()
+
 
 def _table_to_complex(table):
     return table[:, 0] + 1j * table[:, 1]
@@ -509,7 +681,13 @@ def _complex_to_rows(data):
 
 def _norminds(inds, size):
 
-    inds = np.array(inds)
+    inds = np.asarray(inds)
+
+    if inds.dtype == bool:
+        return np.flatnonzero(inds)
+
+    if inds.size == 0:
+        return np.array([], dtype=int)
 
     mask = np.logical_and(
         inds >= 0, inds < size
@@ -89,8 +89,7 @@ class MeshReduce(MeshAgent):
         if suptriu is None:
             return None
 
-        for _ in range(niters):
-            suptriu = suptriu.strip().smooth()
+        suptriu = suptriu.shrink(niters)
 
         if self.is_empty_suptriu(suptriu):
             return None
@@ -110,7 +109,7 @@ class MeshReduce(MeshAgent):
     def gen_mesh_duet(self, suptriu):
 
         inner_mesh = suptriu.supmesh
-        outer_mesh = suptriu.mesh.deltriangs(*suptriu.supbodies)
+        outer_mesh = suptriu.mesh.deltriangs_at(suptriu.supbodies)
 
         yield inner_mesh
         yield outer_mesh
@@ -29,7 +29,7 @@ class MeshAgent:
         vals = np.full(
             edges.size, 1
         )
-        
+
         shape = (
             self.mesh.size, self.mesh.size
         )
@@ -37,7 +37,7 @@ class MeshAgent:
         graph = sp.coo_array(
             (vals, (posi, posj)), shape=shape
         )
-        
+
         graph = graph.tocsr()
         return graph
 
@@ -48,7 +48,7 @@ class TriSplit(MeshAgent):
 
     def split(self) -> list:
         return list(
-            self.genparts(self.mesh.size)
+            self.genparts()
         )
 
     def delvoids(self):
@@ -58,34 +58,48 @@ class TriSplit(MeshAgent):
         if voidsnums.size == 0:
             return
 
-        self.mesh = self.mesh.deltriangs(*voidsnums)
+        self.mesh = self.mesh.deltriangs_at(voidsnums)
 
-    def genparts(self, maxitr):
+    def genparts(self):
 
         self.delvoids()
 
-        for _ in range(maxitr):
+        if self.mesh.size == 0:
+            return
+
+        for trinums in self.split_trinums():
+            yield self.mesh.update_triangs(
+                self.mesh.triangs[trinums, :]
+            )
 
-            imesh, omesh = self.run_mesh_bisect()
-            yield imesh
+    def split_trinums(self):
 
-            if omesh.size == 0:
-                return
+        labels = self.make_labels()
 
-            self.mesh = omesh
+        sorter = np.argsort(labels, kind='stable')
+        counts = np.bincount(labels)
 
-    def run_mesh_bisect(self):
+        return np.split(
+            sorter, np.cumsum(counts)[:-1]
+        )
+
+    def make_labels(self):
+        """Labels connected parts in the order of their first triangles.
+        """
 
-        graph = self.edges_graph()
+        _, labels = sp.csgraph.connected_components(
+            self.edges_graph(), directed=False
+        )
 
-        trinums = sp.csgraph.breadth_first_order(
-            graph, 0, directed=False, return_predecessors=False
+        firsts = np.full(
+            np.amax(labels) + 1, self.mesh.size
         )
 
-        imesh = self.mesh.submesh(*trinums)
-        omesh = self.mesh.deltriangs(*trinums)
+        np.minimum.at(
+            firsts, labels, np.arange(self.mesh.size)
+        )
 
-        return imesh, omesh
+        return np.argsort(np.argsort(firsts))[labels]
 
 
 class GetVoids(MeshAgent):
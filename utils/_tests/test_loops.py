@@ -3,9 +3,39 @@
 """
 import unittest
 import numpy as np
+from triellipt import mesher
 from triellipt.utils import loops
 
 
+def walk_loops(edges2d):
+    """Walks loops edge by edge from the lowest unvisited edge.
+    """
+
+    nodes1, nodes2 = edges2d.tolist()
+
+    edges_at_nodes1 = dict(
+        zip(nodes1, range(len(nodes1)))
+    )
+
+    visited = set()
+    walked = []
+
+    for start in range(len(nodes1)):
+
+        if start in visited:
+            continue
+
+        loop = [start]
+
+        while nodes2[loop[-1]] != nodes1[start]:
+            loop.append(edges_at_nodes1[nodes2[loop[-1]]])
+
+        visited.update(loop)
+        walked.append(loop)
+
+    return walked
+
+
 class TestNodesMap(unittest.TestCase):
 
     @classmethod
@@ -89,5 +119,79 @@ class TestLoopsAsEdges(TestLoops):
         assert self.LOOPS.getloops()[1][1, :].tolist() == [4, 5, 3]
 
 
+class TestLoopsWalk(unittest.TestCase):
+    """Matches the edge-by-edge walk on meshes with holes.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        mesh = mesher.trigrid(11, 11, 'west-slope').deltriangs_at(
+            [46, 112, 128, 170]
+        )
+
+        edges2d = mesh.meshedge().edges2d
+        perm = np.random.default_rng(7).permutation(edges2d.shape[1])
+
+        cls.EDGES2D = np.copy(edges2d[:, perm], order='C')
+
+    def test_walk(self):
+
+        found = loops.LoopsAsInds(self.EDGES2D).getloops()
+
+        assert found == walk_loops(self.EDGES2D)
+        assert sorted(map(len, found)) == [3, 3, 3, 3, 40]
+
+    def test_many_loops(self):
+
+        edges2d = np.hstack([
+            [[4 * i, 4 * i + 1, 4 * i + 2, 4 * i + 3],
+             [4 * i + 1, 4 * i + 2, 4 * i + 3, 4 * i]] for i in range(50)
+        ])
+
+        perm = np.random.default_rng(3).permutation(edges2d.shape[1])
+        edges2d = np.copy(edges2d[:, perm], order='C')
+
+        found = loops.LoopsAsInds(edges2d).getloops()
+
+        assert len(found) == 50
+        assert found == walk_loops(edges2d)
+
+
+class TestLoopsPinch(unittest.TestCase):
+    """Splits loops sharing a node.
+    """
+
+    EDGES2D = np.array([
+        [0, 1, 2, 0, 3, 4],
+        [1, 2, 0, 3, 4, 0]
+    ])
+
+    def test_pinch(self):
+        assert loops.LoopsAsInds(self.EDGES2D).getloops() == [
+            [0, 1, 2], [3, 4, 5]
+        ]
+
+    def test_pinch_shuffled(self):
+
+        for seed in range(10):
+
+            perm = np.random.default_rng(seed).permutation(6)
+            edges2d = np.copy(self.EDGES2D[:, perm], order='C')
+
+            found = loops.LoopsAsInds(edges2d).getloops()
+
+            assert sorted(sum(found, [])) == list(range(6))
+
+            for loop in found:
+                assert np.array_equal(
+                    edges2d[1, loop], np.roll(edges2d[0, loop], -1)
+                )
+
+    def test_open_path(self):
+        with self.assertRaises(loops.LoopsError):
+            loops.LoopsAsInds(np.array([[0, 1], [1, 2]])).getloops()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""Tests space-filling curves.
+"""
+import unittest
+import numpy as np
+from triellipt.utils import sfcurves
+
+
+class TestCurves(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        xpos, ypos = np.meshgrid(
+            np.arange(4.), np.arange(4.)
+        )
+
+        cls.XPOS = xpos.flatten()
+        cls.YPOS = ypos.flatten()
+
+    def test_hilbert(self):
+        assert self.hilbert_keys.tolist() == [
+            [0, 1, 14, 15],
+            [3, 2, 13, 12],
+            [4, 7, 8, 11],
+            [5, 6, 9, 10]
+        ]
+
+    def test_morton(self):
+        assert self.morton_keys.tolist() == [
+            [0, 1, 4, 5],
+            [2, 3, 6, 7],
+            [8, 9, 12, 13],
+            [10, 11, 14, 15]
+        ]
+
+    @property
+    def hilbert_keys(self):
+        return sfcurves.hilbert_keys(
+            self.XPOS, self.YPOS, order=2
+        ).reshape(4, 4)
+
+    @property
+    def morton_keys(self):
+        return sfcurves.morton_keys(
+            self.XPOS, self.YPOS, order=2
+        ).reshape(4, 4)
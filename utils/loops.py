@@ -2,7 +2,11 @@
 """Loops fetcher.
 """
 import numpy as np
-from triellipt.utils import tables
+from scipy import sparse as sp
+
+LoopsError = type(
+    'LoopsError', (Exception,), {}
+)
 
 
 class LoopsAsInds:
@@ -18,7 +22,6 @@ class LoopsAsInds:
     def __init__(self, edges2d=None):
         self.edges2d = edges2d
         self.nodesmap21 = None
-        self.nodes_mask = None
 
     @classmethod
     def from_edges(cls, edges2d):
@@ -37,13 +40,15 @@ class LoopsAsInds:
         return self.edges2d[1, :]
 
     def setup(self):
-        self.nodes_mask = self.get_nodes_mask()
         self.nodesmap21 = self.get_nodesmap21()
 
     def getloops(self):
         """Fetches loops as indices of edges.
         """
 
+        if self.size == 0:
+            return []
+
         self.setup()
 
         return list(
@@ -52,60 +57,78 @@ class LoopsAsInds:
 
     def genloops(self):
 
-        for _ in range(self.size):
-
-            inds = self.getloop()
+        labels = self.make_labels()
+        starts = self.make_starts(labels)
+        orders = self.make_orders(starts[labels])
 
-            if not inds:
-                return
+        sorter = np.lexsort(
+            (orders, starts[labels])
+        )
 
-            yield inds
+        bins = np.cumsum(
+            np.bincount(labels)[np.argsort(starts)]
+        )
 
-            self.nodes_mask[inds] = 0
+        for inds in np.split(sorter, bins[:-1]):
+            yield inds.tolist()
 
-    def getloop(self):
-        """Finds a subloop as indices of edges.
+    def make_labels(self):
+        """Splits edges into loops.
         """
-        return list(
-            self.genloop()
+
+        graph = sp.csr_array(
+            (np.ones(self.size), (self.edges_range, self.nodesmap21)),
+            shape=(self.size, self.size)
+        )
+
+        _, labels = sp.csgraph.connected_components(
+            graph, directed=True, connection='weak'
         )
 
-    def genloop(self):
+        return labels
 
-        prev = self.findstart()
+    def make_starts(self, labels):
+        """Finds the first edge of each loop.
+        """
 
-        if prev is None:
-            return
+        starts = np.full(
+            np.amax(labels) + 1, self.size
+        )
 
-        yield prev
+        np.minimum.at(starts, labels, self.edges_range)
+        return starts
 
-        map21 = self.nodesmap21
-        start = self.nodes1[prev]
+    def make_orders(self, starts):
+        """Ranks edges along loops by pointer jumping.
+        """
 
-        for _ in range(self.size):
+        succ = np.where(
+            self.nodesmap21 == starts, self.edges_range, self.nodesmap21
+        )
 
-            curr = map21[prev]
-            yield curr
+        dist = (succ != self.edges_range).astype(int)
 
-            if self.nodes2[curr] == start:
-                return
+        while True:
 
-            prev = curr
+            next_succ = succ[succ]
 
-    def findstart(self):
+            if np.array_equal(next_succ, succ):
+                break
 
-        where, = np.where(self.nodes_mask)
+            dist = dist + dist[succ]
+            succ = next_succ
 
-        if where.size == 0:
-            return None
-        return where[0]
+        lens = np.bincount(starts, minlength=self.size)
 
-    def get_nodes_mask(self):
-        return np.full(self.size, 1)
+        return lens[starts] - 1 - dist
 
     def get_nodesmap21(self):
         return MapNodes(self.nodes1, self.nodes2).getmap21()
 
+    @property
+    def edges_range(self):
+        return np.arange(self.size)
+
 
 class LoopsAsEdges:
     """Fetches loops as tables of edges.
@@ -140,45 +163,29 @@ class MapNodes:
     """
 
     def __init__(self, nodes1, nodes2):
-        self.edges = self.edges_table(nodes1, nodes2)
-
-    @classmethod
-    def edges_table(cls, nodes1, nodes2):
-        return np.copy(
-            np.vstack([nodes1, nodes2]).T, order='C'
-        )
+        self.nodes1 = np.asarray(nodes1)
+        self.nodes2 = np.asarray(nodes2)
 
     def getmap21(self):
-        inds1, inds2 = self.make_intersect()
-        return self.from_intersect(inds1, inds2)
+        """Maps each edge to the edge starting at its end node.
 
-    def make_intersect(self):
+        Notes
+        -----
 
-        _, rows, cols = self.edgesmap()
+        At a node shared by several loops, incoming and outgoing edges are
+        paired in the order of their indices.
 
-        rows = rows.reshape(rows.size // 2, 2)
-        cols = cols.reshape(cols.size // 2, 2)
-
-        inds = tables.table_image(
-            rows, np.argsort(cols, axis=1)
-        )
-
-        yield inds[:, 0]
-        yield inds[:, 1]
-
-    def from_intersect(self, inds1, inds2):
-        return inds1[
-            self.invperm(inds2)
-        ]
+        """
 
-    def invperm(self, perm):
-        return _invperm(perm)
+        order1 = np.argsort(self.nodes1, kind='stable')
+        order2 = np.argsort(self.nodes2, kind='stable')
 
-    def edgesmap(self):
-        return tables.TableMap.from_table(self.edges).atrank(2)
+        if not np.array_equal(self.nodes1[order1], self.nodes2[order2]):
+            raise LoopsError(
+                "cannot map nodes, edges do not make closed loops"
+            )
 
+        map21 = np.empty_like(order1)
+        map21[order2] = order1
 
-def _invperm(perm):
-    iperm = np.zeros_like(perm)
-    iperm[perm] = np.arange(perm.size)
-    return iperm
+        return map21
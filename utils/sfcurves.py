@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""Space-filling curves.
+"""
+import numpy as np
+
+ORDER = 16
+
+
+def hilbert_keys(xpos, ypos, order=ORDER):
+    """Hilbert keys of points in a plane.
+
+    Parameters
+    ----------
+    xpos : flat-float-array
+        x-coordinates of points.
+    ypos : flat-float-array
+        y-coordinates of points.
+    order : int = 16
+        Number of bits per coordinate.
+
+    Returns
+    -------
+    flat-int64-array
+        Positions of points along the Hilbert curve.
+
+    """
+
+    icol, jcol = quantized(xpos, ypos, order)
+
+    keys = np.zeros(
+        icol.size, dtype=np.int64
+    )
+
+    side = np.int64(1) << order
+    step = side >> 1
+
+    while step > 0:
+
+        irot = (icol & step) > 0
+        jrot = (jcol & step) > 0
+
+        keys += step * step * ((3 * irot) ^ jrot)
+
+        icol, jcol = _hilbert_rotated(
+            side, icol, jcol, irot, jrot
+        )
+
+        step >>= 1
+
+    return keys
+
+
+def morton_keys(xpos, ypos, order=ORDER):
+    """Morton (Z-order) keys of points in a plane.
+
+    Parameters
+    ----------
+    xpos : flat-float-array
+        x-coordinates of points.
+    ypos : flat-float-array
+        y-coordinates of points.
+    order : int = 16
+        Number of bits per coordinate.
+
+    Returns
+    -------
+    flat-int64-array
+        Positions of points along the Morton curve.
+
+    """
+
+    icol, jcol = quantized(xpos, ypos, order)
+
+    return np.bitwise_or(
+        _spread_bits(icol), _spread_bits(jcol) << 1
+    )
+
+
+def quantized(xpos, ypos, order=ORDER):
+    """Maps points to a square integer grid.
+
+    Parameters
+    ----------
+    xpos : flat-float-array
+        x-coordinates of points.
+    ypos : flat-float-array
+        y-coordinates of points.
+    order : int = 16
+        Grid has `2**order` cells per side.
+
+    Returns
+    -------
+    tuple
+        Pair of flat-int64-arrays with grid indices.
+
+    """
+
+    xpos = np.asarray(xpos, dtype=float)
+    ypos = np.asarray(ypos, dtype=float)
+
+    if xpos.size == 0:
+        return _empty_ints(), _empty_ints()
+
+    xmin, ymin = np.amin(xpos), np.amin(ypos)
+
+    span = max(
+        np.amax(xpos) - xmin, np.amax(ypos) - ymin
+    )
+
+    scale = ((1 << order) - 1) / (span or 1.)
+
+    icol = np.floor((xpos - xmin) * scale).astype(np.int64)
+    jcol = np.floor((ypos - ymin) * scale).astype(np.int64)
+
+    return icol, jcol
+
+
+def _hilbert_rotated(side, icol, jcol, irot, jrot):
+
+    flip = np.logical_and(~jrot, irot)
+
+    icol = np.where(flip, side - 1 - icol, icol)
+    jcol = np.where(flip, side - 1 - jcol, jcol)
+
+    swap = ~jrot
+
+    return (
+        np.where(swap, jcol, icol), np.where(swap, icol, jcol)
+    )
+
+
+def _spread_bits(data):
+
+    data = data & 0x00000000FFFFFFFF
+
+    data = (data | (data << 16)) & 0x0000FFFF0000FFFF
+    data = (data | (data << 8)) & 0x00FF00FF00FF00FF
+    data = (data | (data << 4)) & 0x0F0F0F0F0F0F0F0F
+    data = (data | (data << 2)) & 0x3333333333333333
+    data = (data | (data << 1)) & 0x5555555555555555
+
+    return data
+
+
+def _empty_ints():
+    return np.array([], dtype=np.int64)
+
+
+SFCURVES = {
+    'hilbert': hilbert_keys,
+    'morton': morton_keys
+}